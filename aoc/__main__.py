@@ -0,0 +1,193 @@
+"""
+Command line entry point for the shared puzzle tooling.
+
+    python -m aoc run [year] [day] [part] [--input FILE] [--jobs N] [--verbose] [--no-cache]
+                      [--profile] [--profile-top N] [--metrics FILE]
+    python -m aoc bench [year] [day] [part] [--baseline FILE] [--threshold PCT] [--update] [--sizes N ...]
+    python -m aoc generate year day size [--seed N] [-o FILE]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from aoc import benchmark, generators, log, metrics, profiling, runner
+from aoc.cache import DEFAULT_MAX_BYTES, ResultCache
+
+
+def run_command(args: argparse.Namespace) -> int:
+    solutions = runner.discover(args.year, args.day, args.part)
+    if not solutions:
+        print("No matching solutions found", file=sys.stderr)
+        return 1
+
+    log.verbose = args.verbose
+    # Counting search work slows the searches down, so only do it when the counters are wanted
+    metrics.enabled = args.metrics is not None
+    # Cached answers come without counters
+    cache = None if args.no_cache or args.metrics else ResultCache(runner.DEFAULT_CACHE, args.cache_size * 1024)
+    start = time.perf_counter()
+    profile_dir = args.profile_dir if args.profile or args.profile_top else None
+    if args.jobs == 1:
+        results = (result for day in runner.group_by_day(solutions)
+                   for result in runner.run_day(day, args.input, cache, profile_dir))
+    else:
+        results = runner.run_parallel(solutions, args.input, args.jobs or None, runner.load_timings(), cache,
+                                      profile_dir)
+
+    finished = []
+    for result in results:
+        print(runner.format_result(result), flush=True)
+        if result.profile:
+            written = [path for path in (result.profile, result.profile.with_suffix(".collapsed")) if path.exists()]
+            print("Profile written to " + ", ".join(str(path) for path in written))
+            if args.profile_top:
+                print(profiling.summary(result.profile, args.profile_top), flush=True)
+        finished.append(result)
+    runner.save_timings(finished, args.input)
+    if args.metrics:
+        metrics.save(args.metrics, ((result.solution.key, result.metrics) for result in finished if result.metrics))
+        print(f"Search counters written to {args.metrics}")
+
+    failures = sum(1 for result in finished if result.error)
+    total_seconds = sum(result.total_seconds for result in finished)
+    print(f"Ran {len(finished)} solutions in {runner.format_seconds(total_seconds)} "
+          f"({runner.format_seconds(time.perf_counter() - start)} wall clock), {failures} failed")
+    return 1 if failures else 0
+
+
+def bench_command(args: argparse.Namespace) -> int:
+    solutions = runner.discover(args.year, args.day, args.part)
+    if not solutions:
+        print("No matching solutions found", file=sys.stderr)
+        return 1
+
+    log.verbose = False
+    metrics.enabled = False
+    has_baseline = args.baseline.is_file()
+    if not has_baseline and not args.update:
+        print(f"No baseline at {args.baseline}, so timings aren't compared.  Record one with --update.",
+              file=sys.stderr)
+    baseline = benchmark.load_baseline(args.baseline)
+    benchmarks = []
+    regressions = []
+    for solution in solutions:
+        runs = [(input_name, None) for input_name in benchmark.inputs_for(solution, args.inputs)]
+        if (solution.year, solution.day) in generators.GENERATORS:
+            runs += [(benchmark.generated_name(size, args.seed),
+                      generators.generate(solution.year, solution.day, size, args.seed))
+                     for size in args.sizes]
+        for input_name, data in runs:
+            result = benchmark.measure(solution, input_name, args.warmup, args.repeat, args.budget, data)
+            benchmarks.append(result)
+            comparison = benchmark.compare(result, baseline, args.threshold)
+            print(f"{benchmark.format_benchmark(result)} ({comparison.message})", flush=True)
+            if comparison.regressed:
+                regressions.append(comparison)
+
+    if args.update:
+        benchmark.save_baseline(args.baseline, benchmarks, baseline)
+        print(f"Updated {args.baseline}")
+
+    for comparison in regressions:
+        print(f"REGRESSION {comparison.key}: {comparison.message}")
+    if has_baseline:
+        print(f"Benchmarked {len(benchmarks)} solution/input pairs, {len(regressions)} regressed "
+              f"by more than {args.threshold:g}%")
+    else:
+        print(f"Benchmarked {len(benchmarks)} solution/input pairs, no baseline to compare with")
+    return 1 if regressions and not args.update else 0
+
+
+def generate_command(args: argparse.Namespace) -> int:
+    try:
+        data = generators.generate(args.year, args.day, args.size, args.seed)
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        print("Generators exist for: " + ", ".join(f"{year} day {day}" for year, day in generators.available()),
+              file=sys.stderr)
+        return 1
+    if args.output:
+        args.output.write_bytes(data)
+    else:
+        sys.stdout.buffer.write(data)
+    return 0
+
+
+def add_selection_arguments(parser: argparse.ArgumentParser, verb: str) -> None:
+    parser.add_argument("year", type=int, nargs="?", help=f"Only {verb} this year")
+    parser.add_argument("day", type=int, nargs="?", help=f"Only {verb} this day")
+    parser.add_argument("part", type=int, nargs="?", help=f"Only {verb} this part")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc", description="Advent of Code puzzle tooling")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run solutions in-process and time each part")
+    add_selection_arguments(run_parser, "run")
+    run_parser.add_argument("--input", default=runner.DEFAULT_INPUT,
+                            help="Input file name inside each puzzle directory (default: %(default)s)")
+    run_parser.add_argument("-j", "--jobs", type=int, default=1,
+                            help="Run solutions in this many worker processes, slowest first; "
+                                 "0 uses one per CPU (default: %(default)s)")
+    run_parser.add_argument("-v", "--verbose", action="store_true",
+                            help="Show the solutions' progress output, which is hidden by default")
+    run_parser.add_argument("--no-cache", action="store_true",
+                            help="Always run the solutions instead of reusing cached answers")
+    run_parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_BYTES // 1024,
+                            help="Evict the least recently used answers above this many KiB (default: %(default)s)")
+    run_parser.add_argument("--profile", action="store_true",
+                            help="Profile each part with cProfile and a stack sampler, writing .pstats and "
+                                 "collapsed-stack (flame graph) files")
+    run_parser.add_argument("--profile-top", type=int, metavar="N",
+                            help="Profile each part and print its N most expensive functions")
+    run_parser.add_argument("--profile-dir", type=Path, default=runner.DEFAULT_PROFILES,
+                            help="Where to write profiles (default: .aoc/profiles)")
+    run_parser.add_argument("--metrics", type=Path, metavar="FILE",
+                            help="Write the search counters (states expanded, pushed, dedup hits, peak "
+                                 "frontier and branches pruned) of each part to this JSON file.  "
+                                 "Implies --no-cache")
+    run_parser.set_defaults(func=run_command)
+
+    bench_parser = subparsers.add_parser("bench", help="Time solutions repeatedly and compare with a baseline")
+    add_selection_arguments(bench_parser, "benchmark")
+    bench_parser.add_argument("--inputs", nargs="*", default=benchmark.DEFAULT_INPUTS,
+                              help="Input files to benchmark each solution on, when they exist "
+                                   "(default: %(default)s)")
+    bench_parser.add_argument("--warmup", type=int, default=1, help="Untimed runs first (default: %(default)s)")
+    bench_parser.add_argument("--repeat", type=int, default=5, help="Timed runs (default: %(default)s)")
+    bench_parser.add_argument("--budget", type=float, default=10.0,
+                              help="Stop repeating a benchmark after this many seconds (default: %(default)s)")
+    bench_parser.add_argument("--baseline", type=Path, default=benchmark.DEFAULT_BASELINE,
+                              help="Baseline JSON file (default: benchmarks/baseline.json)")
+    bench_parser.add_argument("--threshold", type=float, default=benchmark.DEFAULT_THRESHOLD,
+                              help="Fail when a median is more than this many percent slower than the "
+                                   "baseline (default: %(default)s)")
+    bench_parser.add_argument("--update", action="store_true",
+                              help="Write the new timings to the baseline instead of failing on regressions")
+    bench_parser.add_argument("--sizes", type=int, nargs="+", default=[],
+                              help="Also time each part on generated inputs of these sizes, for puzzles "
+                                   "that have a generator")
+    bench_parser.add_argument("--seed", type=int, default=0, help="Seed for generated inputs (default: %(default)s)")
+    bench_parser.set_defaults(func=bench_command)
+
+    generate_parser = subparsers.add_parser("generate", help="Write a synthetic input of a given size")
+    generate_parser.add_argument("year", type=int)
+    generate_parser.add_argument("day", type=int)
+    generate_parser.add_argument("size", type=int, help="Input size, in units that depend on the puzzle")
+    generate_parser.add_argument("--seed", type=int, default=0, help="Random seed (default: %(default)s)")
+    generate_parser.add_argument("-o", "--output", type=Path, help="Write to this file instead of stdout")
+    generate_parser.set_defaults(func=generate_command)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Benchmark solutions against their sample and real inputs and compare the timings with a saved baseline.
+
+Each solution/input pair is run a few times to warm up, then timed repeatedly.  Every timed run parses
+the input again, because `solve` is allowed to consume the model it is given.  The min, median and 95th
+percentile of parse + solve time are recorded.
+
+Baselines are JSON files:
+
+    {
+        "version": 1,
+        "python": "3.11.4",
+        "results": {
+            "2023/17/part1/input.txt": {"answer": "843", "runs": 5, "min": 0.41, "median": 0.42, "p95": 0.44},
+            ...
+        }
+    }
+
+A benchmark has regressed when its median is more than the threshold percentage slower than the
+baseline median, or when it now fails after succeeding in the baseline.
+
+Solutions can also be timed on inputs from `aoc.generators` at a range of sizes.  Their keys end in
+`generated-<size>-seed<seed>` instead of a file name, so the baseline doubles as a record of how each
+solution's time grows with its input.
+"""
+import contextlib
+import dataclasses
+import json
+import math
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from aoc import inputs, paths, runner
+
+BASELINE_VERSION = 1
+DEFAULT_BASELINE = paths.REPO_ROOT / "benchmarks" / "baseline.json"
+DEFAULT_INPUTS = ["sample_input.txt", "input.txt"]
+DEFAULT_THRESHOLD = 10.0
+
+
+@dataclasses.dataclass
+class Benchmark:
+    solution: runner.Solution
+    input_name: str
+    answer: Optional[str] = None
+    error: Optional[str] = None
+    timings: List[float] = dataclasses.field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f"{self.solution.key}/{self.input_name}"
+
+    @property
+    def min(self) -> float:
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    @property
+    def p95(self) -> float:
+        # Nearest-rank percentile, so it is always one of the measured timings
+        ordered = sorted(self.timings)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def to_json(self) -> Dict:
+        if self.error:
+            return {"error": self.error}
+        return {"answer": self.answer, "runs": len(self.timings),
+                "min": self.min, "median": self.median, "p95": self.p95}
+
+
+@dataclasses.dataclass
+class Comparison:
+    key: str
+    message: str
+    regressed: bool = False
+
+
+def measure(solution: runner.Solution, input_name: str, warmup: int = 1, repeat: int = 5,
+            budget: float = 10.0, data: Optional[bytes] = None) -> Benchmark:
+    """
+    Time one solution on one input.
+
+    :param solution: The solution to time.
+    :param input_name: Name of the input file in the puzzle directory.
+    :param warmup: Untimed runs before measuring.
+    :param repeat: Most timed runs to take.
+    :param budget: Stop repeating once the timed runs have taken this many seconds.  At least one run is
+                   always timed, so slow puzzles still get a (less precise) number.
+    :param data: Use this input (e.g. a generated one) instead of reading a file.  `input_name` is then
+                 only a label for it.
+    :return: The answer and the timing of each measured run.
+    """
+    benchmark = Benchmark(solution, input_name)
+    try:
+        module = runner.load_module(solution)
+        if not hasattr(module, "solve"):
+            raise AttributeError(f"{solution.path.name} has no solve() entry point")
+        # Files are mapped, the same as in a normal run
+        source = inputs.mapped(solution.directory / input_name) if data is None else contextlib.nullcontext(data)
+        with source as data:
+            for _ in range(warmup):
+                runner.execute(module, data)
+
+            spent = 0.0
+            while len(benchmark.timings) < max(repeat, 1) and (not benchmark.timings or spent < budget):
+                start = time.perf_counter()
+                answer, _, _ = runner.execute(module, data)
+                elapsed = time.perf_counter() - start
+                benchmark.timings.append(elapsed)
+                spent += elapsed
+        benchmark.answer = str(answer)
+    except Exception as e:
+        benchmark.error = f"{type(e).__name__}: {e}"
+        benchmark.timings = []
+    return benchmark
+
+
+def inputs_for(solution: runner.Solution, input_names: Iterable[str]) -> List[str]:
+    return [name for name in input_names if (solution.directory / name).is_file()]
+
+
+def generated_name(size: int, seed: int) -> str:
+    """
+    Label for a generated input in benchmark keys, e.g. "generated-1000-seed0".
+    """
+    return f"generated-{size}-seed{seed}"
+
+
+def load_baseline(path: Path) -> Dict[str, Dict]:
+    """
+    Read the results from a baseline file, or nothing if there isn't one yet.
+    """
+    if not path.is_file():
+        return {}
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"{path} is baseline version {baseline.get('version')}, expected {BASELINE_VERSION}")
+    return baseline["results"]
+
+
+def save_baseline(path: Path, benchmarks: List[Benchmark], previous: Optional[Dict[str, Dict]] = None) -> None:
+    """
+    Write a baseline file.  Entries in `previous` that weren't benchmarked this time are kept, so
+    updating the baseline for one day doesn't drop the rest of the corpus.
+    """
+    results = dict(previous or {})
+    for benchmark in benchmarks:
+        results[benchmark.key] = benchmark.to_json()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"version": BASELINE_VERSION, "python": platform.python_version(),
+                   "results": dict(sorted(results.items()))}, f, indent=2)
+        f.write("\n")
+
+
+def compare(benchmark: Benchmark, baseline: Dict[str, Dict], threshold: float) -> Comparison:
+    """
+    Compare a benchmark against its baseline entry.
+
+    :param benchmark: The new measurement.
+    :param baseline: Baseline results, keyed like `Benchmark.key`.
+    :param threshold: How many percent slower the median can get before it counts as a regression.
+    """
+    previous = baseline.get(benchmark.key)
+    if benchmark.error:
+        if previous is not None and "error" not in previous:
+            return Comparison(benchmark.key, "failed, baseline passed", True)
+        return Comparison(benchmark.key, "failed")
+    if previous is None or "error" in previous:
+        return Comparison(benchmark.key, "new")
+
+    change = (benchmark.median - previous["median"]) / previous["median"] * 100
+    message = f"{change:+.1f}% vs baseline median {runner.format_seconds(previous['median'])}"
+    if previous.get("answer") is not None and previous["answer"] != benchmark.answer:
+        message += f", answer changed from {previous['answer']}"
+    return Comparison(benchmark.key, message, change > threshold)
+
+
+def format_benchmark(benchmark: Benchmark) -> str:
+    if benchmark.error:
+        return f"{benchmark.key}: {benchmark.error}"
+    return f"{benchmark.key}: " \
+           f"min {runner.format_seconds(benchmark.min)}, " \
+           f"median {runner.format_seconds(benchmark.median)}, " \
+           f"p95 {runner.format_seconds(benchmark.p95)} " \
+           f"over {len(benchmark.timings)} runs"
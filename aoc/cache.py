@@ -0,0 +1,119 @@
+"""
+On-disk cache of solution answers, so re-running an unchanged solution on an unchanged input is instant.
+
+Entries are content-addressed: the key is a hash of the input bytes, the source of every Python file in
+the puzzle directory (the solution and any helper modules it imports), the source of the shared `aoc`
+modules the solutions import (`aoc.grid`, `aoc.search`, ...) and which part/variant it is.  Editing the
+solution, the shared code or the input therefore changes the key, and stale entries are never returned,
+just left to be evicted.
+
+Each entry is a small JSON file named after its key, holding the answer as a JSON value so that it comes
+back with the type it was stored with.  Reading an entry touches its modification time,
+and when the cache grows past its size cap the least recently used entries are removed first.
+"""
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+class ResultCache:
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(name: str, source_dir: Path, data: bytes) -> str:
+        """
+        Hash of everything that can change an answer.
+
+        :param name: Which part (and variant) of the puzzle is being solved.
+        :param source_dir: The puzzle directory.  Every Python file in it is hashed, along with the
+                           modules of the `aoc` package.
+        :param data: The input.
+        """
+        digest = hashlib.sha256()
+        digest.update(name.encode())
+        digest.update(hashlib.sha256(data).digest())
+        digest.update(_package_digest())
+        digest.update(_sources_digest(source_dir))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry["answer"]
+
+    def put(self, key: str, answer: Any) -> None:
+        """
+        Store an answer.  Answers that aren't plain JSON values (numbers, strings, ...) aren't cached,
+        since they wouldn't come back the same.
+        """
+        try:
+            entry = json.dumps({"answer": answer})
+        except (TypeError, ValueError):
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        # Write then rename, so a reader in another process never sees half an entry
+        temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp, "w") as f:
+            f.write(entry)
+        os.replace(temp, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits in `max_bytes`.
+        """
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Evicted by another process in the meantime
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+
+def _sources_digest(directory: Path) -> bytes:
+    digest = hashlib.sha256()
+    for path in sorted(directory.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _package_digest() -> bytes:
+    # The shared modules don't change during a run, so they are only read once per process
+    return _sources_digest(PACKAGE_DIR)
@@ -0,0 +1,49 @@
+"""
+Synthetic puzzle inputs of any size, for seeing how solutions scale.
+
+Each generator takes a size and a `random.Random` and returns the text of a valid input for one puzzle.
+What "size" means depends on the puzzle (the side of a grid, a number of lines, packet pairs or
+sensors) and is described by the generator's docstring.  The same year, day, size and seed always give
+the same input, so timings taken on generated inputs can be compared between runs.
+
+    data = generators.generate(2023, 17, 500, seed=1)
+"""
+import random
+from typing import Callable, Dict, List, Tuple
+
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS: Dict[Tuple[int, int], Generator] = {}
+
+
+def generator(year: int, day: int) -> Callable[[Generator], Generator]:
+    """
+    Register a function as the input generator for a puzzle.
+    """
+    def register(func: Generator) -> Generator:
+        GENERATORS[(year, day)] = func
+        return func
+    return register
+
+
+def available() -> List[Tuple[int, int]]:
+    return sorted(GENERATORS)
+
+
+def generate(year: int, day: int, size: int, seed: int = 0) -> bytes:
+    """
+    Build an input for a puzzle.
+
+    :param year: The puzzle's year.
+    :param day: The puzzle's day.
+    :param size: How big to make the input, in the generator's own units.
+    :param seed: Seed for the random choices.
+    :return: The input, encoded the same way as an input file.
+    """
+    if (year, day) not in GENERATORS:
+        raise KeyError(f"No input generator for {year} day {day}")
+    return GENERATORS[(year, day)](size, random.Random(f"{year}/{day}/{size}/{seed}")).encode()
+
+
+# Importing the year modules registers their generators
+from aoc.generators import y2022, y2023  # noqa: E402,F401
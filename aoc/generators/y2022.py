@@ -0,0 +1,382 @@
+import itertools
+import math
+import random
+import string
+from typing import Tuple
+
+from aoc.generators import generator
+
+Point = Tuple[int, int]
+
+# Part 2 looks for the distress beacon with both coordinates between 0 and this
+BEACON_SEARCH_MAX = 4_000_000
+
+
+@generator(2022, 1)
+def calorie_counting(size: int, rng: random.Random) -> str:
+    """
+    `size` elves, each carrying one to fifteen snacks.
+    """
+    elves = ("\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15))) for _ in range(size))
+    # The solution only counts an elf when it reaches the blank line after them, so the last one gets one too
+    return "\n\n".join(elves) + "\n\n"
+
+
+@generator(2022, 2)
+def rock_paper_scissors(size: int, rng: random.Random) -> str:
+    """
+    `size` rounds of the strategy guide.
+    """
+    return "".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(size))
+
+
+@generator(2022, 3)
+def rucksack(size: int, rng: random.Random) -> str:
+    """
+    `size` groups of three rucksacks.  Each rucksack has exactly one item type in both compartments and
+    each group has exactly one item type in all three rucksacks, its badge.
+    """
+    items = string.ascii_letters
+    lines = []
+    for _ in range(size):
+        badge = rng.choice(items)
+        others = [item for item in items if item != badge]
+        rng.shuffle(others)
+        # Every other item type is given to one rucksack only, so nothing but the badge is shared
+        pools = [others[i::3] for i in range(3)]
+        for pool in pools:
+            shared = rng.choice(pool + [badge])
+            # The badge is in one of the compartments if it isn't the shared item
+            first = [shared] + rng.sample([item for item in pool if item != shared], rng.randint(3, 7))
+            second = [shared] + [item for item in pool if item not in first][:len(first) - 1]
+            if badge not in first and badge not in second:
+                second[-1] = badge
+            rng.shuffle(first)
+            rng.shuffle(second)
+            lines.append("".join(first + second))
+    return "\n".join(lines) + "\n"
+
+
+@generator(2022, 4)
+def camp_cleanup(size: int, rng: random.Random) -> str:
+    """
+    `size` pairs of section assignments within sections 1-99.
+    """
+    def assignment() -> str:
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    return "".join(f"{assignment()},{assignment()}\n" for _ in range(size))
+
+
+@generator(2022, 5)
+def supply_stacks(size: int, rng: random.Random) -> str:
+    """
+    Nine stacks of crates and `size` moves.  The answer is the crate on top of every stack, so no move
+    empties a stack.  Like the real inputs, the first and last stacks start the tallest, which the
+    drawing's parser relies on.
+    """
+    stack_count = 9
+    tallest = 8
+    heights = [tallest] + [rng.randint(1, tallest) for _ in range(stack_count - 2)] + [tallest]
+    stacks = [[rng.choice(string.ascii_uppercase) for _ in range(height)] for height in heights]
+
+    lines = []
+    for level in range(tallest - 1, -1, -1):
+        lines.append(" ".join(f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks).rstrip())
+    lines.append(" " + "   ".join(str(i + 1) for i in range(stack_count)))
+    lines.append("")
+
+    sizes = list(heights)
+    for _ in range(size):
+        source = rng.choice([i for i, height in enumerate(sizes) if height > 1])
+        target = rng.choice([i for i in range(stack_count) if i != source])
+        amount = rng.randint(1, min(sizes[source] - 1, 6))
+        sizes[source] -= amount
+        sizes[target] += amount
+        lines.append(f"move {amount} from {source + 1} to {target + 1}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(2022, 6)
+def tuning_trouble(size: int, rng: random.Random) -> str:
+    """
+    A datastream of about `size` characters.  Only three letters are used until the end, where fourteen
+    different ones make both markers, so both parts have to scan the whole stream.
+    """
+    letters = rng.sample(string.ascii_lowercase, 17)
+    noise = letters[:3]
+    return "".join(rng.choice(noise) for _ in range(max(size - 14, 0))) + "".join(letters[3:]) + "\n"
+
+
+@generator(2022, 7)
+def no_space_left_on_device(size: int, rng: random.Random) -> str:
+    """
+    Terminal output exploring `size` directories, nested up to eight deep, holding about 45,000,000 bytes
+    in all.  That is more than the 40,000,000 that can stay on the 70,000,000 byte disk, so part 2 always
+    has to free some space, and less than the disk can hold.
+    """
+    # Each directory's parent, and how deep it is
+    parents = [None]
+    depths = [0]
+    for _ in range(1, size):
+        parent = rng.choice([d for d in range(max(0, len(parents) - 20), len(parents)) if depths[d] < 8] or [0])
+        parents.append(parent)
+        depths.append(depths[parent] + 1)
+    children = [[] for _ in parents]
+    for d, parent in enumerate(parents[1:], start=1):
+        children[parent].append(d)
+
+    files = [[rng.randint(1, 300) for _ in range(rng.randint(0, 5))] for _ in parents]
+    files[0].append(1)
+    total = sum(map(sum, files))
+    scale = 45_000_000 / total
+    files = [[max(1, int(f * scale)) for f in dir_files] for dir_files in files]
+
+    lines = []
+
+    def explore(d: int) -> None:
+        lines.append("$ ls")
+        entries = [f"dir d{child}" for child in children[d]]
+        entries += [f"{f} f{i}.{rng.choice(['txt', 'dat', 'bin'])}" for i, f in enumerate(files[d])]
+        rng.shuffle(entries)
+        lines.extend(entries)
+        for child in children[d]:
+            lines.append(f"$ cd d{child}")
+            explore(child)
+            lines.append("$ cd ..")
+
+    lines.append("$ cd /")
+    explore(0)
+    return "\n".join(lines) + "\n"
+
+
+@generator(2022, 8)
+def treetop_tree_house(size: int, rng: random.Random) -> str:
+    """
+    A `size` x `size` forest of tree heights 0-9.
+    """
+    return "\n".join("".join(rng.choice("0123456789") for _ in range(size)) for _ in range(size)) + "\n"
+
+
+@generator(2022, 9)
+def rope_bridge(size: int, rng: random.Random) -> str:
+    """
+    `size` head motions of one to twenty steps.
+    """
+    return "".join(f"{rng.choice('UDLR')} {rng.randint(1, 20)}\n" for _ in range(size))
+
+
+@generator(2022, 11)
+def monkey_in_the_middle(size: int, rng: random.Random) -> str:
+    """
+    `size` monkeys (at least two) holding up to eight items each.  Each monkey's test is a different
+    prime and it only throws to other monkeys.
+
+    Part 1 keeps the whole worry level, so at most one monkey squares it, and nobody throws to that monkey.
+    Otherwise an item could keep coming back to be squared again and grow to millions of digits.
+    """
+    size = max(size, 2)
+    primes = []
+    candidate = 2
+    while len(primes) < size:
+        if all(candidate % p for p in primes):
+            primes.append(candidate)
+        candidate += 1
+    rng.shuffle(primes)
+    squarer = rng.randrange(size) if size > 2 else None
+
+    notes = []
+    for number in range(size):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        if number == squarer:
+            operation = "old * old"
+        else:
+            operation = rng.choice([f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}"])
+        targets = [m for m in range(size) if m != number and m != squarer]
+        true_monkey, false_monkey = rng.sample(targets, 2) if len(targets) > 1 else 2 * targets
+        notes.append(f"Monkey {number}:\n"
+                     f"  Starting items: {items}\n"
+                     f"  Operation: new = {operation}\n"
+                     f"  Test: divisible by {primes[number]}\n"
+                     f"    If true: throw to monkey {true_monkey}\n"
+                     f"    If false: throw to monkey {false_monkey}\n")
+    return "\n".join(notes)
+
+
+@generator(2022, 12)
+def hill_climbing_algorithm(size: int, rng: random.Random) -> str:
+    """
+    A `size` x `size` heightmap (at least 15 x 15) of hills rising towards the bottom right.  A path
+    along the top row and down the right-hand column climbs from S through a to z to E one level at a
+    time, so the best signal can always be reached.
+    """
+    size = max(size, 15)
+    letters = string.ascii_lowercase
+    rows = [[letters[min(25, max(0, (r + c) * 26 // (2 * size) + rng.randint(-3, 1)))] for c in range(size)]
+            for r in range(size)]
+    path = [(0, c) for c in range(size)] + [(r, size - 1) for r in range(1, size)]
+    # S, then a to z spread out along the path, then E
+    for step, (r, c) in enumerate(path[1:-1]):
+        rows[r][c] = letters[step * 26 // (len(path) - 2)]
+    rows[0][0] = "S"
+    rows[size - 1][size - 1] = "E"
+    return "\n".join("".join(row) for row in rows) + "\n"
+
+
+@generator(2022, 13)
+def distress_signal(size: int, rng: random.Random) -> str:
+    """
+    `size` pairs of packets, each a list nested up to four deep.
+    """
+    def packet(depth: int) -> str:
+        items = []
+        for _ in range(rng.randint(0, 5)):
+            if depth < 4 and rng.random() < 0.3:
+                items.append(packet(depth + 1))
+            else:
+                items.append(str(rng.randint(0, 10)))
+        return "[" + ",".join(items) + "]"
+
+    return "\n\n".join(f"{packet(0)}\n{packet(0)}" for _ in range(size)) + "\n"
+
+
+@generator(2022, 14)
+def regolith_reservoir(size: int, rng: random.Random) -> str:
+    """
+    Rock paths down to `size` rows below the sand source (at least 10).
+
+    Part 1 only ends once sand falls into the abyss, so the rocks must never hold a pile that reaches the
+    source.  Each path keeps to its own run of columns, with empty columns between runs.  Sand can't rest
+    above an empty column, so a pile stays within one run of columns and is at most half as tall as the
+    run is wide.  Each path starts low enough that a pile on it can't get up to the source.
+    """
+    depth = max(size, 10)
+    lines = []
+    left = 500 - depth
+    while left < 500 + depth:
+        width = rng.randint(1, 12)
+        right = left + width - 1
+        top = rng.randint((width + 1) // 2 + 2, depth)
+        # The first path reaches the bottom, so the cave is always `depth` deep
+        x, y = rng.randint(left, right), depth if not lines else rng.randint(top, depth)
+        points = [(x, y)]
+        for turn in range(rng.randint(1, 5)):
+            if turn % 2 == 0:
+                x = rng.randint(left, right)
+            else:
+                y = rng.randint(top, depth)
+            if (x, y) != points[-1]:
+                points.append((x, y))
+        lines.append(" -> ".join(f"{px},{py}" for px, py in points))
+        left = right + 1 + rng.randint(1, 4)
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+@generator(2022, 15)
+def beacon_exclusion_zone(size: int, rng: random.Random) -> str:
+    """
+    About `size` sensors covering the 4,000,000 square part 2 searches, leaving exactly one cell in it
+    that no sensor can reach, and with every sensor listing its one closest beacon.
+
+    The sensors sit at the centers of a grid of square cells, each reaching the corners of its own cell.
+    Every other corner along both axes is a beacon, so each cell has exactly one beacon corner and the
+    next nearest beacon is twice as far.  The hidden cell is one of the other corners: the four sensors
+    around it get a closer beacon, shared by the two on either side of it one step above or below it,
+    which pulls their range in by one.  The corner is then out of everyone's range, while the rest of
+    their cells still are in range of them or of their neighbors.
+    """
+    max_coord = BEACON_SEARCH_MAX
+    cells = max(2, round(math.sqrt(size)) - 1)
+    half = max(2, (max_coord + 1) // (2 * cells))
+    side = 2 * half
+    # Where the grid starts, so the hidden cell isn't always in the same place relative to the edges
+    offset_x = rng.randrange(side)
+    offset_y = rng.randrange(side)
+
+    def centers(offset: int) -> range:
+        # Every cell that overlaps 0..max_coord
+        return range(-((half + offset) // side), (max_coord + half - offset) // side + 1)
+
+    def corner(offset: int, i: int) -> int:
+        # The corner between centers i and i + 1
+        return offset + i * side + half
+
+    def corners_inside(offset: int) -> range:
+        # Every corner in 0..max_coord
+        return range(-((offset + half) // side), (max_coord - offset - half) // side + 1)
+
+    while True:
+        hidden_i = rng.choice(corners_inside(offset_x))
+        hidden_j = rng.choice(corners_inside(offset_y))
+        # Corners with both indices even are beacons
+        if hidden_i % 2 or hidden_j % 2:
+            break
+    hidden = (corner(offset_x, hidden_i), corner(offset_y, hidden_j))
+
+    sensors = {}
+    for i in centers(offset_x):
+        for j in centers(offset_y):
+            # The cell's one corner with both indices even
+            sensors[(offset_x + i * side, offset_y + j * side)] = (corner(offset_x, i - i % 2),
+                                                                   corner(offset_y, j - j % 2))
+    for i in (hidden_i, hidden_i + 1):
+        sensors[(offset_x + i * side, hidden[1] - half)] = (hidden[0], hidden[1] - 1)
+        sensors[(offset_x + i * side, hidden[1] + half)] = (hidden[0], hidden[1] + 1)
+
+    readings = list(sensors.items())
+    rng.shuffle(readings)
+    return "\n".join(f"Sensor at x={sensor[0]}, y={sensor[1]}: closest beacon is at x={beacon[0]}, y={beacon[1]}"
+                     for sensor, beacon in readings) + "\n"
+
+
+@generator(2022, 16)
+def proboscidea_volcanium(size: int, rng: random.Random) -> str:
+    """
+    A scan of `size` valves (at least two) joined by tunnels into one network, starting at AA.  Like the
+    real scans, at most fifteen valves have a flow rate, since the number of those is what the searches
+    grow exponentially with.
+    """
+    size = max(size, 2)
+    names = ["AA"]
+    for length in itertools.count(2):
+        for letters in itertools.product(string.ascii_uppercase, repeat=length):
+            if len(names) == size:
+                break
+            if "".join(letters) != "AA":
+                names.append("".join(letters))
+        if len(names) == size:
+            break
+    flows = [0] * size
+    for valve in rng.sample(range(1, size), min(15, size - 1)):
+        flows[valve] = rng.randint(1, 25)
+
+    tunnels = [set() for _ in names]
+    for valve in range(1, size):
+        # Joined to an earlier valve, so everything is connected, plus a few extra tunnels
+        other = rng.randrange(valve)
+        tunnels[valve].add(other)
+        tunnels[other].add(valve)
+    for _ in range(size // 3):
+        a, b = rng.sample(range(size), 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    lines = []
+    for valve, name in enumerate(names):
+        leads = [names[other] for other in sorted(tunnels[valve])]
+        if len(leads) == 1:
+            lines.append(f"Valve {name} has flow rate={flows[valve]}; tunnel leads to valve {leads[0]}")
+        else:
+            lines.append(f"Valve {name} has flow rate={flows[valve]}; tunnels lead to valves {', '.join(leads)}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+@generator(2022, 17)
+def pyroclastic_flow(size: int, rng: random.Random) -> str:
+    """
+    A jet pattern of `size` pushes.
+    """
+    return "".join(rng.choice("<>") for _ in range(max(size, 1))) + "\n"
@@ -0,0 +1,297 @@
+import itertools
+import random
+import string
+
+from aoc.generators import generator
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+ALMANAC_SECTIONS = ["seed-to-soil", "soil-to-fertilizer", "fertilizer-to-water", "water-to-light",
+                    "light-to-temperature", "temperature-to-humidity", "humidity-to-location"]
+
+# Where each pipe leads, as (row, column) steps
+PIPES = {frozenset({(-1, 0), (1, 0)}): "|", frozenset({(0, 1), (0, -1)}): "-", frozenset({(-1, 0), (0, 1)}): "L",
+         frozenset({(-1, 0), (0, -1)}): "J", frozenset({(1, 0), (0, -1)}): "7", frozenset({(1, 0), (0, 1)}): "F"}
+
+
+@generator(2023, 1)
+def trebuchet(size: int, rng: random.Random) -> str:
+    """
+    `size` lines of lowercase letters and spelled out digits, each with at least one real digit so both
+    parts can read it.
+    """
+    lines = []
+    for _ in range(size):
+        pieces = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(1, 8)):
+            choice = rng.random()
+            if choice < 0.3:
+                pieces.append(rng.choice(DIGIT_WORDS))
+            elif choice < 0.5:
+                pieces.append(rng.choice(string.digits[1:]))
+            else:
+                pieces.append("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(1, 5))))
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+    return "\n".join(lines) + "\n"
+
+
+@generator(2023, 2)
+def cube_conundrum(size: int, rng: random.Random) -> str:
+    """
+    `size` games of one to six rounds, each showing up to 20 cubes of each color.
+    """
+    lines = []
+    for game in range(1, size + 1):
+        rounds = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game}: " + "; ".join(rounds))
+    return "\n".join(lines) + "\n"
+
+
+@generator(2023, 3)
+def gear_ratios(size: int, rng: random.Random) -> str:
+    """
+    A `size` x `size` engine schematic of numbers up to three digits long and scattered symbols, about a
+    third of them gears.
+    """
+    size = max(size, 1)
+    rows = []
+    for _ in range(size):
+        row = ""
+        while len(row) < size:
+            choice = rng.random()
+            if choice < 0.1:
+                row += str(rng.randint(1, 999))
+            elif choice < 0.13:
+                row += "*"
+            elif choice < 0.16:
+                row += rng.choice("#$%&+-/=@")
+            else:
+                row += "."
+        rows.append(row[:size])
+    return "\n".join(rows) + "\n"
+
+
+@generator(2023, 4)
+def scratchcards(size: int, rng: random.Random) -> str:
+    """
+    `size` cards of ten winning numbers and 25 of my own, below 100.
+
+    Part 2 counts every copy won one at a time, so most cards win nothing and the rest win one or two.
+    That keeps the copies from growing exponentially down the pile.  No card wins copies of cards past the
+    end.
+    """
+    lines = []
+    width = len(str(size))
+    for card in range(1, size + 1):
+        matches = min(rng.choices([0, 1, 2], weights=[6, 3, 1])[0], size - card)
+        numbers = rng.sample(range(1, 100), 35 - matches)
+        winning = numbers[:10]
+        mine = winning[:matches] + numbers[10:]
+        rng.shuffle(mine)
+        lines.append(f"Card {card:>{width}}: {' '.join(f'{n:2}' for n in winning)} | "
+                     f"{' '.join(f'{n:2}' for n in mine)}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(2023, 5)
+def fertilizer(size: int, rng: random.Random) -> str:
+    """
+    Ten seed ranges and seven maps of `size` ranges each.  Like the real almanacs, each map cuts 0..2^32
+    into pieces and moves them around, so every value maps to exactly one other.
+    """
+    limit = 2 ** 32
+    pieces = max(size, 1)
+    seeds = []
+    for _ in range(10):
+        start = rng.randrange(limit)
+        seeds += [start, rng.randint(1, min(limit - start, 2 ** 28))]
+
+    sections = []
+    for name in ALMANAC_SECTIONS:
+        cuts = [0] + sorted(rng.sample(range(1, limit), pieces - 1)) + [limit]
+        lengths = [end - start for start, end in zip(cuts, cuts[1:])]
+        order = list(range(pieces))
+        rng.shuffle(order)
+        dests = {}
+        dest = 0
+        for piece in order:
+            dests[piece] = dest
+            dest += lengths[piece]
+        lines = [f"{dests[piece]} {cuts[piece]} {lengths[piece]}" for piece in order]
+        sections.append(f"{name} map:\n" + "\n".join(lines))
+    return f"seeds: {' '.join(str(seed) for seed in seeds)}\n\n" + "\n\n".join(sections) + "\n"
+
+
+@generator(2023, 6)
+def wait_for_it(size: int, rng: random.Random) -> str:
+    """
+    Four races whose times, read as one number for part 2, come to about `size` (at least 1000).  Both
+    parts try every way to hold the button, so that number is how long they take.
+    """
+    digits = str(max(size, 1000))
+    cuts = sorted(rng.sample(range(1, len(digits)), 3))
+    times = [digits[start:end] for start, end in zip([0] + cuts, cuts + [len(digits)])]
+    for i, time in enumerate(times):
+        # A time can't start with a 0, which would be lost from part 2's number, and a race needs at least 3
+        # milliseconds to beat a record of 1 millimeter
+        if len(time) > 1 and time[0] == "0":
+            times[i] = str(int(time) + 10 ** (len(time) - 1))
+        elif int(time) < 3:
+            times[i] = str(int(time) + 3)
+    # Every race can be won, and the distances joined up don't outgrow what the joined time can reach
+    distances = [str(rng.randrange(1, min(int(time) ** 2 // 4, 10 ** (2 * len(time) - 1))))
+                 for time in times]
+    width = max(len(value) for value in times + distances) + 3
+    return ("Time:    " + "".join(time.rjust(width) for time in times) + "\n"
+            + "Distance:" + "".join(distance.rjust(width) for distance in distances) + "\n")
+
+
+@generator(2023, 7)
+def camel_cards(size: int, rng: random.Random) -> str:
+    """
+    `size` different hands of five cards, with bids up to 1000.
+    """
+    hands = set()
+    while len(hands) < size:
+        hands.add("".join(rng.choice("23456789TJQKA") for _ in range(5)))
+    return "\n".join(f"{hand} {rng.randint(1, 1000)}" for hand in sorted(hands, key=lambda _: rng.random())) + "\n"
+
+
+@generator(2023, 8)
+def haunted_wasteland(size: int, rng: random.Random) -> str:
+    """
+    `size` left/right instructions and a network with six ghost starts, one of them AAA.
+
+    As in the real networks, each ghost walks a loop: from its start to its end node, then from there back
+    round to the same end node, in the same number of steps both times.  Both are the instructions' length
+    times a prime, which is what lets the solutions take the LCM of the first arrivals.  Every node's left
+    and right lead to the same place here, so the instructions don't change the route.
+    """
+    instructions = "".join(rng.choice("LR") for _ in range(max(size, 1)))
+    primes = rng.sample([3, 5, 7, 11, 13, 17, 19, 23, 29, 31], 6)
+    # Middle nodes never end in A or Z
+    middles = ("".join(letters) + last for length in itertools.count(2)
+               for letters in itertools.product(string.ascii_uppercase, repeat=length)
+               for last in string.ascii_uppercase[1:-1])
+    ends = ["AA"] + rng.sample([a + b for a in string.ascii_uppercase for b in string.ascii_uppercase
+                                if a + b != "AA" and a + b != "ZZ"], 5)
+
+    lines = []
+    for prefix, prime in zip(ends, primes):
+        start, end = prefix + "A", (prefix if prefix != "AA" else "ZZ") + "Z"
+        route = [next(middles) for _ in range(len(instructions) * prime - 1)]
+        lines.append(f"{start} = ({route[0]}, {route[0]})")
+        for node, after in zip(route, route[1:] + [end]):
+            lines.append(f"{node} = ({after}, {after})")
+        lines.append(f"{end} = ({route[0]}, {route[0]})")
+    rng.shuffle(lines)
+    return instructions + "\n\n" + "\n".join(lines) + "\n"
+
+
+@generator(2023, 9)
+def mirage_maintenance(size: int, rng: random.Random) -> str:
+    """
+    `size` histories of 21 values, each a polynomial of degree at most 6 so the differences reach zero.
+    """
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 7))]
+        values = [sum(c * x ** power for power, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(" ".join(str(v) for v in values))
+    return "\n".join(lines) + "\n"
+
+
+@generator(2023, 10)
+def pipe_maze(size: int, rng: random.Random) -> str:
+    """
+    A `size` x `size` field (at least 2) with one loop of pipe through S, among random bits of pipe.
+
+    The loop goes round a histogram: along the bottom row, up the last column, then left across the top of
+    columns of random heights and back down the first column.  That never crosses itself, and the columns'
+    heights give it plenty of nooks for part 2 to sort into inside and outside.  The tiles next to S that
+    aren't on the loop are ground, so only the loop's two pipes lead into it.
+    """
+    size = max(size, 2)
+    bottom = size - 1
+    heights = [rng.randint(1, bottom) for _ in range(size)]
+    # The loop's tiles in order, as (row, column)
+    loop = [(bottom, column) for column in range(size)]
+    loop += [(bottom - height, size - 1) for height in range(1, heights[-1] + 1)]
+    for column in range(size - 2, 0, -1):
+        row = loop[-1][0]
+        loop.append((row, column))
+        step = 1 if bottom - heights[column] > row else -1
+        loop += [(r, column) for r in range(row + step, bottom - heights[column] + step, step)]
+    loop += [(r, 0) for r in range(loop[-1][0], bottom)]
+
+    field = [[rng.choice("|-LJ7F.") for _ in range(size)] for _ in range(size)]
+    for i, (row, column) in enumerate(loop):
+        steps = frozenset((r - row, c - column) for r, c in (loop[i - 1], loop[(i + 1) % len(loop)]))
+        field[row][column] = PIPES[steps]
+    start_row, start_column = rng.choice(loop)
+    field[start_row][start_column] = "S"
+    on_loop = set(loop)
+    for row, column in ((start_row - 1, start_column), (start_row + 1, start_column),
+                        (start_row, start_column - 1), (start_row, start_column + 1)):
+        if 0 <= row < size and 0 <= column < size and (row, column) not in on_loop:
+            field[row][column] = "."
+    return "\n".join("".join(row) for row in field) + "\n"
+
+
+@generator(2023, 11)
+def cosmic_expansion(size: int, rng: random.Random) -> str:
+    """
+    A `size` x `size` image (at least 1) with a galaxy in about one cell in fifty, and at least one galaxy.
+    """
+    size = max(size, 1)
+    image = [["#" if rng.random() < 0.02 else "." for _ in range(size)] for _ in range(size)]
+    image[rng.randrange(size)][rng.randrange(size)] = "#"
+    return "\n".join("".join(row) for row in image) + "\n"
+
+
+@generator(2023, 14)
+def parabolic_reflector_dish(size: int, rng: random.Random) -> str:
+    """
+    A `size` x `size` platform of round rocks, cube rocks and empty space.
+    """
+    cells = "O" * 2 + "#" * 2 + "." * 6
+    return "\n".join("".join(rng.choice(cells) for _ in range(size)) for _ in range(size)) + "\n"
+
+
+@generator(2023, 15)
+def lens_library(size: int, rng: random.Random) -> str:
+    """
+    An initialization sequence of `size` steps on labels of two to six letters.  A few hundred labels are
+    reused throughout, so lenses get replaced and removed as well as added.
+    """
+    labels = list({"".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 6)))
+                   for _ in range(300)})
+    labels.sort()
+    steps = []
+    for _ in range(max(size, 1)):
+        label = rng.choice(labels)
+        steps.append(f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps) + "\n"
+
+
+@generator(2023, 16)
+def the_floor_will_be_lava(size: int, rng: random.Random) -> str:
+    """
+    A `size` x `size` contraption where about one tile in ten is a mirror or splitter.
+    """
+    def tile() -> str:
+        return rng.choice("/\\|-") if rng.random() < 0.1 else "."
+
+    return "\n".join("".join(tile() for _ in range(size)) for _ in range(size)) + "\n"
+
+
+@generator(2023, 17)
+def clumsy_crucible(size: int, rng: random.Random) -> str:
+    """
+    A `size` x `size` city of heat loss digits 1-9.
+    """
+    return "\n".join("".join(rng.choice("123456789") for _ in range(size)) for _ in range(size)) + "\n"
@@ -0,0 +1,239 @@
+"""
+A 2D grid of single-character cells, shared by the grid-based puzzles.
+
+All cells live in one `bytearray`, one byte per cell, surrounded by a one-cell border of PAD bytes.
+The border means that stepping off any edge of the grid lands on a PAD cell rather than wrapping
+around or raising, so neighbor lookups in hot loops can be a single index plus an offset with no
+bounds checks.
+
+A `Grid` is a view over that buffer described by the index of its top-left cell and the index
+step for moving one row down or one column right.  Transposing and rotating only change those
+three numbers, so they never copy the cells, and rows and columns are returned as memoryviews
+over the same buffer.
+"""
+import mmap
+from typing import Iterator, List, Optional, Tuple, Union
+
+from aoc import inputs
+
+# Value of the border cells.  Puzzle input is text, so it never contains a zero byte.
+PAD = 0
+
+UP = 0
+RIGHT = 1
+DOWN = 2
+LEFT = 3
+DIRECTIONS = [UP, RIGHT, DOWN, LEFT]
+DELTAS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+
+class Grid:
+
+    def __init__(self, data: bytearray, height: int, width: int, origin: int, row_step: int, col_step: int):
+        self.data = data
+        self.height = height
+        self.width = width
+        self.origin = origin
+        self.row_step = row_step
+        self.col_step = col_step
+
+    @classmethod
+    def parse(cls, text: Union[str, bytes, mmap.mmap]) -> "Grid":
+        """
+        Build a grid from lines of text.  Blank lines are ignored.
+        """
+        if isinstance(text, str):
+            text = text.encode()
+        # Views of the rows, so each row is only copied once: straight into the grid's buffer
+        return cls._from_rows([row for row in map(inputs.strip, inputs.lines(text)) if len(row)])
+
+    @classmethod
+    def parse_many(cls, text: Union[str, bytes, mmap.mmap]) -> List["Grid"]:
+        """
+        Build one grid for each block of lines, where blocks are separated by blank lines.
+        """
+        if isinstance(text, str):
+            text = text.encode()
+        grids = []
+        rows: List[memoryview] = []
+        for row in map(inputs.strip, inputs.lines(text)):
+            if len(row):
+                rows.append(row)
+            elif rows:
+                grids.append(cls._from_rows(rows))
+                rows = []
+        if rows:
+            grids.append(cls._from_rows(rows))
+        return grids
+
+    @classmethod
+    def _from_rows(cls, rows: List[memoryview]) -> "Grid":
+        width = len(rows[0])
+        stride = width + 2
+        data = bytearray(stride * (len(rows) + 2))
+        for r, row in enumerate(rows):
+            if len(row) != width:
+                raise ValueError(f"Row {r} has {len(row)} cells, expected {width}")
+            start = (r + 1) * stride + 1
+            data[start:start + width] = row
+        return Grid(data, len(rows), width, stride + 1, stride, 1)
+
+    @classmethod
+    def read(cls, filename: str) -> "Grid":
+        with inputs.mapped(filename) as data:
+            return cls.parse(data)
+
+    @classmethod
+    def filled(cls, height: int, width: int, value: str) -> "Grid":
+        stride = width + 2
+        data = bytearray(stride * (height + 2))
+        row = value.encode() * width
+        for r in range(height):
+            start = (r + 1) * stride + 1
+            data[start:start + width] = row
+        return Grid(data, height, width, stride + 1, stride, 1)
+
+    ###################
+    # Cell access
+    ###################
+
+    def index(self, r: int, c: int) -> int:
+        """
+        Position of (r, c) in `data`.  Coordinates one step outside the grid map to PAD cells.
+        """
+        return self.origin + r * self.row_step + c * self.col_step
+
+    def coords(self, i: int) -> Tuple[int, int]:
+        """
+        The inverse of `index()`.
+        """
+        stride = self._stride
+        base_r, base_c = divmod(i, stride)
+        origin_r, origin_c = divmod(self.origin, stride)
+        return self._steps(base_r - origin_r, base_c - origin_c, self.row_step), \
+            self._steps(base_r - origin_r, base_c - origin_c, self.col_step)
+
+    @property
+    def offsets(self) -> List[int]:
+        """
+        Index deltas for one step UP, RIGHT, DOWN and LEFT.
+        """
+        return [-self.row_step, self.col_step, self.row_step, -self.col_step]
+
+    def in_bounds(self, r: int, c: int) -> bool:
+        return 0 <= r < self.height and 0 <= c < self.width
+
+    def __getitem__(self, rc: Tuple[int, int]) -> str:
+        return chr(self.data[self.origin + rc[0] * self.row_step + rc[1] * self.col_step])
+
+    def __setitem__(self, rc: Tuple[int, int], value: str) -> None:
+        self.data[self.origin + rc[0] * self.row_step + rc[1] * self.col_step] = ord(value)
+
+    def neighbors(self, r: int, c: int) -> Iterator[Tuple[int, int]]:
+        """
+        The in-bounds cells directly above, right of, below and left of (r, c).
+        """
+        i = self.index(r, c)
+        data = self.data
+        for offset, (dr, dc) in zip(self.offsets, DELTAS):
+            if data[i + offset] != PAD:
+                yield r + dr, c + dc
+
+    def find(self, value: str) -> Optional[Tuple[int, int]]:
+        for r, row in enumerate(self.rows()):
+            c = row.tobytes().find(value.encode())
+            if c >= 0:
+                return r, c
+        return None
+
+    def find_all(self, value: str) -> Iterator[Tuple[int, int]]:
+        target = ord(value)
+        for r, row in enumerate(self.rows()):
+            for c, cell in enumerate(row):
+                if cell == target:
+                    yield r, c
+
+    def count(self, value: str) -> int:
+        return sum(row.tobytes().count(value.encode()) for row in self.rows())
+
+    ###################
+    # Rows and columns
+    ###################
+
+    def row(self, r: int) -> memoryview:
+        start = self.origin + r * self.row_step
+        return memoryview(self.data)[start:start + self.width * self.col_step:self.col_step]
+
+    def col(self, c: int) -> memoryview:
+        start = self.origin + c * self.col_step
+        return memoryview(self.data)[start:start + self.height * self.row_step:self.row_step]
+
+    def rows(self) -> Iterator[memoryview]:
+        for r in range(self.height):
+            yield self.row(r)
+
+    def cols(self) -> Iterator[memoryview]:
+        for c in range(self.width):
+            yield self.col(c)
+
+    ###################
+    # Views
+    ###################
+
+    def transposed(self) -> "Grid":
+        return Grid(self.data, self.width, self.height, self.origin, self.col_step, self.row_step)
+
+    def rotated(self) -> "Grid":
+        """
+        The grid turned 90 degrees clockwise: the bottom-left cell becomes the top-left one.
+        """
+        origin = self.origin + (self.height - 1) * self.row_step
+        return Grid(self.data, self.width, self.height, origin, self.col_step, -self.row_step)
+
+    def rotated_counterclockwise(self) -> "Grid":
+        origin = self.origin + (self.width - 1) * self.col_step
+        return Grid(self.data, self.width, self.height, origin, -self.col_step, self.row_step)
+
+    def copy(self) -> "Grid":
+        """
+        A grid with its own buffer, laid out in this view's orientation.
+        """
+        return Grid.parse(str(self))
+
+    ###################
+    # Comparison
+    ###################
+
+    def tobytes(self) -> bytes:
+        """
+        The cells in row order, without the border.
+        """
+        return b"".join(row.tobytes() for row in self.rows())
+
+    def __eq__(self, o: object) -> bool:
+        if not isinstance(o, Grid):
+            return False
+        return self.height == o.height and self.width == o.width and self.tobytes() == o.tobytes()
+
+    def __hash__(self) -> int:
+        # Grids are mutable, so only hash one that won't be changed while it is in a set or dict key.
+        return hash((self.height, self.width, self.tobytes()))
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.rows())
+
+    ###################
+    # Internals
+    ###################
+
+    @property
+    def _stride(self) -> int:
+        # The buffer always has rows of the unrotated width plus the border on either side.
+        return max(abs(self.row_step), abs(self.col_step))
+
+    @staticmethod
+    def _steps(delta_r: int, delta_c: int, step: int) -> int:
+        # A step of +/-1 moves along the buffer's columns, anything else moves along its rows.
+        if abs(step) == 1:
+            return delta_c * step
+        return delta_r * (1 if step > 0 else -1)
@@ -0,0 +1,96 @@
+"""
+Read puzzle input without making copies of it.
+
+`mapped()` memory-maps an input file, so the operating system pages it in as it is read instead of the
+whole file being loaded up front.  The helpers below work on anything with bytes-style `find()` (the
+mapping itself, `bytes` or `bytearray`) and hand back `memoryview` slices or numbers rather than decoded
+and stripped strings, so even inputs hundreds of megabytes long are parsed in a bounded amount of memory.
+
+    with inputs.mapped("input.txt") as data:
+        for line in inputs.lines(data):
+            ...
+
+The runner and the benchmarks hand solutions a mapped file, so `solve()` and `parse()` should only use
+what `bytes` and `mmap` have in common (indexing, slicing, `find()`, `re`, iterating over the bytes).
+Solutions that want a string use `text()` rather than `data.decode()`.
+"""
+import contextlib
+import mmap
+import re
+from array import array
+from os import PathLike
+from typing import Iterator, Union
+
+Buffer = Union[bytes, bytearray, mmap.mmap]
+
+INT = re.compile(rb"-?\d+")
+WHITESPACE = b" \t\r\n\f\v"
+
+
+@contextlib.contextmanager
+def mapped(filename: Union[str, PathLike]) -> Iterator[Buffer]:
+    """
+    Memory-map a file read-only.  The mapping is closed when the `with` block ends, unless memoryviews of
+    it are still alive, in which case it is closed once the last of them is garbage collected.
+    """
+    with open(filename, "rb") as f:
+        # Empty files can't be mapped
+        if f.seek(0, 2) == 0:
+            yield b""
+            return
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield data
+    finally:
+        try:
+            data.close()
+        except BufferError:
+            pass
+
+
+def lines(data: Buffer) -> Iterator[memoryview]:
+    """
+    The lines of the input, without their line endings, as views into `data`.
+    """
+    view = memoryview(data)
+    start = 0
+    size = len(data)
+    while start < size:
+        end = data.find(b"\n", start)
+        if end < 0:
+            end = size
+        line_end = end
+        if line_end > start and view[line_end - 1] == ord("\r"):
+            line_end -= 1
+        yield view[start:line_end]
+        start = end + 1
+
+
+def text(data: Buffer) -> str:
+    """
+    The whole input decoded, for solutions that work on strings.  `data.decode()` only works on `bytes`,
+    while this also takes a mapped file.
+    """
+    return str(data, "utf-8")
+
+
+def strip(line: memoryview) -> memoryview:
+    """
+    Drop leading and trailing whitespace from a line, still without copying it.
+    """
+    start = 0
+    end = len(line)
+    while start < end and line[start] in WHITESPACE:
+        start += 1
+    while end > start and line[end - 1] in WHITESPACE:
+        end -= 1
+    return line[start:end]
+
+
+def ints(data: Union[Buffer, memoryview]) -> array:
+    """
+    Every integer in the input, in order, ignoring whatever separates them.
+
+    :return: A compact array of signed 64-bit ints rather than a list of Python ints.
+    """
+    return array("q", (int(m.group()) for m in INT.finditer(data)))
@@ -0,0 +1,22 @@
+"""
+Progress output from solutions.
+
+Solutions report what they are doing with `log.info()` instead of `print()`, so it can be switched off.
+Running a solution as a script keeps the output, while the runner turns it off (unless asked not to)
+so that timings measure the puzzle rather than the terminal.
+
+`info()` returns straight away when output is off, but its arguments are still built.  Inside hot loops,
+check the flag first so that a disabled message costs one attribute lookup:
+
+    if log.verbose:
+        log.info(f"Processed sensor {count} of {len(sensors)}")
+"""
+verbose = True
+
+
+def info(*values) -> None:
+    """
+    Print the values, like `print()`, if output is on.
+    """
+    if verbose:
+        print(*values)
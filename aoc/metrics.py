@@ -0,0 +1,86 @@
+"""
+Counters for how much work a search does, so algorithmic changes can be compared by more than wall time.
+
+A solution asks for the counters of a named search and bumps them as it goes:
+
+    stats = metrics.counters("bfs")
+    while queue:
+        node = queue.popleft()
+        stats.expanded += 1
+        ...
+
+Asking for the same name again during a run returns the same counters, so a search that is repeated
+(once per starting point, say) adds up over the whole part.  The runner clears the counters before each
+part and collects them afterwards, and `python -m aoc run --metrics FILE` writes them out as JSON.
+Outside the runner they simply accumulate until `reset()`.
+
+Counting is on by default, for solutions run as scripts, and the runner switches it off unless
+`--metrics` asks for the counters, so that timings don't pay for them.  While it is off `counters()`
+returns None.  Code that counts in a hot loop checks for that once, before the loop, and runs a copy of
+the loop without the counting (see `aoc.search`), so a disabled counter costs nothing per step.
+"""
+import dataclasses
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+Metrics = Dict[str, Dict[str, int]]
+
+enabled = True
+
+
+@dataclasses.dataclass
+class SearchCounters:
+    # States taken off the frontier and explored
+    expanded: int = 0
+    # States added to the frontier
+    pushed: int = 0
+    # States that were reached again and skipped because they had already been seen
+    dedup_hits: int = 0
+    # The most states the frontier held at once
+    peak_frontier: int = 0
+    # Branches cut off without being explored because a bound showed they couldn't beat the best so far
+    pruned: int = 0
+
+    def frontier(self, size: int) -> None:
+        """
+        Record the current frontier size, keeping the largest one seen.
+        """
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+
+_counters: Dict[str, SearchCounters] = {}
+
+
+def counters(name: str) -> Optional[SearchCounters]:
+    """
+    The counters for the search called `name`, created the first time they are asked for, or None if
+    counting is off.
+    """
+    if not enabled:
+        return None
+    if name not in _counters:
+        _counters[name] = SearchCounters()
+    return _counters[name]
+
+
+def reset() -> None:
+    _counters.clear()
+
+
+def collect() -> Metrics:
+    """
+    A snapshot of every search's counters, by name.
+    """
+    return {name: dataclasses.asdict(c) for name, c in sorted(_counters.items())}
+
+
+def save(path: Path, metrics: Iterable[Tuple[str, Metrics]]) -> None:
+    """
+    Write (key, metrics) pairs to a JSON file, one entry per key.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(dict(metrics), f, indent=2, sort_keys=True)
+        f.write("\n")
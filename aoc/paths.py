@@ -0,0 +1,12 @@
+"""
+Where things live in the repo.
+
+Kept apart from the runner so that solutions can find the local state directory without importing it.
+"""
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PUZZLES_DIR = REPO_ROOT / "puzzles"
+
+# Local state that shouldn't be committed (timings from previous runs, caches, ...)
+STATE_DIR = REPO_ROOT / ".aoc"
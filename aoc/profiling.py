@@ -0,0 +1,101 @@
+"""
+Profile a solution without editing it.
+
+`profiled()` runs a call under cProfile and, at the same time, a sampling profiler that records the
+whole Python stack every millisecond of CPU time.  Two files are written:
+
+- `<name>.pstats`: the cProfile statistics, for `pstats`, snakeviz, etc.
+- `<name>.collapsed`: one `outer;inner;innermost count` line per distinct stack, the "collapsed stack"
+  format that flamegraph.pl, speedscope and inferno read.
+
+cProfile only records which function called which, not whole stacks, which is why the flame graph
+comes from the sampler instead.  The sampler relies on `signal.setitimer`, so on platforms without it
+only the .pstats file is written.
+"""
+import cProfile
+import collections
+import io
+import pstats
+import signal
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Counter, Optional, Tuple
+
+SAMPLE_INTERVAL = 0.001
+
+
+class Sampler:
+    """
+    Counts the Python stacks seen each time a CPU-time timer fires.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks: Counter[str] = collections.Counter()
+
+    @staticmethod
+    def available() -> bool:
+        return hasattr(signal, "setitimer")
+
+    def run(self, func: Callable, *args) -> Any:
+        """
+        Call `func(*args)` while sampling.  Only frames below this call are recorded.
+        """
+        previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            return func(*args)
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, previous)
+
+    def write_collapsed(self, path: Path) -> None:
+        with open(path, "w") as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+    def _sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        names = []
+        while frame is not None and frame.f_code is not Sampler.run.__code__:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+            frame = frame.f_back
+        if names:
+            self.stacks[";".join(reversed(names))] += 1
+
+
+def profiled(path: Path, func: Callable, *args) -> Tuple[Any, Path]:
+    """
+    Call `func(*args)` under cProfile and the sampler, and write the results next to `path`.
+
+    :param path: Where to write the profile, without a suffix.  Missing directories are created.
+    :param func: The function to profile.
+    :return: What `func` returned and the path of the .pstats file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sampler = Sampler() if Sampler.available() else None
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        if sampler:
+            result = sampler.run(func, *args)
+        else:
+            result = func(*args)
+    finally:
+        profile.disable()
+
+    stats_path = path.with_suffix(".pstats")
+    profile.dump_stats(stats_path)
+    if sampler:
+        sampler.write_collapsed(path.with_suffix(".collapsed"))
+    return result, stats_path
+
+
+def summary(stats_path: Path, top: int, sort: str = "tottime") -> str:
+    """
+    The `top` most expensive functions in a .pstats file, as printed by `pstats`.
+    """
+    out = io.StringIO()
+    stats = pstats.Stats(str(stats_path), stream=out)
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+    return out.getvalue()
@@ -0,0 +1,385 @@
+"""
+Run puzzle solutions in-process and time them.
+
+Each solution file under `puzzles/<year>/<day>/` exposes `solve(data)`, where `data` is the input file,
+memory-mapped by `aoc.inputs.mapped()` rather than read into memory.  A solution that has a separate
+parsing step can also expose `parse(data)`, in which case `solve` is handed whatever `parse` returned
+instead of the input.  Keeping the two apart lets the runner report how long each step takes.
+
+The parts of a day are run together.  When they use the same parse function (typically by importing it
+from a helper module in the puzzle directory), each input is only parsed once and the model is handed to
+every part, so a solve that shares its parse this way must leave the model unchanged.
+
+Solutions are imported with their own directory at the front of `sys.path`, so they can keep importing
+sibling modules (`crucible`, `day11utils`, ...) the same way they do when run as scripts.
+
+Answers are cached on disk, keyed on the input and the puzzle's source (see `aoc.cache`), so re-running
+a solution that hasn't changed returns its previous answer straight away.
+
+With a profile directory, each part is run under `aoc.profiling` and its .pstats and collapsed-stack
+files are written there.  Profiled runs skip the cache, since there would be nothing to profile.
+
+Any search counters a solution records through `aoc.metrics` are collected on its result.  Whether they
+are counted at all (see `aoc.metrics.enabled`), like the progress output below, is left to the caller.
+
+Progress output from the solutions (see `aoc.log`) is left to the caller to switch off.
+
+Parts can also be spread across a pool of worker processes.  The total time of every successful run is
+kept in a timings file, and parallel runs start the parts that took longest last time first, so the
+slow days don't end up queued behind the fast ones.
+"""
+import dataclasses
+import importlib.util
+import json
+import math
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
+
+from aoc import inputs, log, metrics, profiling
+from aoc.cache import ResultCache
+from aoc.metrics import Metrics
+from aoc.paths import PUZZLES_DIR, STATE_DIR
+
+DEFAULT_INPUT = "input.txt"
+
+DEFAULT_TIMINGS = STATE_DIR / "timings.json"
+DEFAULT_CACHE = STATE_DIR / "cache"
+DEFAULT_PROFILES = STATE_DIR / "profiles"
+
+# solution.py, solution_part1.py, solution_part2.py, solution_part2_take2.py, ...
+SOLUTION_FILE = re.compile(r"^solution(?:_part(\d+))?(?:_(\w+))?\.py$")
+DAY_DIR = re.compile(r"^(?:day)?(\d+)_")
+
+
+@dataclasses.dataclass
+class Solution:
+    year: int
+    day: int
+    part: int
+    path: Path
+    variant: str = ""
+
+    @property
+    def directory(self) -> Path:
+        return self.path.parent
+
+    @property
+    def label(self) -> str:
+        label = f"{self.year} day {self.day:02d} part {self.part}"
+        if self.variant:
+            label += f" ({self.variant})"
+        return label
+
+    @property
+    def key(self) -> str:
+        """
+        Stable identifier for the solution, used to match up results between runs.
+        """
+        key = f"{self.year}/{self.day:02d}/part{self.part}"
+        if self.variant:
+            key += f"-{self.variant}"
+        return key
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc_puzzle_{self.year}_{self.day:02d}_{self.path.stem}"
+
+
+@dataclasses.dataclass
+class Result:
+    solution: Solution
+    answer: Any = None
+    error: Optional[str] = None
+    # None when the solution has no separate parse() step
+    parse_seconds: Optional[float] = None
+    solve_seconds: float = 0.0
+    total_seconds: float = 0.0
+    # True when the answer came from the result cache instead of running the solution
+    cached: bool = False
+    # The .pstats file, when the solution was profiled
+    profile: Optional[Path] = None
+    # True when the model was parsed for an earlier part of the same day and reused
+    parse_shared: bool = False
+    # Search counters the solution recorded (see `aoc.metrics`), empty when it didn't run
+    metrics: Metrics = dataclasses.field(default_factory=dict)
+
+
+def discover(year: Optional[int] = None, day: Optional[int] = None, part: Optional[int] = None) -> List[Solution]:
+    """
+    Find the solution files for the puzzles that match the filters, ordered by year, day and part.
+
+    :param year: Only include this year.
+    :param day: Only include this day.
+    :param part: Only include this part.
+    :return: The matching solutions.
+    """
+    solutions = []
+    for year_dir in sorted(PUZZLES_DIR.iterdir()):
+        if not year_dir.is_dir() or not year_dir.name.isdigit():
+            continue
+        if year is not None and int(year_dir.name) != year:
+            continue
+        for day_dir in sorted(year_dir.iterdir()):
+            day_match = DAY_DIR.match(day_dir.name)
+            if not day_dir.is_dir() or not day_match:
+                continue
+            if day is not None and int(day_match.group(1)) != day:
+                continue
+            for path in sorted(day_dir.glob("solution*.py")):
+                file_match = SOLUTION_FILE.match(path.name)
+                if not file_match:
+                    continue
+                # A lone solution.py is the first part
+                solution_part = int(file_match.group(1) or 1)
+                if part is not None and solution_part != part:
+                    continue
+                solutions.append(Solution(int(year_dir.name), int(day_match.group(1)), solution_part, path,
+                                          file_match.group(2) or ""))
+    solutions.sort(key=lambda s: (s.year, s.day, s.part, s.variant))
+    return solutions
+
+
+def load_module(solution: Solution) -> ModuleType:
+    """
+    Import a solution file.  Modules are cached in `sys.modules`, so each file is only executed once.
+    """
+    if solution.module_name in sys.modules:
+        return sys.modules[solution.module_name]
+
+    spec = importlib.util.spec_from_file_location(solution.module_name, solution.path)
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, str(solution.directory))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(solution.directory))
+    sys.modules[solution.module_name] = module
+    return module
+
+
+def execute(module: ModuleType, data: inputs.Buffer, models: Optional[Dict[Callable, Any]] = None) \
+        -> Tuple[Any, Optional[float], float]:
+    """
+    Call a loaded solution's parse() (if it has one) and solve() on an input.
+
+    :param models: Models already parsed from this input, keyed by parse function.  If the module's parse
+                   is in here it isn't called again, otherwise its model is added.
+    :return: The answer, the seconds spent parsing (None without a parse step) and the seconds spent solving.
+    """
+    model = data
+    parse_seconds = None
+    if hasattr(module, "parse"):
+        if models is not None and module.parse in models:
+            model = models[module.parse]
+            parse_seconds = 0.0
+        else:
+            parse_start = time.perf_counter()
+            model = module.parse(data)
+            parse_seconds = time.perf_counter() - parse_start
+            if models is not None:
+                models[module.parse] = model
+    solve_start = time.perf_counter()
+    answer = module.solve(model)
+    return answer, parse_seconds, time.perf_counter() - solve_start
+
+
+def run(solution: Solution, input_name: str = DEFAULT_INPUT, cache: Optional[ResultCache] = None,
+        profile_dir: Optional[Path] = None, models: Optional[Dict[Callable, Any]] = None) -> Result:
+    """
+    Run one solution against an input file in its puzzle directory.
+
+    Failures are recorded on the result rather than raised, so one broken puzzle doesn't stop a run
+    over the whole corpus.
+
+    :param solution: The solution to run.
+    :param input_name: Name of the input file, relative to the puzzle directory.
+    :param cache: Look the answer up here first, and store it after solving.
+    :param profile_dir: Profile parsing and solving, and write the profiles to this directory.  The
+                        timings then include the profilers' overhead.
+    :param models: Models parsed by other parts of the same day, see `execute()`.
+    :return: The answer and how long parsing and solving took.  The total also covers importing the
+             module and reading the input.
+    """
+    result = Result(solution)
+    start = time.perf_counter()
+    try:
+        with inputs.mapped(solution.directory / input_name) as data:
+            if cache and not profile_dir:
+                key = cache.key(solution.key, solution.directory, data)
+                result.answer = cache.get(key)
+                result.cached = result.answer is not None
+            if not result.cached:
+                module = load_module(solution)
+                if not hasattr(module, "solve"):
+                    raise AttributeError(f"{solution.path.name} has no solve() entry point")
+                result.parse_shared = models is not None and getattr(module, "parse", None) in models
+                metrics.reset()
+                if profile_dir:
+                    profile_name = f"{solution.key.replace('/', '-')}-{Path(input_name).stem}"
+                    (result.answer, result.parse_seconds, result.solve_seconds), result.profile = \
+                        profiling.profiled(profile_dir / profile_name, execute, module, data, models)
+                else:
+                    result.answer, result.parse_seconds, result.solve_seconds = execute(module, data, models)
+                result.metrics = metrics.collect()
+                if cache and not profile_dir:
+                    cache.put(key, result.answer)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.total_seconds = time.perf_counter() - start
+    return result
+
+
+def run_day(solutions: List[Solution], input_name: str = DEFAULT_INPUT, cache: Optional[ResultCache] = None,
+            profile_dir: Optional[Path] = None) -> Iterator[Result]:
+    """
+    Run the parts of one day in order, parsing the input once for parts that share a parse function.
+
+    :param solutions: The parts to run, all from the same puzzle directory.
+    :return: Each part's result as soon as it is done.
+    """
+    models: Dict[Callable, Any] = {}
+    for solution in solutions:
+        yield run(solution, input_name, cache, profile_dir, models)
+
+
+def group_by_day(solutions: List[Solution]) -> List[List[Solution]]:
+    """
+    Split solutions, as returned by `discover()`, into one list per day.
+    """
+    days: Dict[Path, List[Solution]] = {}
+    for solution in solutions:
+        days.setdefault(solution.directory, []).append(solution)
+    return list(days.values())
+
+
+def run_parallel(solutions: List[Solution], input_name: str = DEFAULT_INPUT, jobs: Optional[int] = None,
+                 timings: Optional[Dict[str, float]] = None, cache: Optional[ResultCache] = None,
+                 profile_dir: Optional[Path] = None) -> Iterator[Result]:
+    """
+    Run solutions in a pool of worker processes, yielding results as soon as they are done.
+
+    Each day is one job, so its parts can share a parsed model.  Jobs are submitted longest-expected-first,
+    using the timings from previous runs.  Days with a part that has never been timed are assumed to be
+    slow and go first.  With the slowest jobs started early, the whole run takes about as long as the
+    slowest single day rather than the sum of all of them.
+
+    Like `run()`, failures end up on the results instead of stopping the run, including a worker process
+    dying outright.
+
+    :param solutions: The solutions to run.
+    :param input_name: Name of the input file, relative to each puzzle directory.
+    :param jobs: Number of worker processes, defaults to the number of CPUs.
+    :param timings: Seconds each solution took last time, keyed by `timing_key()`.
+    :param cache: Result cache shared by the workers.
+    :param profile_dir: Where to write profiles, if the solutions should be profiled.
+    :return: The results, in the order they finish.
+    """
+    timings = timings or {}
+
+    def expected_seconds(day: List[Solution]) -> float:
+        return sum(timings.get(timing_key(solution, input_name), math.inf) for solution in day)
+
+    ordered = sorted(group_by_day(solutions), key=expected_seconds, reverse=True)
+    unfinished = yield from _run_pool(ordered, jobs, input_name, cache, profile_dir)
+    # A worker died (killed for running out of memory, say) and took every day that hadn't finished with
+    # it.  There's no telling which day it was running, so retry the rest one at a time in a pool of their
+    # own: the day that kills its worker again is reported as failed and the others still get run.
+    for day in unfinished:
+        for _ in (yield from _run_pool([day], 1, input_name, cache, profile_dir)):
+            yield from _failed(day, "BrokenProcessPool: the worker process running it died")
+
+
+def _run_pool(days: List[List[Solution]], jobs: Optional[int], input_name: str, cache: Optional[ResultCache],
+              profile_dir: Optional[Path]) -> Generator[Result, None, List[List[Solution]]]:
+    """
+    Run days in a fresh worker pool, yielding their results as they finish.
+
+    :return: The days that didn't finish because the pool broke.
+    """
+    unfinished = []
+    # Workers get the same output and counting settings as this process, however they are started
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_configure_worker,
+                             initargs=(log.verbose, metrics.enabled)) as pool:
+        futures = {pool.submit(_run_day_in_worker, day, input_name, cache, profile_dir): day for day in days}
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except BrokenProcessPool:
+                unfinished.append(futures[future])
+                continue
+            except Exception as e:
+                # E.g. a result that couldn't be sent back from the worker
+                results = _failed(futures[future], f"{type(e).__name__}: {e}")
+            yield from results
+    # Keep the longest-expected-first order for the retries
+    return sorted(unfinished, key=days.index)
+
+
+def _failed(day: List[Solution], error: str) -> List[Result]:
+    return [Result(solution, error=error) for solution in day]
+
+
+def _configure_worker(verbose: bool, counting: bool) -> None:
+    log.verbose = verbose
+    metrics.enabled = counting
+
+
+def _run_day_in_worker(solutions: List[Solution], input_name: str, cache: Optional[ResultCache],
+                       profile_dir: Optional[Path]) -> List[Result]:
+    # Generators can't be sent back from a worker process
+    return list(run_day(solutions, input_name, cache, profile_dir))
+
+
+def timing_key(solution: Solution, input_name: str) -> str:
+    return f"{solution.key}/{input_name}"
+
+
+def load_timings(path: Path = DEFAULT_TIMINGS) -> Dict[str, float]:
+    if not path.is_file():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_timings(results: Iterable[Result], input_name: str, path: Path = DEFAULT_TIMINGS) -> None:
+    """
+    Record the total time of each solution that was actually run, keeping the timings of the others.
+    """
+    timings = load_timings(path)
+    for result in results:
+        if not result.error and not result.cached and not result.profile:
+            timings[timing_key(result.solution, input_name)] = result.total_seconds
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(dict(sorted(timings.items())), f, indent=2)
+        f.write("\n")
+
+
+def format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_result(result: Result) -> str:
+    if result.error:
+        return f"{result.solution.label}: {result.error}"
+    answer = str(result.answer)
+    if "\n" in answer:
+        # Multi-line answers (e.g. letters drawn on a screen) go below the timings
+        answer = "\n" + answer
+    if result.cached:
+        return f"{result.solution.label}: cached, total {format_seconds(result.total_seconds)} -> {answer}"
+    parse = "shared" if result.parse_shared else format_seconds(result.parse_seconds)
+    return f"{result.solution.label}: " \
+           f"parse {parse}, " \
+           f"solve {format_seconds(result.solve_seconds)}, " \
+           f"total {format_seconds(result.total_seconds)} -> {answer}"
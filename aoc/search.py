@@ -0,0 +1,367 @@
+"""
+Shortest-path searches over graphs whose nodes are the integers 0 to `num_nodes - 1`.
+
+The caller supplies the graph as a function: `neighbors(node)` for the unweighted searches and
+`edges(node)`, yielding (node, cost) pairs, for the weighted ones.  Grids fit this directly, since a
+`Grid` cell's index into its buffer is already an integer and the PAD border keeps every neighbor's
+index in range.  Other graphs just number their nodes first.
+
+Distances and predecessors are kept in flat `array('q')` tables indexed by node, rather than dicts or
+sets of tuples, and the queues only ever hold node ids.
+
+* `bfs()` / `multi_source_bfs()` - unweighted, with a deque.
+* `zero_one_bfs()` - edges that cost 0 or 1, with a deque: 0-cost moves go on the front.
+* `dijkstra()` - non-negative weights, with a binary heap.  Entries whose distance has since been
+  improved are left in the heap and skipped when popped.
+* `dial()` - Dijkstra for small integer costs, with a list of buckets indexed by distance in place of
+  the heap, so taking the nearest node is a list walk rather than a heap pop.
+* `astar()` - Dijkstra ordered by distance plus a heuristic, which must never overestimate the remaining
+  distance for the answer to stay optimal.
+
+Every search can stop as soon as it takes a node that satisfies `goal` off its queue, and records its
+work in the `aoc.metrics` counters named after it unless given counters of its own.  An edge to a node
+that has already been reached at least as cheaply counts as a dedup hit.  When counting is off (and no
+counters are given) each search runs a copy of its loop that doesn't count at all, chosen once per call.
+"""
+import dataclasses
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from aoc import metrics
+
+# Distance of a node that hasn't been reached
+UNREACHED = 2 ** 63 - 1
+NO_PREV = -1
+
+Neighbors = Callable[[int], Iterable[int]]
+Edges = Callable[[int], Iterable[Tuple[int, int]]]
+Goal = Callable[[int], bool]
+
+
+@dataclasses.dataclass
+class Search:
+    # Shortest distance to each node, or UNREACHED
+    dist: array
+    # The node each node was reached from, or NO_PREV for the sources and unreached nodes
+    prev: array
+    # The goal node the search stopped at, if it was given a goal and found one
+    found: Optional[int] = None
+
+    def reached(self, node: int) -> bool:
+        return self.dist[node] != UNREACHED
+
+    def path(self, node: int) -> List[int]:
+        """
+        The nodes on the shortest path from a source to `node`, in order.
+        """
+        nodes = [node]
+        while self.prev[node] != NO_PREV:
+            node = self.prev[node]
+            nodes.append(node)
+        return nodes[::-1]
+
+
+def bfs(num_nodes: int, source: int, neighbors: Neighbors, goal: Optional[Goal] = None,
+        stats: Optional[metrics.SearchCounters] = None) -> Search:
+    """
+    Breadth-first search from a single node.
+
+    :param num_nodes: Node ids are 0 up to but not including this.
+    :param source: The node to start from.
+    :param neighbors: The nodes one step away from a node.
+    :param goal: Stop as soon as a node that satisfies this is dequeued.
+    :param stats: Counters to fill in, instead of the ones `aoc.metrics` keeps for "bfs".
+    :return: The number of steps to every node reached.
+    """
+    return multi_source_bfs(num_nodes, [source], neighbors, goal, stats)
+
+
+def multi_source_bfs(num_nodes: int, sources: Iterable[int], neighbors: Neighbors, goal: Optional[Goal] = None,
+                     stats: Optional[metrics.SearchCounters] = None) -> Search:
+    """
+    Breadth-first search from every source at once, so each node's distance is the number of steps from
+    whichever source is closest.  Running this once is the same as a `bfs()` from each source and taking
+    the minimum, but visits each node once instead of once per source.
+    """
+    if stats is None:
+        stats = metrics.counters("bfs")
+    dist = array('q', [UNREACHED]) * num_nodes
+    prev = array('q', [NO_PREV]) * num_nodes
+    q = deque()
+    for source in sources:
+        if dist[source] == UNREACHED:
+            dist[source] = 0
+            q.append(source)
+    if stats is None:
+        return _bfs(dist, prev, q, neighbors, goal)
+    stats.pushed += len(q)
+    stats.frontier(len(q))
+
+    while q:
+        node = q.popleft()
+        stats.expanded += 1
+        if goal is not None and goal(node):
+            return Search(dist, prev, node)
+        next_dist = dist[node] + 1
+        for neighbor in neighbors(node):
+            if dist[neighbor] != UNREACHED:
+                stats.dedup_hits += 1
+                continue
+            dist[neighbor] = next_dist
+            prev[neighbor] = node
+            q.append(neighbor)
+            stats.pushed += 1
+        stats.frontier(len(q))
+    return Search(dist, prev)
+
+
+def _bfs(dist: array, prev: array, q: deque, neighbors: Neighbors, goal: Optional[Goal]) -> Search:
+    # multi_source_bfs() without the counting
+    while q:
+        node = q.popleft()
+        if goal is not None and goal(node):
+            return Search(dist, prev, node)
+        next_dist = dist[node] + 1
+        for neighbor in neighbors(node):
+            if dist[neighbor] == UNREACHED:
+                dist[neighbor] = next_dist
+                prev[neighbor] = node
+                q.append(neighbor)
+    return Search(dist, prev)
+
+
+def zero_one_bfs(num_nodes: int, sources: Iterable[int], edges: Edges, goal: Optional[Goal] = None,
+                 stats: Optional[metrics.SearchCounters] = None) -> Search:
+    """
+    Shortest paths when every edge costs 0 or 1.  Nodes reached by a free edge go on the front of the
+    deque and the rest on the back, so the deque stays sorted by distance without a heap.
+    """
+    if stats is None:
+        stats = metrics.counters("zero_one_bfs")
+    dist = array('q', [UNREACHED]) * num_nodes
+    prev = array('q', [NO_PREV]) * num_nodes
+    q = deque()
+    for source in sources:
+        dist[source] = 0
+        q.append((0, source))
+    if stats is None:
+        return _zero_one_bfs(dist, prev, q, edges, goal)
+    stats.pushed += len(q)
+    stats.frontier(len(q))
+
+    while q:
+        node_dist, node = q.popleft()
+        if node_dist > dist[node]:
+            # Reached more cheaply since this entry was added
+            continue
+        stats.expanded += 1
+        if goal is not None and goal(node):
+            return Search(dist, prev, node)
+        for neighbor, cost in edges(node):
+            neighbor_dist = node_dist + cost
+            if neighbor_dist < dist[neighbor]:
+                dist[neighbor] = neighbor_dist
+                prev[neighbor] = node
+                if cost == 0:
+                    q.appendleft((neighbor_dist, neighbor))
+                else:
+                    q.append((neighbor_dist, neighbor))
+                stats.pushed += 1
+            else:
+                stats.dedup_hits += 1
+        stats.frontier(len(q))
+    return Search(dist, prev)
+
+
+def _zero_one_bfs(dist: array, prev: array, q: deque, edges: Edges, goal: Optional[Goal]) -> Search:
+    # zero_one_bfs() without the counting
+    while q:
+        node_dist, node = q.popleft()
+        if node_dist > dist[node]:
+            continue
+        if goal is not None and goal(node):
+            return Search(dist, prev, node)
+        for neighbor, cost in edges(node):
+            neighbor_dist = node_dist + cost
+            if neighbor_dist < dist[neighbor]:
+                dist[neighbor] = neighbor_dist
+                prev[neighbor] = node
+                if cost == 0:
+                    q.appendleft((neighbor_dist, neighbor))
+                else:
+                    q.append((neighbor_dist, neighbor))
+    return Search(dist, prev)
+
+
+def dijkstra(num_nodes: int, sources: Iterable[int], edges: Edges, goal: Optional[Goal] = None,
+             stats: Optional[metrics.SearchCounters] = None) -> Search:
+    """
+    Shortest paths from the nearest source when edges have non-negative costs.
+
+    :param edges: (node, cost) for every edge out of a node.
+    """
+    if stats is None:
+        stats = metrics.counters("dijkstra")
+    return _best_first(num_nodes, sources, edges, None, goal, stats)
+
+
+def dial(num_nodes: int, sources: Iterable[int], edges: Edges, goal: Optional[Goal] = None,
+         stats: Optional[metrics.SearchCounters] = None) -> Search:
+    """
+    `dijkstra()` for edges with small non-negative integer costs.  Nodes are queued in a bucket per
+    distance and the buckets are emptied in order, so there is no heap to keep sorted.  There is one
+    bucket for every distance up to the furthest node reached, so this only pays off when the distances
+    stay small, a few times the number of nodes at most.
+
+    :param edges: (node, cost) for every edge out of a node.
+    """
+    if stats is None:
+        stats = metrics.counters("dial")
+    dist = array('q', [UNREACHED]) * num_nodes
+    prev = array('q', [NO_PREV]) * num_nodes
+    buckets = [[]]
+    for source in sources:
+        dist[source] = 0
+        buckets[0].append(source)
+    if stats is None:
+        return _dial(dist, prev, buckets, edges, goal)
+    queued = len(buckets[0])
+    stats.pushed += queued
+    stats.frontier(queued)
+
+    node_dist = 0
+    while node_dist < len(buckets):
+        for node in buckets[node_dist]:
+            queued -= 1
+            if node_dist > dist[node]:
+                # Stale entry, the node was queued again with a lower distance
+                continue
+            stats.expanded += 1
+            if goal is not None and goal(node):
+                return Search(dist, prev, node)
+            for neighbor, cost in edges(node):
+                neighbor_dist = node_dist + cost
+                if neighbor_dist < dist[neighbor]:
+                    dist[neighbor] = neighbor_dist
+                    prev[neighbor] = node
+                    while len(buckets) <= neighbor_dist:
+                        buckets.append([])
+                    buckets[neighbor_dist].append(neighbor)
+                    queued += 1
+                    stats.pushed += 1
+                else:
+                    stats.dedup_hits += 1
+            stats.frontier(queued)
+        # Nothing can be queued at a distance that has already been passed
+        buckets[node_dist] = None
+        node_dist += 1
+    return Search(dist, prev)
+
+
+def _dial(dist: array, prev: array, buckets: List[list], edges: Edges, goal: Optional[Goal]) -> Search:
+    # dial() without the counting
+    node_dist = 0
+    while node_dist < len(buckets):
+        for node in buckets[node_dist]:
+            if node_dist > dist[node]:
+                continue
+            if goal is not None and goal(node):
+                return Search(dist, prev, node)
+            for neighbor, cost in edges(node):
+                neighbor_dist = node_dist + cost
+                if neighbor_dist < dist[neighbor]:
+                    dist[neighbor] = neighbor_dist
+                    prev[neighbor] = node
+                    while len(buckets) <= neighbor_dist:
+                        buckets.append([])
+                    buckets[neighbor_dist].append(neighbor)
+        buckets[node_dist] = None
+        node_dist += 1
+    return Search(dist, prev)
+
+
+def astar(num_nodes: int, sources: Iterable[int], edges: Edges, heuristic: Callable[[int], int],
+          goal: Optional[Goal] = None, stats: Optional[metrics.SearchCounters] = None) -> Search:
+    """
+    Dijkstra that looks at the nodes that seem closest to the goal first.
+
+    :param heuristic: A lower bound on the distance from a node to the nearest goal.
+    """
+    if stats is None:
+        stats = metrics.counters("astar")
+    return _best_first(num_nodes, sources, edges, heuristic, goal, stats)
+
+
+def _best_first(num_nodes: int, sources: Iterable[int], edges: Edges, heuristic: Optional[Callable[[int], int]],
+                goal: Optional[Goal], stats: Optional[metrics.SearchCounters]) -> Search:
+    dist = array('q', [UNREACHED]) * num_nodes
+    prev = array('q', [NO_PREV]) * num_nodes
+    # Entries are (priority, distance, node).  Without a heuristic the priority is the distance.
+    q = []
+    for source in sources:
+        dist[source] = 0
+        heappush(q, (heuristic(source) if heuristic else 0, 0, source))
+    if stats is None:
+        if heuristic is None:
+            return _dijkstra(dist, prev, q, edges, goal)
+        return _astar(dist, prev, q, edges, heuristic, goal)
+    stats.pushed += len(q)
+    stats.frontier(len(q))
+
+    while q:
+        _, node_dist, node = heappop(q)
+        if node_dist > dist[node]:
+            # Stale entry, the node was pushed again with a lower distance
+            continue
+        stats.expanded += 1
+        if goal is not None and goal(node):
+            return Search(dist, prev, node)
+        for neighbor, cost in edges(node):
+            neighbor_dist = node_dist + cost
+            if neighbor_dist < dist[neighbor]:
+                dist[neighbor] = neighbor_dist
+                prev[neighbor] = node
+                priority = neighbor_dist + heuristic(neighbor) if heuristic else neighbor_dist
+                heappush(q, (priority, neighbor_dist, neighbor))
+                stats.pushed += 1
+            else:
+                stats.dedup_hits += 1
+        stats.frontier(len(q))
+    return Search(dist, prev)
+
+
+def _dijkstra(dist: array, prev: array, q: list, edges: Edges, goal: Optional[Goal]) -> Search:
+    # _best_first() without a heuristic or the counting
+    while q:
+        _, node_dist, node = heappop(q)
+        if node_dist > dist[node]:
+            continue
+        if goal is not None and goal(node):
+            return Search(dist, prev, node)
+        for neighbor, cost in edges(node):
+            neighbor_dist = node_dist + cost
+            if neighbor_dist < dist[neighbor]:
+                dist[neighbor] = neighbor_dist
+                prev[neighbor] = node
+                heappush(q, (neighbor_dist, neighbor_dist, neighbor))
+    return Search(dist, prev)
+
+
+def _astar(dist: array, prev: array, q: list, edges: Edges, heuristic: Callable[[int], int],
+           goal: Optional[Goal]) -> Search:
+    # _best_first() with a heuristic, without the counting
+    while q:
+        _, node_dist, node = heappop(q)
+        if node_dist > dist[node]:
+            continue
+        if goal is not None and goal(node):
+            return Search(dist, prev, node)
+        for neighbor, cost in edges(node):
+            neighbor_dist = node_dist + cost
+            if neighbor_dist < dist[neighbor]:
+                dist[neighbor] = neighbor_dist
+                prev[neighbor] = node
+                heappush(q, (neighbor_dist + heuristic(neighbor), neighbor_dist, neighbor))
+    return Search(dist, prev)
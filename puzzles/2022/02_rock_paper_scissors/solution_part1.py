@@ -1,3 +1,6 @@
+from aoc import inputs
+
+
 ROCK = 'ROCK'
 PAPER = 'PAPER'
 SCISSORS = 'SCISSORS'
@@ -21,14 +24,18 @@ MAPPINGS = {
 
 
 def main():
-    with open("input.txt") as f:
-        total_points = 0
-        for line in f.readlines():
-            parts = line.replace('\n', '').split(" ")
-            opponent = MAPPINGS[parts[0]]
-            you = MAPPINGS[parts[1]]
-            total_points += play_round(you, opponent)
-        print(total_points)
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    total_points = 0
+    for line in inputs.text(data).splitlines():
+        parts = line.replace('\n', '').split(" ")
+        opponent = MAPPINGS[parts[0]]
+        you = MAPPINGS[parts[1]]
+        total_points += play_round(you, opponent)
+    return total_points
 
 
 def play_round(you: str, opponent: str) -> int:
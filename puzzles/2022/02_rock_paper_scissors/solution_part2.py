@@ -1,3 +1,6 @@
+from aoc import inputs
+
+
 WIN = 'WIN'
 DRAW = 'DRAW'
 LOSE = 'LOSE'
@@ -30,15 +33,19 @@ WLD_MAPPINGS = {
 
 
 def main():
-    with open("input.txt") as f:
-        total_points = 0
-        for line in f.readlines():
-            parts = line.replace('\n', '').split(" ")
-            opponent = MAPPINGS[parts[0]]
-            outcome = WLD_MAPPINGS[parts[1]]
-            you = determine_play(opponent, outcome)
-            total_points += play_round(you, opponent)
-        print(total_points)
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    total_points = 0
+    for line in inputs.text(data).splitlines():
+        parts = line.replace('\n', '').split(" ")
+        opponent = MAPPINGS[parts[0]]
+        outcome = WLD_MAPPINGS[parts[1]]
+        you = determine_play(opponent, outcome)
+        total_points += play_round(you, opponent)
+    return total_points
 
 
 def determine_play(opponent: str, outcome: str) -> str:
@@ -1,3 +1,6 @@
+from aoc import inputs
+
+
 def priority(item: str) -> int:
     """
     Determine the priority of an item in the rucksack.
@@ -30,5 +33,10 @@ def process_line(line: str) -> int:
     return priority(intersection.pop())
 
 
-with open('input.txt') as f:
-    print(sum([process_line(line.strip()) for line in f.readlines()]))
+def solve(data: bytes) -> int:
+    return sum([process_line(line.strip()) for line in inputs.text(data).splitlines()])
+
+
+if __name__ == '__main__':
+    with open('input.txt', 'rb') as f:
+        print(solve(f.read()))
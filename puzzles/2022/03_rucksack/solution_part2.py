@@ -1,5 +1,7 @@
 from typing import List
 
+from aoc import inputs
+
 
 def priority(item: str) -> int:
     """
@@ -45,13 +47,18 @@ def process_group(bags_for_group: List[str]) -> int:
     return priority(badge_item)
 
 
-with open('input.txt') as f:
+def solve(data: bytes) -> int:
     group = []
     total_priorities = 0
-    for line in f.readlines():
+    for line in inputs.text(data).splitlines():
         group.append(line.strip())
         if len(group) == 3:
             total_priorities += process_group(group)
             group = []
 
-    print(total_priorities)
+    return total_priorities
+
+
+if __name__ == '__main__':
+    with open('input.txt', 'rb') as f:
+        print(solve(f.read()))
@@ -1,5 +1,7 @@
 from typing import Set
 
+from aoc import inputs
+
 
 def range_as_set(r: str) -> Set[int]:
     """
@@ -14,9 +16,9 @@ def range_as_set(r: str) -> Set[int]:
     return {x for x in range(start, end)}
 
 
-with open('input.txt') as f:
+def solve(data: bytes) -> int:
     fully_contained = 0
-    for line in f.readlines():
+    for line in inputs.text(data).splitlines():
         parts = line.strip().split(',')
         range1 = range_as_set(parts[0])
         range2 = range_as_set(parts[1])
@@ -24,4 +26,9 @@ with open('input.txt') as f:
         if len(intersection) > 0:
             fully_contained += 1
 
-    print(fully_contained)
+    return fully_contained
+
+
+if __name__ == '__main__':
+    with open('input.txt', 'rb') as f:
+        print(solve(f.read()))
@@ -1,45 +1,24 @@
-import re
+from typing import List, Tuple
 
-with open('input.txt') as f:
-    processed_crates = False
-    stacks = None
-    for line in f.readlines():
-        stripped = line.strip()
-        if stripped.find('1   2') > -1:
-            processed_crates = True
-            for s in stacks:
-                s.reverse()
-            continue
-        if stripped == '':
-            continue
+from stacks import parse
 
-        if processed_crates:
-            result = re.search('move (\d+) from (\d+) to (\d+)', stripped)
-            amount = int(result.group(1))
-            from_stack = int(result.group(2)) - 1
-            to_stack = int(result.group(3)) - 1
+# The runner's entry points.  parse comes from stacks, so both parts share one parsed model.
+__all__ = ["parse", "solve"]
 
-            for i in range(0, amount):
-                stacks[to_stack].append(stacks[from_stack].pop())
-        else:
-            crates = stripped \
-                .replace('    ', ' [-]') \
-                .split(' ')
 
-            # Initialize our stacks now that we know how many crates there are
-            if not stacks:
-                stacks = [[] for _ in crates]
-
-            idx = 0
-            for crate in crates:
-                letter = crate[1:2]
-                if letter == '-':
-                    idx += 1
-                    continue
-                stacks[idx].append(letter)
-                idx += 1
+def solve(model: Tuple[List[List[str]], List[Tuple[int, int, int]]]) -> str:
+    stacks, moves = model
+    stacks = [list(stack) for stack in stacks]
+    for amount, from_stack, to_stack in moves:
+        for i in range(0, amount):
+            stacks[to_stack].append(stacks[from_stack].pop())
 
     answer = ''
     for stack in stacks:
         answer += stack[-1]
-    print(answer)
+    return answer
+
+
+if __name__ == '__main__':
+    with open('input.txt', 'rb') as f:
+        print(solve(parse(f.read())))
@@ -0,0 +1,54 @@
+"""
+The starting stacks of crates and the crane's moves, shared by both parts.
+"""
+import re
+from typing import List, Tuple
+
+from aoc import inputs
+
+
+def parse(data: bytes) -> Tuple[List[List[str]], List[Tuple[int, int, int]]]:
+    """
+    Read the starting stacks of crates and the list of moves.
+
+    :param data: The puzzle input.
+    :return: The stacks, bottom crate first, and each move as (amount, from stack, to stack).
+    """
+    processed_crates = False
+    stacks = None
+    moves = []
+    for line in inputs.text(data).splitlines():
+        stripped = line.strip()
+        if stripped.find('1   2') > -1:
+            processed_crates = True
+            for s in stacks:
+                s.reverse()
+            continue
+        if stripped == '':
+            continue
+
+        if processed_crates:
+            result = re.search('move (\\d+) from (\\d+) to (\\d+)', stripped)
+            amount = int(result.group(1))
+            from_stack = int(result.group(2)) - 1
+            to_stack = int(result.group(3)) - 1
+            moves.append((amount, from_stack, to_stack))
+        else:
+            crates = stripped \
+                .replace('    ', ' [-]') \
+                .split(' ')
+
+            # Initialize our stacks now that we know how many crates there are
+            if not stacks:
+                stacks = [[] for _ in crates]
+
+            idx = 0
+            for crate in crates:
+                letter = crate[1:2]
+                if letter == '-':
+                    idx += 1
+                    continue
+                stacks[idx].append(letter)
+                idx += 1
+
+    return stacks, moves
@@ -1,9 +1,15 @@
-with open('input.txt') as f:
-    data = f.readline()
-    signal = list(data)
+from aoc import inputs
+
+
+def solve(data: bytes) -> int:
+    signal = list(inputs.text(data).splitlines()[0])
     start = 0
     while start < len(signal):
         if len(set(signal[start:start + 4])) == 4:
-            print(start + 4)
-            exit()
-        start += 1
\ No newline at end of file
+            return start + 4
+        start += 1
+
+
+if __name__ == '__main__':
+    with open('input.txt', 'rb') as f:
+        print(solve(f.read()))
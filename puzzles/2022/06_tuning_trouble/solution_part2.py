@@ -1,13 +1,21 @@
+from aoc import inputs
+
+
 MSG_LENGTH = 14
-with open('input.txt') as f:
-    data = f.readline()
-    signal = list(data)
+
+
+def solve(data: bytes) -> int:
+    signal = list(inputs.text(data).splitlines()[0])
     start = 0
     while start < len(signal):
         if len(set(signal[start:start + MSG_LENGTH])) == MSG_LENGTH:
             # Converting the list slice to a set will eliminate any duplicate letters, so if
             # taking a slice of size four and converting it to a set yields the same size,
             # we know there are no duplicate letters.
-            print(start + MSG_LENGTH)
-            exit()
-        start += 1
\ No newline at end of file
+            return start + MSG_LENGTH
+        start += 1
+
+
+if __name__ == '__main__':
+    with open('input.txt', 'rb') as f:
+        print(solve(f.read()))
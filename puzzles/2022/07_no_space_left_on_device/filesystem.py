@@ -0,0 +1,82 @@
+"""
+The directory tree replayed from the terminal output, shared by both parts.
+"""
+import dataclasses
+from typing import List, Optional
+
+from aoc import inputs
+
+
+@dataclasses.dataclass
+class File:
+    size: int
+    name: str
+
+
+@dataclasses.dataclass
+class Directory:
+    name: str
+    parent: Optional["Directory"]
+    dirs: List["Directory"]
+    files: List[File]
+
+    def find_child_dir(self, name: str) -> Optional["Directory"]:
+        for d in self.dirs:
+            if d.name == name:
+                return d
+        return None
+
+    def add_child_dir(self, dir: "Directory") -> None:
+        self.dirs.append(dir)
+
+    def add_file(self, file: File) -> None:
+        self.files.append(file)
+
+    def calc_total_size(self) -> int:
+        return sum(f.size for f in self.files) + \
+            sum(d.calc_total_size() for d in self.dirs)
+
+
+def parse(data: bytes) -> Directory:
+    """
+    Replay the terminal output to build the directory tree.
+
+    :param data: The puzzle input.
+    :return: The root directory.
+    """
+    root = Directory('/', None, [], [])
+    curr_dir = root
+    for line in inputs.text(data).splitlines():
+        trimmed = line.strip()
+        if trimmed == '$ cd /':
+            continue
+        if trimmed.startswith('$'):
+            # Command
+            cmd = trimmed.split(' ')
+            if cmd[1] == 'cd':
+                dir_name = cmd[2]
+                if dir_name == '..':
+                    curr_dir = curr_dir.parent
+                # elif dir_name == curr_dir.name:
+                #     We are already in this directory
+                    # continue
+                else:
+                    child_dir = curr_dir.find_child_dir(dir_name)
+                    if not child_dir:
+                        raise Exception(f'Could not find directory {dir_name} from {curr_dir.name}')
+                    curr_dir = child_dir
+
+            # I don't think we care if an `ls` command is issued as long as we are in the right directory
+
+        elif trimmed.startswith('dir'):
+            # Directory
+            parts = trimmed.split(' ')
+            child = Directory(parts[1], curr_dir, [], [])
+            curr_dir.add_child_dir(child)
+        else:
+            # File
+            parts = trimmed.split(' ')
+            file = File(int(parts[0]), parts[1])
+            curr_dir.add_file(file)
+
+    return root
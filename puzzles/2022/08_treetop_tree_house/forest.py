@@ -0,0 +1,8 @@
+"""
+The grid of tree heights, shared by both parts.
+"""
+from aoc.grid import Grid
+
+
+def parse(data: bytes) -> Grid:
+    return Grid.parse(data)
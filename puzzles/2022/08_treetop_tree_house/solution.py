@@ -1,56 +1,28 @@
-trees = []
-with open('input.txt') as f:
-    for line in f.readlines():
-        stripped = line.strip()
-        if stripped == '':
-            continue
-        trees.append([int(tree) for tree in list(stripped)])
+from aoc.grid import Grid
+from forest import parse
 
-visible_trees = set()
-num_cols = len(trees[0])
-num_rows = len(trees)
+# The runner's entry points.  parse comes from forest, so both parts share one parsed grid.
+__all__ = ["parse", "solve"]
 
-# look at trees from left
-r_idx = 0
-for row in trees:
-    c_idx = 0
-    tallest = None
-    for col in row:
-        if tallest is None or tallest < col:
-            visible_trees.add((r_idx, c_idx))
-            tallest = col
-        c_idx += 1
-    r_idx += 1
 
-# look at trees from right
-for i in range(0, num_rows):
-    # c_idx = 0
-    tallest = None
-    for j in range(num_cols - 1, -1, -1):
-        val = trees[i][j]
-        if tallest is None or tallest < val:
-            visible_trees.add((i, j))
-            tallest = val
-        c_idx += 1
-    r_idx += 1
+def solve(trees: Grid) -> int:
+    visible_trees = set()
 
-# look at trees from top
-for i in range(0, num_cols):
-    tallest = None
-    for j in range(0, num_rows):
-        val = trees[j][i]
-        if tallest is None or tallest < val:
-            visible_trees.add((j, i))
-            tallest = val
+    # Looking at the trees from the left of each rotation of the grid covers all four sides.  The
+    # rotated views share the grid's buffer, so the index of a cell in a view maps straight back to
+    # its coordinates in the original grid.
+    view = trees
+    for _ in range(4):
+        for r_idx in range(view.height):
+            tallest = None
+            for c_idx, val in enumerate(view.row(r_idx)):
+                if tallest is None or tallest < val:
+                    visible_trees.add(trees.coords(view.index(r_idx, c_idx)))
+                    tallest = val
+        view = view.rotated()
 
-# look at trees from top
-for i in range(0, num_cols):
-    tallest = None
-    for j in range(num_rows - 1, -1, -1):
-        val = trees[j][i]
-        if tallest is None or tallest < val:
-            visible_trees.add((j, i))
-            tallest = val
+    return len(visible_trees)
 
-print(len(visible_trees))
-print(visible_trees)
+
+if __name__ == '__main__':
+    print(solve(Grid.read('input.txt')))
@@ -1,11 +1,9 @@
-head = [0, 0]
-tail = [0, 0]
-coord_count = {
-    '0-0': 0
-}
+from typing import Dict, List
 
+from aoc import inputs
 
-def adjust_tail():
+
+def adjust_tail(head: List[int], tail: List[int], coord_count: Dict[str, int]) -> None:
     change = True
     if head[0] == tail[0] + 2 and head[1] == tail[1] + 1:
         # - - H
@@ -87,8 +85,14 @@ def adjust_tail():
             coord_count[key] = 1
 
 
-with open('input.txt') as f:
-    for line in f.readlines():
+def solve(data: bytes) -> int:
+    head = [0, 0]
+    tail = [0, 0]
+    coord_count = {
+        '0-0': 0
+    }
+
+    for line in inputs.text(data).splitlines():
         trimmed = line.strip()
         parts = trimmed.split(' ')
         direction = parts[0]
@@ -103,6 +107,11 @@ with open('input.txt') as f:
                 head[1] += 1
             else:
                 head[1] -= 1
-            adjust_tail()
+            adjust_tail(head, tail, coord_count)
+
+    return len(coord_count)
+
 
-print(len(coord_count))
+if __name__ == '__main__':
+    with open('input.txt', 'rb') as f:
+        print(solve(f.read()))
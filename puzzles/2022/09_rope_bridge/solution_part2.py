@@ -1,23 +1,9 @@
-from typing import List
-
-head = [0, 0]
-tails = [
-    [0, 0],
-    [0, 0],
-    [0, 0],
-    [0, 0],
-    [0, 0],
-    [0, 0],
-    [0, 0],
-    [0, 0],
-    [0, 0],
-]
-coord_count = {}
-for i in range(0, 9):
-    coord_count[i] = {'0-0'}
-
-
-def adjust_tail(head: List[int], tail: List[int], tail_idx: int) -> None:
+from typing import Dict, List, Set
+
+from aoc import inputs
+
+
+def adjust_tail(head: List[int], tail: List[int], tail_idx: int, coord_count: Dict[int, Set[str]]) -> None:
     """
     Adjust the provided tail based on the position of the provided head.  These are passed as parameters
     because, for part 2, any tail acts as the head of the tail behind it.
@@ -25,6 +11,7 @@ def adjust_tail(head: List[int], tail: List[int], tail_idx: int) -> None:
     :param head: The head node
     :param tail: The tail node
     :param tail_idx: Index of the tail node for updating coordinate counts
+    :param coord_count: The coordinates visited by each tail node
     """
 
     change = True
@@ -142,8 +129,14 @@ def adjust_tail(head: List[int], tail: List[int], tail_idx: int) -> None:
         coord_count[tail_idx].add(key)
 
 
-with open('input.txt') as f:
-    for line in f.readlines():
+def solve(data: bytes) -> int:
+    head = [0, 0]
+    tails = [[0, 0] for _ in range(0, 9)]
+    coord_count = {}
+    for i in range(0, 9):
+        coord_count[i] = {'0-0'}
+
+    for line in inputs.text(data).splitlines():
         trimmed = line.strip()
         parts = trimmed.split(' ')
         direction = parts[0]
@@ -161,8 +154,13 @@ with open('input.txt') as f:
 
             for idx in range(0, 9):
                 if idx == 0:
-                    adjust_tail(head, tails[idx], idx)
+                    adjust_tail(head, tails[idx], idx, coord_count)
                 else:
-                    adjust_tail(tails[idx - 1], tails[idx], idx)
+                    adjust_tail(tails[idx - 1], tails[idx], idx, coord_count)
+
+    return len(coord_count[8])
+
 
-print(len(coord_count[8]))
+if __name__ == '__main__':
+    with open('input.txt', 'rb') as f:
+        print(solve(f.read()))
@@ -1,16 +1,18 @@
-x = 1
-cycle = 1
-signal_strengths_for_cycles = {
-    1: 1
-}
-with open('input.txt') as f:
-    for line in f.readlines():
+from aoc import inputs
+
+
+def solve(data: bytes) -> int:
+    x = 1
+    cycle = 1
+    signal_strengths_for_cycles = {
+        1: 1
+    }
+    for line in inputs.text(data).splitlines(keepends=True):
         if line.find('noop') > -1:
             cycle += 1
             signal_strengths_for_cycles[cycle] = cycle * x
             continue
         parts = line.strip().split(' ')
-        op = parts[0]
         val = int(parts[1])
 
         cycle += 1
@@ -21,12 +23,16 @@ with open('input.txt') as f:
         cycle += 1
         signal_strengths_for_cycles[cycle] = cycle * x
 
-print(sum([
-    signal_strengths_for_cycles[20],
-    signal_strengths_for_cycles[60],
-    signal_strengths_for_cycles[100],
-    signal_strengths_for_cycles[140],
-    signal_strengths_for_cycles[180],
-    signal_strengths_for_cycles[220],
-]))
+    return sum([
+        signal_strengths_for_cycles[20],
+        signal_strengths_for_cycles[60],
+        signal_strengths_for_cycles[100],
+        signal_strengths_for_cycles[140],
+        signal_strengths_for_cycles[180],
+        signal_strengths_for_cycles[220],
+    ])
+
 
+if __name__ == '__main__':
+    with open('input.txt', 'rb') as f:
+        print(solve(f.read()))
@@ -1,5 +1,7 @@
 from typing import List
 
+from aoc import inputs
+
 
 def draw(screen: List[List[str]], cycle: int, x: int) -> None:
     row = (cycle - 1) // 40
@@ -10,16 +12,15 @@ def draw(screen: List[List[str]], cycle: int, x: int) -> None:
         screen[row][position] = '.'
 
 
-x = 1
-cycle = 0
+def solve(data: bytes) -> str:
+    x = 1
+    cycle = 0
 
-screen = []
-for i in range(0, 6):
-    screen.append([' ' for _ in range(0, 40)])
-crt_pointer = 1
+    screen = []
+    for i in range(0, 6):
+        screen.append([' ' for _ in range(0, 40)])
 
-with open('input.txt') as f:
-    for line in f.readlines():
+    for line in inputs.text(data).splitlines(keepends=True):
         if line == '\n':
             continue
         if line.find('noop') > -1:
@@ -27,7 +28,6 @@ with open('input.txt') as f:
             draw(screen, cycle, x)
             continue
         parts = line.strip().split(' ')
-        op = parts[0]
         val = int(parts[1])
 
         cycle += 1
@@ -37,5 +37,10 @@ with open('input.txt') as f:
         draw(screen, cycle, x)
         x += val
 
-for i in range(0, 6):
-    print(''.join(screen[i]))
+    return '\n'.join(''.join(screen[i]) for i in range(0, 6))
+
+
+if __name__ == '__main__':
+    with open('input.txt', 'rb') as f:
+        print(solve(f.read()))
+
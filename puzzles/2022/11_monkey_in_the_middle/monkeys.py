@@ -0,0 +1,67 @@
+"""
+The monkeys' notes, shared by both parts.  The notes are never changed: each part keeps its own lists of
+the items the monkeys are holding and its own inspection counts.
+"""
+import dataclasses
+from typing import List, Optional, Tuple
+
+from aoc import inputs, log
+
+
+@dataclasses.dataclass(frozen=True)
+class Monkey:
+    items: Tuple[int, ...]
+    # The operation is `old <op> operand`, where an operand of None means the old worry level again
+    op: str
+    operand: Optional[int]
+    test: int
+    true_monkey: int
+    false_monkey: int
+
+    def calc_worry_level(self, old_worry_level: int) -> int:
+        operand = old_worry_level if self.operand is None else self.operand
+        if self.op == '*':
+            return old_worry_level * operand
+        return old_worry_level + operand
+
+    def throw_to(self, worry_level: int) -> int:
+        return self.true_monkey if worry_level % self.test == 0 else self.false_monkey
+
+
+def parse(data: bytes) -> List[Monkey]:
+    monkeys = []
+    starting_items = ()
+    op = None
+    operand = None
+    test = None
+    true_monkey = None
+    for line in inputs.text(data).splitlines():
+        trimmed = line.strip()
+        if trimmed.startswith('Starting items:'):
+            items_str = trimmed[trimmed.find(':') + 1:].strip()
+            starting_items = tuple(int(x) for x in items_str.split(', ')) if items_str else ()
+        elif trimmed.startswith('Operation:'):
+            old, op, operand_str = trimmed[trimmed.find('=') + 1:].split()
+            if old != 'old' or op not in ('*', '+'):
+                raise ValueError(f'Unsupported operation: {trimmed}')
+            operand = None if operand_str == 'old' else int(operand_str)
+        elif trimmed.startswith('Test:'):
+            test = int(trimmed.split()[-1])
+        elif trimmed.startswith('If true:'):
+            true_monkey = int(trimmed.split()[-1])
+        elif trimmed.startswith('If false:'):
+            false_monkey = int(trimmed.split()[-1])
+            monkeys.append(Monkey(starting_items, op, operand, test, true_monkey, false_monkey))
+
+    return monkeys
+
+
+def monkey_business(inspections: List[int]) -> int:
+    """
+    The product of the two highest inspection counts.
+    """
+    monkey_business_factor = 1
+    for count in sorted(inspections, reverse=True)[:2]:
+        log.info(f'Inspections = {count}')
+        monkey_business_factor *= count
+    return monkey_business_factor
@@ -1,91 +1,26 @@
-import dataclasses
-import re
-from typing import List, Union
+from typing import List
 
+from monkeys import Monkey, monkey_business, parse
 
-@dataclasses.dataclass
-class Monkey:
-    items: List[int]
-    operand_1: Union[str, int]
-    op: str
-    operand_2: Union[str, int]
-    test: int
-    true_monkey: int
-    false_monkey: int
-    inspections: int = 0
+# The runner's entry points.  parse comes from monkeys, so both parts share one set of notes.
+__all__ = ["parse", "solve"]
 
-    def calc_worry_level(self, old_worry_level: int) -> Union[int, float]:
-        op1 = (old_worry_level if self.operand_1 == 'old' else self.operand_1)
-        op2 = (old_worry_level if self.operand_2 == 'old' else self.operand_2)
-        if self.op == '*':
-            return op1 * op2
-        elif self.op == '/':
-            return op1 / op2
-        elif self.op == '-':
-            return op1 - op2
-        elif self.op == '+':
-            return op1 + op2
 
-    def receive_item(self, item: int) -> None:
-        self.items.append(item)
+def solve(monkeys: List[Monkey]) -> int:
+    items = [list(monkey.items) for monkey in monkeys]
+    inspections = [0] * len(monkeys)
+    for r in range(0, 20):
+        for i, monkey in enumerate(monkeys):
+            # A monkey never throws to itself, so its own list can be emptied in one go
+            held, items[i] = items[i], []
+            for worry_level in held:
+                new_worry_level = monkey.calc_worry_level(worry_level) // 3
+                items[monkey.throw_to(new_worry_level)].append(new_worry_level)
+            inspections[i] += len(held)
 
-    def apply_test(self, new_worry_level: int) -> bool:
-        return new_worry_level % self.test == 0
+    return monkey_business(inspections)
 
-    def evaluate(self, monkeys: List["Monkey"]) -> None:
-        while self.items:
-            item = self.items.pop(0)
-            new_worry_level = self.calc_worry_level(item)
-            new_worry_level //= 3
 
-            if self.apply_test(new_worry_level):
-                monkeys[self.true_monkey].receive_item(new_worry_level)
-            else:
-                monkeys[self.false_monkey].receive_item(new_worry_level)
-            self.inspections += 1
-
-
-monkeys = []
-with open('input.txt') as f:
-    starting_items = []
-    operand_1 = None
-    op = None
-    operand_2 = None
-    test = None
-    true_monkey = None
-    false_monkey = None
-    for line in f.readlines():
-        trimmed = line.strip()
-        if trimmed.find('Starting items') > -1:
-            items_str = str(trimmed[trimmed.find(':') + 1:]).strip()
-            starting_items = [int(x) for x in items_str.split(', ')]
-        elif trimmed.find('Operation: ') > -1:
-            parts = str(trimmed[trimmed.find('=') + 1:]).strip().split(' ')
-            if parts[0] != 'old':
-                operand_1 = int(parts[0])
-            else:
-                operand_1 = parts[0]
-            if parts[2] != 'old':
-                operand_2 = int(parts[2])
-            else:
-                operand_2 = parts[0]
-            op = parts[1]
-        elif trimmed.find('Test: ') > -1:
-            test = int(str(trimmed[trimmed.find('by') + 3:]))
-        elif trimmed.find('If true') > -1:
-            true_monkey = int(str(trimmed[trimmed.find('monkey ') + 7:]))
-        elif trimmed.find('If false') > -1:
-            false_monkey = int(str(trimmed[trimmed.find('monkey ') + 7:]))
-            monkey = Monkey(starting_items, operand_1, op, operand_2, test, true_monkey, false_monkey)
-            monkeys.append(monkey)
-
-for r in range(0, 20):
-    for monkey in monkeys:
-        monkey.evaluate(monkeys)
-
-monkey_business_factor = 1
-for inspections in sorted([monkey.inspections for monkey in monkeys], reverse=True)[:2]:
-    print(f'Inspections = {inspections}')
-    monkey_business_factor *= inspections
-
-print(monkey_business_factor)
+if __name__ == '__main__':
+    with open('input.txt', 'rb') as f:
+        print(solve(parse(f.read())))
@@ -0,0 +1,47 @@
+"""
+The heightmap and the climb towards the best signal, shared by both parts.
+"""
+from typing import Iterable, Iterator, Optional, Tuple
+
+from aoc import log
+from aoc.grid import PAD, Grid
+from aoc.search import multi_source_bfs
+
+# The start is below a and the best signal is above z.  Each step can climb at most one level.
+ELEVATIONS = "SabcdefghijklmnopqrstuvwxyzE"
+LEVELS = {ord(letter): level for level, letter in enumerate(ELEVATIONS)}
+END = ord("E")
+
+
+def parse(data: bytes) -> Grid:
+    return Grid.parse(data)
+
+
+def fewest_steps(map: Grid, starts: Iterable[Tuple[int, int]]) -> Optional[int]:
+    """
+    Breadth-first search from every start at once for the best signal.
+
+    :param map: The heightmap.
+    :param starts: The squares the climb could start from.
+    :return: The fewest steps from any of the starts to the best signal, or None if it can't be reached.
+    """
+    data = map.data
+    offsets = map.offsets
+
+    def neighbors(i: int) -> Iterator[int]:
+        highest = LEVELS[data[i]] + 1
+        for offset in offsets:
+            tile = data[i + offset]
+            if tile != PAD and LEVELS[tile] <= highest:
+                yield i + offset
+
+    search = multi_source_bfs(len(data), (map.index(r, c) for r, c in starts), neighbors,
+                              lambda i: data[i] == END)
+    if search.found is None:
+        return None
+    steps = search.dist[search.found]
+    if log.verbose:
+        start_r, start_c = map.coords(search.path(search.found)[0])
+        end_r, end_c = map.coords(search.found)
+        log.info(f'Found highest point at {end_r}|{end_c} from [{start_r},{start_c}] in {steps} steps')
+    return steps
@@ -0,0 +1,25 @@
+"""
+The paths of rock scanned in the cave, shared by both parts.
+"""
+from typing import List, Tuple
+
+from aoc import inputs
+
+
+def parse(data: bytes) -> List[List[Tuple[int, int]]]:
+    paths = []
+    for line in inputs.text(data).splitlines():
+        trimmed = line.strip()
+        if trimmed == '':
+            continue
+
+        parts = trimmed.split(' -> ')
+        path = []
+        for part in parts:
+            x_y_pairs = part.split(',')
+            x = int(x_y_pairs[0])
+            y = int(x_y_pairs[1])
+            path.append((x, y))
+        paths.append(path)
+
+    return paths
@@ -0,0 +1,29 @@
+"""
+The sensors and the beacon each of them picked up, shared by both parts.
+"""
+from typing import Dict, Set, Tuple
+
+from aoc import inputs
+
+
+def parse(data: bytes) -> Tuple[Set[Tuple[int, int]], Set[Tuple[int, int]], Dict[Tuple[int, int], Tuple[int, int]]]:
+    """
+    Read the sensors and the beacon closest to each of them.
+
+    :param data: The puzzle input.
+    :return: The sensor coordinates, the beacon coordinates, and the closest beacon for each sensor.
+    """
+    sensors = set()
+    beacons = set()
+    closest = {}
+    # Every line is "Sensor at x=.., y=..: closest beacon is at x=.., y=..", so the numbers come in fours
+    numbers = inputs.ints(data)
+    for i in range(0, len(numbers), 4):
+        sensor_x, sensor_y, beacon_x, beacon_y = numbers[i:i + 4]
+        sensor = (sensor_x, sensor_y)
+        beacon = (beacon_x, beacon_y)
+        sensors.add(sensor)
+        beacons.add(beacon)
+        closest[sensor] = beacon
+
+    return sensors, beacons, closest
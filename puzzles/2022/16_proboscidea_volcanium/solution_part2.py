@@ -0,0 +1,22 @@
+import time
+
+from valves import DEFAULT_GRAPH_CACHE, ValveGraph, max_pressure_with_elephant, parse
+
+# The runner's entry points.  parse comes from valves, so both parts share one built graph.
+__all__ = ["parse", "solve"]
+
+# Teaching an elephant takes four of the thirty minutes
+MINUTES = 26
+
+
+def solve(graph: ValveGraph) -> int:
+    return max_pressure_with_elephant(graph, MINUTES)
+
+
+if __name__ == '__main__':
+    for filename in ['input.txt', 'reddit_tc1.txt', 'reddit_tc2.txt', 'reddit_tc3.txt']:
+        start = time.time()
+        with open(filename, 'rb') as f:
+            # Keep the built graph under .aoc/, so the next run goes straight to the search
+            graph = ValveGraph.parse(f.read(), DEFAULT_GRAPH_CACHE)
+        print(f'{filename}: {solve(graph)} ({time.time() - start} seconds)')
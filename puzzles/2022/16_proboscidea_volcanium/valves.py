@@ -0,0 +1,389 @@
+"""
+The valve scan, compressed down to the valves worth opening, and the search for the best plan.
+
+Most valves have a flow rate of 0 and are only ever walked through, so `ValveGraph` reduces the tunnels
+to the valves with flow plus the starting valve, with the shortest walking time between every pair of
+them found by a BFS from each one.  `ValveGraph.parse()` can also save built graphs by a hash of the input
+(under .aoc/ when run as a script), so trying the optimizers on the same scan again starts straight from
+the distances.  The runner and `bench` don't ask for that, so they time the real graph build.
+
+Which of the useful valves are open is then a bitmask, bit i for useful valve i.  A single agent's best
+plan can be found two ways, which always agree:
+
+* `DP` - a memoized DP over (position, minutes left, opened valves) that only ever jumps straight to a
+  closed valve and opens it.  It fills in every state it can reach, which grows with the subsets of the
+  useful valves that fit in the time: about 9,000 on the real input, but about 130,000 on
+  reddit_tc3.txt, where fifteen valves of flow 2 and 10 in turn sit round a ring.  That takes about half a
+  second, so the DP is the slow mode and is kept to check the other one against.
+* `BRANCH_AND_BOUND` - a depth-first search over the same moves that skips every branch whose upper bound
+  can't beat the best plan found so far.  It visits a few hundred states on each of these inputs, and
+  is what the runner uses.
+
+With the elephant helping, the two agents open disjoint sets of valves.  One forward pass finds the best
+pressure a single agent gets from opening exactly each subset, a max-over-subsets transform turns that
+into the best from any subset of each mask, and the answer is the best subset plus the best of what's
+left, found in one scan over the subsets instead of one per pair.
+"""
+import hashlib
+import json
+import os
+import re
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aoc import inputs, metrics
+from aoc.paths import STATE_DIR
+from aoc.search import bfs
+
+p = re.compile('Valve ([A-Z]+) has flow rate=(\\d+); tunnels? leads? to valves? (.+)')
+
+Valve = namedtuple('Valve', ['name', 'flow', 'tunnels'])
+
+START = 'AA'
+
+# Ways of finding the best plan for a single agent
+DP = 'dp'
+BRANCH_AND_BOUND = 'branch_and_bound'
+MODES = [DP, BRANCH_AND_BOUND]
+
+# Where the scripts keep built graphs, one JSON file per input
+DEFAULT_GRAPH_CACHE = STATE_DIR / "valve_graphs"
+# Bump when the cached format changes, so old files are ignored rather than misread
+GRAPH_CACHE_VERSION = 1
+
+
+class ValveGraph:
+    """
+    The tunnels as an adjacency matrix over valve ids (the order the valves are listed in the scan), and
+    the walking time between the valves that matter.
+
+    `dist[i][j]` is the minutes needed to walk from useful valve i to useful valve j, where the useful
+    valves are the ones with flow, numbered in scan order.  One extra row, `dist[origin]`, is from the
+    starting valve.  The optimizers only ever use these, so they never look at a tunnel.
+    """
+
+    def __init__(self, names: List[str], flows: List[int], adjacency: List[bytearray],
+                 dist: Optional[List[List[int]]] = None):
+        self.names = names
+        self.flows = flows
+        self.adjacency = adjacency
+        # Ids of the valves with flow, in bit order
+        self.useful = [valve for valve, flow in enumerate(flows) if flow > 0]
+        self.dist = dist if dist is not None else self._shortest_paths()
+
+    @classmethod
+    def from_valves(cls, valves: Dict[str, Valve]) -> "ValveGraph":
+        ids = {name: i for i, name in enumerate(valves)}
+        adjacency = [bytearray(len(ids)) for _ in ids]
+        for valve in valves.values():
+            for tunnel in valve.tunnels:
+                adjacency[ids[valve.name]][ids[tunnel]] = 1
+        return ValveGraph(list(valves), [valve.flow for valve in valves.values()], adjacency)
+
+    @classmethod
+    def parse(cls, data: bytes, cache_dir: Optional[Path] = None) -> "ValveGraph":
+        """
+        Build the graph for a scan, or load it if this scan has been saved to `cache_dir` before.
+
+        :param data: The puzzle input.
+        :param cache_dir: Where built graphs are saved, keyed by a hash of the input.  None (the default)
+            to always build.
+        """
+        if cache_dir is None:
+            return cls.from_valves(parse_valves(data))
+        path = cache_dir / f"{hashlib.sha256(data).hexdigest()}.json"
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+            if cached["version"] == GRAPH_CACHE_VERSION:
+                return ValveGraph(cached["names"], cached["flows"],
+                                  [bytearray.fromhex(row) for row in cached["adjacency"]], cached["dist"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        graph = cls.from_valves(parse_valves(data))
+        try:
+            graph.save(path)
+        except OSError:
+            # Caching is only an optimization
+            pass
+        return graph
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so a reader in another process never sees half a file
+        temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp, "w") as f:
+            json.dump({"version": GRAPH_CACHE_VERSION, "names": self.names, "flows": self.flows,
+                       "adjacency": [row.hex() for row in self.adjacency], "dist": self.dist}, f)
+        os.replace(temp, path)
+
+    @property
+    def origin(self) -> int:
+        """
+        The row of `dist` for the starting valve.
+        """
+        return len(self.useful)
+
+    @property
+    def useful_flows(self) -> List[int]:
+        return [self.flows[valve] for valve in self.useful]
+
+    def neighbors(self, valve: int) -> List[int]:
+        return [other for other, connected in enumerate(self.adjacency[valve]) if connected]
+
+    def _shortest_paths(self) -> List[List[int]]:
+        # A BFS from each useful valve and the start, over neighbor lists read off the matrix once
+        neighbors = [self.neighbors(valve) for valve in range(len(self.names))]
+        dist = []
+        for source in self.useful + [self.names.index(START)]:
+            search = bfs(len(self.names), source, neighbors.__getitem__)
+            dist.append([search.dist[valve] for valve in self.useful])
+        return dist
+
+
+def parse(data: bytes) -> ValveGraph:
+    return ValveGraph.parse(data)
+
+
+def parse_valves(data: bytes) -> Dict[str, Valve]:
+    """
+    Read the valves from the scan.
+
+    :param data: The puzzle input.
+    :return: The valves by name, in the order they were listed.
+    """
+    valves = {}
+    for line in inputs.text(data).splitlines():
+        m = p.match(line.strip())
+        if not m:
+            continue
+        valves[m.group(1)] = Valve(m.group(1), int(m.group(2)), m.group(3).split(', '))
+    return valves
+
+
+def max_pressure(graph: ValveGraph, minutes: int) -> int:
+    """
+    The most pressure that can be released, starting at the starting valve with every valve closed.
+    """
+    flows = graph.useful_flows
+    positions = len(graph.dist)
+    stride = (minutes + 1) * positions
+
+    # out_of_reach[position][minutes_left] has a bit set for every valve too far away to open in time.  A
+    # valve that is out of reach stays out of reach however the walk continues (the walk only gets
+    # shorter by going straight there), so it is as good as open, and treating it that way lets states
+    # that only differ in unreachable valves share one memo entry.
+    out_of_reach = [[sum(1 << valve for valve, d in enumerate(row) if d + 1 >= minutes_left)
+                     for minutes_left in range(minutes + 1)]
+                    for row in graph.dist]
+
+    # Everything about a move that doesn't depend on which valves are open, worked out once: for each
+    # position and minutes left, (bit, pressure, bits opened, key suffix, valve, minutes left after) for
+    # every valve that can still be walked to and opened.
+    moves = [[[] for _ in range(minutes + 1)] for _ in range(positions)]
+    for position, row in enumerate(graph.dist):
+        for minutes_left in range(minutes + 1):
+            for valve, flow in enumerate(flows):
+                remaining = minutes_left - row[valve] - 1
+                if remaining > 0:
+                    moves[position][minutes_left].append(
+                        (1 << valve, flow * remaining, 1 << valve | out_of_reach[valve][remaining],
+                         remaining * positions + valve, valve, remaining))
+
+    # The best pressure still to come from each state, keyed by (opened, minutes left, position) packed
+    # into one int
+    memo: Dict[int, int] = {}
+    memo_get = memo.get
+
+    def best(position: int, minutes_left: int, opened: int) -> int:
+        most = 0
+        for bit, pressure, bits, key_suffix, valve, remaining in moves[position][minutes_left]:
+            if opened & bit:
+                continue
+            next_opened = opened | bits
+            key = next_opened * stride + key_suffix
+            after = memo_get(key)
+            if after is None:
+                after = memo[key] = best(valve, remaining, next_opened)
+            if pressure + after > most:
+                most = pressure + after
+        return most
+
+    most = best(graph.origin, minutes, out_of_reach[graph.origin][minutes])
+    # Every state but the first is in the memo.  Memo hits aren't counted, to keep the loop above tight.
+    stats = metrics.counters("valve_dp")
+    if stats is not None:
+        stats.expanded += len(memo) + 1
+        stats.pushed += len(memo) + 1
+    return most
+
+
+def pressure_by_subset(graph: ValveGraph, minutes: int) -> List[int]:
+    """
+    The most pressure one agent can release by opening exactly each subset of the useful valves.
+
+    Every state (position, minutes left, opened) reachable from the start is visited once, latest first,
+    keeping only the best pressure for states reached more than one way.
+
+    :return: A list indexed by bitmask.  Subsets that can't be opened in time are 0.
+    """
+    flows = graph.useful_flows
+    positions = len(graph.dist)
+    # For each position and minutes left, (bit, key step, minutes left after, pressure) for every valve that
+    # can still be walked to and opened.  The key step moves a state's key to the valve's position and
+    # sets its bit.
+    moves = [[[] for _ in range(minutes + 1)] for _ in range(positions)]
+    for position, row in enumerate(graph.dist):
+        for minutes_left in range(minutes + 1):
+            for valve, flow in enumerate(flows):
+                remaining = minutes_left - row[valve] - 1
+                if remaining > 0:
+                    moves[position][minutes_left].append(
+                        (1 << valve, (1 << valve) * positions + valve - position, remaining, flow * remaining))
+
+    best = [0] * (1 << len(flows))
+    # Bucket the states by minutes left, since every move uses up at least two minutes.  Each bucket maps
+    # opened * positions + position to the pressure released so far.
+    buckets: List[Dict[int, int]] = [{} for _ in range(minutes + 1)]
+    buckets[minutes][graph.origin] = 0
+    stats = metrics.counters("valve_subsets")
+    visited = 0
+    for minutes_left in range(minutes, 0, -1):
+        states = buckets[minutes_left]
+        visited += len(states)
+        if stats is not None:
+            stats.frontier(len(states))
+        for key, pressure in states.items():
+            opened, position = divmod(key, positions)
+            if pressure > best[opened]:
+                best[opened] = pressure
+            for bit, key_step, remaining, gain in moves[position][minutes_left]:
+                if opened & bit:
+                    continue
+                next_states = buckets[remaining]
+                next_key = key + key_step
+                if next_states.get(next_key, -1) < pressure + gain:
+                    next_states[next_key] = pressure + gain
+        # Free each bucket once it's done with
+        buckets[minutes_left] = {}
+    if stats is not None:
+        # Every state but the start was pushed once, and visited once however many ways it was reached
+        stats.expanded += visited
+        stats.pushed += visited - 1
+    return best
+
+
+def best_within(values: List[int]) -> List[int]:
+    """
+    The max-over-subsets (SOS) transform: entry `mask` of the result is the largest value of any subset
+    of `mask`.  One pass per bit, each taking the max of every mask with the bit set and the same mask
+    without it, is n * 2^n work rather than the 3^n of visiting every subset of every mask.
+    """
+    best = list(values)
+    size = len(best)
+    step = 1
+    while step < size:
+        # Masks with this bit come in runs of `step`, every 2 * step.  Update either each run or each
+        # position within the runs, whichever means fewer slices.
+        if step <= size // (2 * step):
+            for offset in range(step):
+                best[step + offset::2 * step] = map(max, best[step + offset::2 * step], best[offset::2 * step])
+        else:
+            for start in range(0, size, 2 * step):
+                best[start + step:start + 2 * step] = map(max, best[start + step:start + 2 * step],
+                                                          best[start:start + step])
+        step *= 2
+    return best
+
+
+def max_pressure_with_elephant(graph: ValveGraph, minutes: int) -> int:
+    """
+    The most pressure two agents working at once can release.
+
+    Opening a valve twice gains nothing, so the best plan splits the valves between the two agents.  For
+    each subset the first agent opens, the elephant's best is the best of any subset of the other valves.
+    """
+    pressures = pressure_by_subset(graph, minutes)
+    within = best_within(pressures)
+    everything = len(pressures) - 1
+    return max(pressure + within[everything ^ opened] for opened, pressure in enumerate(pressures))
+
+
+def max_pressure_branch_and_bound(graph: ValveGraph, minutes: int) -> int:
+    """
+    The same answer as `max_pressure()`, from a depth-first search that gives up on any branch that can't
+    beat the best plan found so far.
+
+    A branch's bound pairs the closed valves' flows, largest first, with the latest minutes they could
+    possibly be opened: the first after walking to the nearest closed valve, and each one after that at
+    least the shortest walk between two useful valves (plus a minute to open it) later.  Any real order
+    of opening them does no better than that pairing, so the bound never cuts off the best plan.  The
+    pruned branches are counted in the "valve_branch_and_bound" counters, where the peak frontier is the
+    deepest the search went.
+    """
+    flows = graph.useful_flows
+    dist = graph.dist
+    # (flow, bit, valve) for each useful valve, largest flow first
+    by_flow = sorted(((flow, 1 << valve, valve) for valve, flow in enumerate(flows)), reverse=True)
+    # The fewest minutes from opening one valve to having opened another
+    step = min((d for i, row in enumerate(dist[:graph.origin]) for j, d in enumerate(row) if i != j),
+               default=minutes) + 1
+    # The search only visits a few hundred states, so with counting off it counts into throwaway counters
+    stats = metrics.counters("valve_branch_and_bound") or metrics.SearchCounters()
+    best = 0
+
+    def bound(position: int, minutes_left: int, opened: int) -> int:
+        # The most pressure still to come, if the closed valves could be opened as early as possible
+        row = dist[position]
+        nearest = minutes
+        closed_flows = []
+        for flow, bit, valve in by_flow:
+            if not opened & bit:
+                closed_flows.append(flow)
+                if row[valve] < nearest:
+                    nearest = row[valve]
+        most = 0
+        remaining = minutes_left - nearest - 1
+        for flow in closed_flows:
+            if remaining <= 0:
+                break
+            most += flow * remaining
+            remaining -= step
+        return most
+
+    def search(position: int, minutes_left: int, opened: int, pressure: int, depth: int) -> None:
+        nonlocal best
+        stats.expanded += 1
+        stats.frontier(depth)
+        if pressure > best:
+            best = pressure
+        row = dist[position]
+        # Try the valves that release the most first, so good plans are found early and prune more
+        moves = []
+        for flow, bit, valve in by_flow:
+            remaining = minutes_left - row[valve] - 1
+            if remaining > 0 and not opened & bit:
+                moves.append((flow * remaining, bit, valve, remaining))
+        moves.sort(reverse=True)
+        for gain, bit, valve, remaining in moves:
+            if pressure + gain + bound(valve, remaining, opened | bit) <= best:
+                stats.pruned += 1
+                continue
+            stats.pushed += 1
+            search(valve, remaining, opened | bit, pressure + gain, depth + 1)
+
+    search(graph.origin, minutes, 0, 0, 1)
+    return best
+
+
+def best_plan(graph: ValveGraph, minutes: int, mode: str = BRANCH_AND_BOUND) -> int:
+    """
+    The most pressure a single agent can release, found with one of MODES.
+    """
+    if mode == DP:
+        return max_pressure(graph, minutes)
+    elif mode == BRANCH_AND_BOUND:
+        return max_pressure_branch_and_bound(graph, minutes)
+    raise ValueError(f"Unknown mode {mode}, expected one of {MODES}")
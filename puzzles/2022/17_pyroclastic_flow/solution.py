@@ -1,46 +1,208 @@
-import dataclasses
+"""
+Falling rocks in a seven-wide chamber.
 
+Each row of the chamber is one byte, a bitmask of its seven cells with the leftmost column in bit 6, and
+the whole chamber is a `bytearray` of rows starting with a solid floor.  Rocks are at most four rows tall,
+so a rock in a given column is precomputed as four row masks (bottom row first, padded with empty rows),
+and checking whether it fits anywhere is four ANDs with the chamber rows it would cover.
 
-@dataclasses.dataclass
-class Shape:
-    height: int
-    width: int
+A rock appears three rows above the top of the tower, so its first four jet pushes can only ever be
+stopped by the walls.  Where those four pushes leave each rock is worked out once per position in the
+jet pattern, and the simulation only starts checking for collisions once the rock is level with the top.
 
-    # def
+That still takes a few microseconds a rock, so a tower of millions of rocks is not simulated rock by rock.
+Once the next shape, the position in the jet pattern and every cell a rock could still reach are the same
+as after an earlier rock, everything that follows repeats too, and whole repeats are skipped by adding up
+their height.
+"""
+import time
+from typing import List
 
+from aoc import inputs, log
 
-def print_chamber(chamber) -> None:
-    for row in chamber:
-        print(' '.join(row))
+WIDTH = 7
+FULL_ROW = (1 << WIDTH) - 1
+# Rocks appear with their left edge two columns from the wall and their bottom three rows above the top
+START_COLUMN = 2
+START_GAP = 3
+# Pushes that happen before a new rock can reach the top of the tower
+FREE_PUSHES = START_GAP + 1
 
+# The rock shapes in the order they fall, as rows from the bottom up with the left edge in bit 6
+SHAPES = [
+    [0b1111000],
+    [0b0100000, 0b1110000, 0b0100000],
+    [0b1110000, 0b0010000, 0b0010000],
+    [0b1000000, 0b1000000, 0b1000000, 0b1000000],
+    [0b1100000, 0b1100000],
+]
 
-jet = list(open('sample_input.txt').readline().strip())
-print(jet)
 
-types = ['hbar', '+', 'rev_l', 'vbar', 'square']
+def shape_width(rows: List[int]) -> int:
+    combined = 0
+    for row in rows:
+        combined |= row
+    return WIDTH - (combined & -combined).bit_length() + 1
 
-# The tall, vertical chamber is exactly seven units wide.
-# Each rock appears so that its left edge is two units away
-# from the left wall and its bottom edge is three units above
-# the highest rock in the room (or the floor, if there isn't one).
 
-chamber = []
-for _ in range(4):
-    chamber.append(list('.' * 7))
+# For each shape, the rock's four rows with its left edge in each column it can be in
+ROCKS = [[tuple(row >> column for row in rows) + (0,) * (4 - len(rows))
+          for column in range(WIDTH - shape_width(rows) + 1)]
+         for rows in SHAPES]
+HEIGHTS = [len(rows) for rows in SHAPES]
 
-rock_num = 0
-type = types[rock_num % len(types)]
 
-print_chamber(chamber)
+def parse(data: bytes) -> List[int]:
+    """
+    :return: The jet pattern as column steps, -1 for a push left and 1 for a push right.
+    """
+    return [-1 if jet == ord('<') else 1 for jet in inputs.strip(memoryview(data))]
 
-# shape = N
-# if type == 'hbar':
-#
-#
-# bottom_row = 0
-# left_col = 2
-touching = False
-while not touching:
-    if type == 'hbar':
-        pass
 
+def free_fall_columns(jets: List[int]) -> List[List[int]]:
+    """
+    For each shape and each position in the jet pattern, the column a new rock ends up in after its first
+    FREE_PUSHES pushes, when only the walls can stop it.
+    """
+    # Those pushes are FREE_PUSHES bits, so work out where each combination leaves each shape...
+    combinations = range(1 << FREE_PUSHES)
+    landings = []
+    for rocks in ROCKS:
+        last_column = len(rocks) - 1
+        shape_landings = []
+        for pushes in combinations:
+            column = START_COLUMN
+            for push in range(FREE_PUSHES):
+                step = 1 if pushes >> push & 1 else -1
+                column = min(max(column + step, 0), last_column)
+            shape_landings.append(column)
+        landings.append(shape_landings)
+
+    # ...and which combination starts at each position in the pattern
+    jet_count = len(jets)
+    starts = [sum(1 << push for push in range(FREE_PUSHES) if jets[(start + push) % jet_count] > 0)
+              for start in range(jet_count)]
+    return [[shape_landings[pushes] for pushes in starts] for shape_landings in landings]
+
+
+def reachable_rows(chamber: bytearray, top: int) -> bytes:
+    """
+    The cells a falling rock could still get to, as masks of the rows from the top of the tower down.
+    Rocks only move down and sideways, so that is every empty cell connected to the open space above by
+    moves down and sideways.  The rows below the last one with any such cells can never matter again.
+    """
+    rows = bytearray()
+    reach = FULL_ROW
+    for y in range(top - 1, 0, -1):
+        free = ~chamber[y] & FULL_ROW
+        reach &= free
+        while True:
+            spread = (reach | reach << 1 | reach >> 1) & free
+            if spread == reach:
+                break
+            reach = spread
+        if not reach:
+            break
+        rows.append(reach)
+    return bytes(rows)
+
+
+def tower_height(jets: List[int], rock_count: int) -> int:
+    """
+    Drop rocks into the chamber and measure the tower.
+
+    :param jets: The jet pattern from `parse()`.
+    :param rock_count: How many rocks to drop.
+    :return: How many rows tall the tower is once they have all come to rest.
+    """
+    jet_count = len(jets)
+    first_columns = free_fall_columns(jets)
+    # Row 0 is the floor, so the tower height is one less than the first empty row
+    chamber = bytearray([FULL_ROW])
+    top = 1
+    jet = 0
+    shape_count = len(SHAPES)
+    # (rock number, top) by the state the chamber was left in, until a repeat is found
+    seen = {}
+    skipped_height = 0
+    rock_number = 0
+    while rock_number < rock_count:
+        shape = rock_number % shape_count
+        rocks = ROCKS[shape]
+        last_column = len(rocks) - 1
+        # Room for the rock to appear, plus one row of slack for the four-row windows
+        if len(chamber) < top + 8:
+            chamber.extend(bytes(4096))
+
+        column = first_columns[shape][jet]
+        jet = (jet + FREE_PUSHES) % jet_count
+        rock0, rock1, rock2, rock3 = rocks[column]
+        y = top
+        while True:
+            # Fall one row, unless something is in the way
+            below0 = chamber[y - 1]
+            below1 = chamber[y]
+            below2 = chamber[y + 1]
+            below3 = chamber[y + 2]
+            if below0 & rock0 or below1 & rock1 or below2 & rock2 or below3 & rock3:
+                break
+            y -= 1
+            # Get pushed by the next jet, unless a wall or another rock is in the way.  The rows the rock
+            # now covers are the ones that were just checked.
+            next_column = column + jets[jet]
+            jet += 1
+            if jet == jet_count:
+                jet = 0
+            if 0 <= next_column <= last_column:
+                next0, next1, next2, next3 = rocks[next_column]
+                if not (below0 & next0 or below1 & next1 or below2 & next2 or below3 & next3):
+                    column = next_column
+                    rock0, rock1, rock2, rock3 = next0, next1, next2, next3
+
+        chamber[y] |= rock0
+        chamber[y + 1] |= rock1
+        chamber[y + 2] |= rock2
+        chamber[y + 3] |= rock3
+        if y + HEIGHTS[shape] > top:
+            top = y + HEIGHTS[shape]
+        rock_number += 1
+
+        # A repeat has to start with the same shape, so it can only be seen when the next one is the first
+        if seen is not None and rock_number % shape_count == 0:
+            state = (jet, reachable_rows(chamber, top))
+            if state in seen:
+                # Everything since the earlier rock will happen again, as many times as there is room for
+                earlier_number, earlier_top = seen[state]
+                period = rock_number - earlier_number
+                repeats = (rock_count - rock_number) // period
+                log.info(f'The chamber repeats every {period} rocks from rock {earlier_number}, '
+                         f'skipping {repeats} repeats')
+                rock_number += repeats * period
+                skipped_height = repeats * (top - earlier_top)
+                seen = None
+            else:
+                seen[state] = (rock_number, top)
+
+    height = top - 1 + skipped_height
+    log.info(f'{rock_count} rocks came to rest in a tower {height} rows tall')
+    return height
+
+
+def solve(jets: List[int]) -> int:
+    return tower_height(jets, 2022)
+
+
+def main():
+    with open('input.txt', 'rb') as f:
+        jets = parse(f.read())
+    print(solve(jets))
+
+    start = time.time()
+    rocks = 1_000_000_000_000
+    height = tower_height(jets, rocks)
+    seconds = time.time() - start
+    print(f'{rocks} rocks make a tower {height} rows tall, worked out in {seconds:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,25 @@
 import re
 
+from aoc import inputs
+
 
 def main():
-    with open("input.txt") as input:
-        total = 0
-        for line in input.readlines():
-            first = None
-            last = None
-            for val in line:
-                if re.match('[0-9]', val):
-                    if not first:
-                        first = val
-                    last = val
-            total += int(first + last)
-        print(total)
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    total = 0
+    for line in inputs.text(data).splitlines(keepends=True):
+        first = None
+        last = None
+        for val in line:
+            if re.match('[0-9]', val):
+                if not first:
+                    first = val
+                last = val
+        total += int(first + last)
+    return total
 
 
 if __name__ == '__main__':
@@ -1,5 +1,7 @@
 import re
 
+from aoc import inputs
+
 
 def fix_line(line: str) -> str:
     return line.replace('one', 'o1one') \
@@ -15,19 +17,23 @@ def fix_line(line: str) -> str:
 
 
 def main():
-    with open("input_part2.txt") as input:
-        total = 0
-        for line in input.readlines():
-            adjusted_line = fix_line(line)
-            first = None
-            last = None
-            for val in adjusted_line:
-                if re.match('[0-9]', val):
-                    if not first:
-                        first = val
-                    last = val
-            total += int(first + last)
-        print(total)
+    with open("input_part2.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    total = 0
+    for line in inputs.text(data).splitlines(keepends=True):
+        adjusted_line = fix_line(line)
+        first = None
+        last = None
+        for val in adjusted_line:
+            if re.match('[0-9]', val):
+                if not first:
+                    first = val
+                last = val
+        total += int(first + last)
+    return total
 
 
 if __name__ == '__main__':
@@ -1,5 +1,7 @@
 import re
 
+from aoc import inputs, log
+
 SYMBOL_REGEX = "[^\w\d\s\.]"
 
 
@@ -30,31 +32,37 @@ def has_adjacent_symbol(lines, x, y) -> bool:
 
 
 def main():
-    with open("input.txt") as f:
-        lines = [line.strip() for line in f.readlines()]
-        part_numbers = []
-        for y in range(len(lines)):
-            line = lines[y]
-            curr_num = None
-            curr_has_adjacent_symbol = False
-            for x in range(len(line)):
-                char = line[x]
-                if re.match("\d", char):
-                    if not curr_num:
-                        curr_num = char
-                    else:
-                        curr_num += char
-                    curr_has_adjacent_symbol |= has_adjacent_symbol(lines, x, y)
-                    if x == len(line) - 1 and curr_has_adjacent_symbol:
-                        part_numbers.append(int(curr_num))
-                        print(f"Added {curr_num} from line {y + 1}.")
-                elif curr_num is not None:
-                    if curr_has_adjacent_symbol:
-                        part_numbers.append(int(curr_num))
-                        print(f"Added {curr_num} from line {y + 1}.")
-                    curr_num = None
-                    curr_has_adjacent_symbol = False
-        print(sum(part_numbers))
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    lines = [line.strip() for line in inputs.text(data).splitlines(keepends=True)]
+    part_numbers = []
+    for y in range(len(lines)):
+        line = lines[y]
+        curr_num = None
+        curr_has_adjacent_symbol = False
+        for x in range(len(line)):
+            char = line[x]
+            if re.match("\d", char):
+                if not curr_num:
+                    curr_num = char
+                else:
+                    curr_num += char
+                curr_has_adjacent_symbol |= has_adjacent_symbol(lines, x, y)
+                if x == len(line) - 1 and curr_has_adjacent_symbol:
+                    part_numbers.append(int(curr_num))
+                    if log.verbose:
+                        log.info(f"Added {curr_num} from line {y + 1}.")
+            elif curr_num is not None:
+                if curr_has_adjacent_symbol:
+                    part_numbers.append(int(curr_num))
+                    if log.verbose:
+                        log.info(f"Added {curr_num} from line {y + 1}.")
+                curr_num = None
+                curr_has_adjacent_symbol = False
+    return sum(part_numbers)
 
 
 if __name__ == '__main__':
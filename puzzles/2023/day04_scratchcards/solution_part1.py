@@ -1,19 +1,25 @@
 import re
 import functools
 
+from aoc import inputs
+
 
 def main():
-    with open("input.txt") as f:
-        total_points = 0
-        for line in f.readlines():
-            numbers = line.split(":")[1].strip()
-            parts = numbers.split("|")
-            winning = {int(n.strip()) for n in re.split("\\s+", parts[0].strip())}
-            mine = {int(n.strip()) for n in re.split("\\s+", parts[1].strip())}
-            my_winning = winning.intersection(mine)
-            points = functools.reduce(lambda cum, val: 1 if cum == 0 else cum * 2, my_winning, 0)
-            total_points += points
-        print(total_points)
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    total_points = 0
+    for line in inputs.text(data).splitlines(keepends=True):
+        numbers = line.split(":")[1].strip()
+        parts = numbers.split("|")
+        winning = {int(n.strip()) for n in re.split("\\s+", parts[0].strip())}
+        mine = {int(n.strip()) for n in re.split("\\s+", parts[1].strip())}
+        my_winning = winning.intersection(mine)
+        points = functools.reduce(lambda cum, val: 1 if cum == 0 else cum * 2, my_winning, 0)
+        total_points += points
+    return total_points
 
 
 if __name__ == '__main__':
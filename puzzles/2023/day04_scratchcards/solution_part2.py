@@ -2,17 +2,19 @@ import re
 from collections import namedtuple
 from typing import List, Dict
 
+from aoc import inputs
+
 Card = namedtuple("Card", ["num", "winning", "mine", "my_winning"])
 
 
-def create_cards(f) -> List[Card]:
+def parse(data: bytes) -> List[Card]:
     """
     Read input in and create a list of Card objects
-    :param f: The file handle for the input
+    :param data: The puzzle input
     :return: A List of Card objects
     """
     cards = []
-    for line in f.readlines():
+    for line in inputs.text(data).splitlines():
         split = line.split(":")
         card_num = int(re.match("Card\\s+(\\d+)", split[0].strip()).group(1))
         numbers = split[1].strip()
@@ -45,12 +47,16 @@ def process_card(card: Card, cards_by_num: Dict[int, List[Card]]) -> int:
 
 
 def main():
-    with open("sample_input.txt") as f:
-        cards_by_num = {c.num: c for c in create_cards(f)}
-        total_cards = 0
-        for v in cards_by_num.values():
-            total_cards += process_card(v, cards_by_num)
-        print(total_cards)
+    with open("sample_input.txt", "rb") as f:
+        print(solve(parse(f.read())))
+
+
+def solve(cards: List[Card]) -> int:
+    cards_by_num = {c.num: c for c in cards}
+    total_cards = 0
+    for v in cards_by_num.values():
+        total_cards += process_card(v, cards_by_num)
+    return total_cards
 
 
 if __name__ == '__main__':
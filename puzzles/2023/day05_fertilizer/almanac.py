@@ -0,0 +1,251 @@
+"""
+The almanac's maps, shared by both parts.
+"""
+import bisect
+import dataclasses
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from aoc import inputs
+
+
+@dataclasses.dataclass(frozen=True)
+class MapRange:
+    dest: int
+    source: int
+    range: int
+
+    @property
+    def source_end(self) -> int:
+        return self.source + self.range
+
+    @property
+    def offset(self) -> int:
+        return self.dest - self.source
+
+
+class Ranges:
+    """
+    One section of the almanac, e.g. seed-to-soil.
+
+    The MapRanges are sorted by source when the Ranges is built and never change afterwards, so a
+    lookup is a binary search for the last range starting at or before the value.  The gaps between
+    ranges, where values map to themselves, are worked out up front as well.
+    """
+
+    def __init__(self, ranges: Iterable[MapRange]):
+        self.ranges: Tuple[MapRange, ...] = tuple(sorted(ranges, key=lambda r: r.source))
+        self._sources = [r.source for r in self.ranges]
+
+        # Half-open (start, end) intervals that aren't covered by any range.  Everything from the end of
+        # the last range upwards maps to itself too.
+        self.gaps: List[Tuple[int, int]] = []
+        end = 0
+        for r in self.ranges:
+            if r.source < end:
+                raise ValueError(f"{r} overlaps the range before it")
+            if r.source > end:
+                self.gaps.append((end, r.source))
+            end = r.source_end
+        self.end = end
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def __iter__(self) -> Iterator[MapRange]:
+        return iter(self.ranges)
+
+    def lookup(self, val: int) -> int:
+        i = bisect.bisect_right(self._sources, val) - 1
+        if i >= 0 and val < self.ranges[i].source_end:
+            return val + self.ranges[i].offset
+        return val
+
+    def lookup_many(self, vals: Iterable[int]) -> List[int]:
+        return [self.lookup(val) for val in vals]
+
+    def lookup_intervals(self, intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Map whole intervals of sources at once.  Each interval is split wherever a MapRange starts or ends,
+        the pieces inside a MapRange are shifted to its destination and the pieces in the gaps are kept as
+        they are.
+
+        :param intervals: Half-open (start, end) intervals of source values.
+        :return: Sorted, merged half-open intervals covering exactly the destinations of those sources.
+        """
+        result = []
+        for start, end in intervals:
+            curr = start
+            # Start from the range containing the interval's start, if there is one
+            i = max(bisect.bisect_right(self._sources, start) - 1, 0)
+            while i < len(self.ranges) and self.ranges[i].source < end:
+                r = self.ranges[i]
+                i += 1
+                if r.source_end <= curr:
+                    continue
+                if r.source > curr:
+                    result.append((curr, r.source))
+                    curr = r.source
+                piece_end = min(end, r.source_end)
+                result.append((curr + r.offset, piece_end + r.offset))
+                curr = piece_end
+            if curr < end:
+                result.append((curr, end))
+        return merge_intervals(result)
+
+    def inverse(self) -> "Ranges":
+        """
+        The map from destinations back to sources.  This undoes `lookup` as long as the map is one-to-one,
+        which the almanac's maps are.
+        """
+        return Ranges(MapRange(r.source, r.dest, r.range) for r in self.ranges)
+
+    def pieces(self) -> Iterator[Tuple[int, int]]:
+        """
+        The (start, offset) of each range and gap in order, starting at 0.  The last piece runs on forever.
+        """
+        gaps = iter(self.gaps)
+        gap = next(gaps, None)
+        for r in self.ranges:
+            if gap and gap[0] < r.source:
+                yield gap[0], 0
+                gap = next(gaps, None)
+            yield r.source, r.offset
+        yield self.end, 0
+
+
+class PiecewiseMap:
+    """
+    A function on the non-negative integers that adds a constant offset within each piece.
+
+    Piece i covers [starts[i], starts[i + 1]) and maps x to x + offsets[i].  The first piece starts at 0
+    and the last one runs on forever.  Each almanac map is one of these (offset 0 in the gaps between
+    its ranges), and so is any chain of them, so the seven stages can be folded into a single map and a
+    seed's location found with one binary search.
+    """
+
+    def __init__(self, starts: List[int], offsets: List[int]):
+        self.starts = starts
+        self.offsets = offsets
+
+    @classmethod
+    def identity(cls) -> "PiecewiseMap":
+        return PiecewiseMap([0], [0])
+
+    @classmethod
+    def from_ranges(cls, ranges: Ranges) -> "PiecewiseMap":
+        """
+        Build the map for one almanac section.
+        """
+        pieces = list(ranges.pieces())
+        return cls._merged([start for start, _ in pieces], [offset for _, offset in pieces])
+
+    def then(self, other: "PiecewiseMap") -> "PiecewiseMap":
+        """
+        Compose two maps: the result sends x to other(self(x)).
+
+        Each piece of this map is shifted onto an interval of the other map's domain and split wherever
+        one of the other map's pieces starts inside it.
+        """
+        starts = []
+        offsets = []
+        for i, start in enumerate(self.starts):
+            offset = self.offsets[i]
+            end: Optional[int] = self.starts[i + 1] if i + 1 < len(self.starts) else None
+            image_start = start + offset
+            j = bisect.bisect_right(other.starts, image_start) - 1
+            while True:
+                starts.append(max(other.starts[j], image_start) - offset)
+                offsets.append(offset + other.offsets[j])
+                j += 1
+                if j == len(other.starts) or (end is not None and other.starts[j] >= end + offset):
+                    break
+        return self._merged(starts, offsets)
+
+    def lookup(self, value: int) -> int:
+        return value + self.offsets[bisect.bisect_right(self.starts, value) - 1]
+
+    def lookup_many(self, values):
+        """
+        Map a whole NumPy array of values in one vectorized call.
+
+        :param values: Anything `numpy.asarray` accepts.
+        :return: An int64 array of the mapped values.
+        """
+        # NumPy is only needed for bulk lookups, so the solutions themselves don't depend on it.
+        import numpy as np
+
+        values = np.asarray(values, dtype=np.int64)
+        pieces = np.searchsorted(np.asarray(self.starts, dtype=np.int64), values, side="right") - 1
+        return values + np.asarray(self.offsets, dtype=np.int64)[pieces]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @staticmethod
+    def _merged(starts: List[int], offsets: List[int]) -> "PiecewiseMap":
+        # Drop empty pieces and join neighbors that shift by the same amount
+        merged_starts = []
+        merged_offsets = []
+        for i, start in enumerate(starts):
+            if i + 1 < len(starts) and starts[i + 1] <= start:
+                continue
+            if merged_offsets and merged_offsets[-1] == offsets[i]:
+                continue
+            merged_starts.append(start)
+            merged_offsets.append(offsets[i])
+        return PiecewiseMap(merged_starts, merged_offsets)
+
+
+def compose(maps: Iterable[PiecewiseMap]) -> PiecewiseMap:
+    """
+    Fold a chain of maps, applied in order, into one.
+    """
+    composed = PiecewiseMap.identity()
+    for m in maps:
+        composed = composed.then(m)
+    return composed
+
+
+def merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Sort half-open intervals and combine the ones that overlap or touch.
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def parse(data: bytes) -> Tuple[List[int], List[Ranges]]:
+    """
+    Read the seeds and the seven maps from the almanac.
+
+    :param data: The puzzle input.
+    :return: The seed numbers and the maps, in the order they are applied to a seed.
+    """
+    seeds = []
+    sections = {}
+    section = None
+    for line in inputs.text(data).splitlines():
+        trimmed = line.strip()
+        if trimmed.startswith("seeds:"):
+            # First line, get all the seeds
+            seeds = [int(s) for s in trimmed.split(":")[1].strip().split(" ")]
+        elif trimmed == "":
+            # Newline between sections, reset section
+            section = None
+        elif not section:
+            # Map declaration, i.e. "seed-to-soil map:"
+            section = re.match("(\\w+-to-\\w+) map:", trimmed).group(1)
+            sections[section] = []
+        else:
+            nums = [int(n) for n in trimmed.split(" ")]
+            sections[section].append(MapRange(nums[0], nums[1], nums[2]))
+
+    order = ["seed-to-soil", "soil-to-fertilizer", "fertilizer-to-water", "water-to-light",
+             "light-to-temperature", "temperature-to-humidity", "humidity-to-location"]
+    return seeds, [Ranges(sections[name]) for name in order]
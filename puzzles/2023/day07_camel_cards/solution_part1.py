@@ -1,3 +1,6 @@
+from aoc import inputs
+
+
 FIVE_OF_KIND = 7
 FOUR_OF_KIND = 6
 FULL_HOUSE = 5
@@ -76,17 +79,21 @@ class Hand:
 
 
 def main():
-    with open("input.txt") as f:
-        hands = [parse_hand_from_line(line) for line in f.readlines()]
-        sorted_hands = sorted(hands)
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    hands = [parse_hand_from_line(line) for line in inputs.text(data).splitlines(keepends=True)]
+    sorted_hands = sorted(hands)
 
-        winnings = 0
-        rank = len(sorted_hands)
-        for h in sorted_hands:
-            winnings += rank * h.bid
-            rank -= 1
+    winnings = 0
+    rank = len(sorted_hands)
+    for h in sorted_hands:
+        winnings += rank * h.bid
+        rank -= 1
 
-        print(winnings)
+    return winnings
 
 
 def parse_hand_from_line(line):
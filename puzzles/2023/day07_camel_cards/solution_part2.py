@@ -1,3 +1,6 @@
+from aoc import inputs, log
+
+
 FIVE_OF_KIND = 7
 FOUR_OF_KIND = 6
 FULL_HOUSE = 5
@@ -37,7 +40,8 @@ class Hand:
         self.bid = bid
         self.type = self.type(sorted_cards)
         if "J" in cards:
-            print(f"{sorted_cards} ({cards}) got turned into {TYPE_TO_NAME[self.type]}")
+            if log.verbose:
+                log.info(f"{sorted_cards} ({cards}) got turned into {TYPE_TO_NAME[self.type]}")
 
     @classmethod
     def type(cls, cards: str) -> int:
@@ -131,19 +135,24 @@ class Hand:
 
 
 def main():
-    with open("input.txt") as f:
-        hands = [parse_hand_from_line(line) for line in f.readlines()]
-        sorted_hands = sorted(hands)
-
-        cumulative_winnings = 0
-        rank = len(sorted_hands)
-        for h in sorted_hands:
-            w = rank * h.bid
-            cumulative_winnings += w
-            print(f"{rank} - {h.cards}, {h.bid}, {w}")
-            rank -= 1
-
-        print(cumulative_winnings)
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    hands = [parse_hand_from_line(line) for line in inputs.text(data).splitlines(keepends=True)]
+    sorted_hands = sorted(hands)
+
+    cumulative_winnings = 0
+    rank = len(sorted_hands)
+    for h in sorted_hands:
+        w = rank * h.bid
+        cumulative_winnings += w
+        if log.verbose:
+            log.info(f"{rank} - {h.cards}, {h.bid}, {w}")
+        rank -= 1
+
+    return cumulative_winnings
 
 
 def parse_hand_from_line(line):
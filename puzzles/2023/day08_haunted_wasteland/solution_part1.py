@@ -1,34 +1,40 @@
 import re
 from collections import namedtuple
 
+from aoc import inputs
+
 Node = namedtuple("Node", ["name", "left", "right"])
 
 
 def main():
-    with open("input.txt") as f:
-        graph = {}
-        directions = None
-        for line in f.readlines():
-            trimmed = line.strip()
-            if not directions:
-                directions = trimmed
-            elif trimmed != "":
-                m = re.match("(\\w+) = \\((\\w+), (\\w+)\\)", trimmed)
-                name = m.group(1)
-                left = m.group(2)
-                right = m.group(3)
-                graph[name] = Node(name, left, right)
-
-        curr = "AAA"
-        dir_idx = 0
-        steps = 0
-        while curr != "ZZZ":
-            d = directions[dir_idx]
-            n = graph[curr]
-            curr = n.left if d == "L" else n.right
-            dir_idx = (dir_idx + 1) % len(directions)  # Proceed to next direction, or rap around once we reach the end
-            steps += 1
-        print(steps)
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    graph = {}
+    directions = None
+    for line in inputs.text(data).splitlines(keepends=True):
+        trimmed = line.strip()
+        if not directions:
+            directions = trimmed
+        elif trimmed != "":
+            m = re.match("(\\w+) = \\((\\w+), (\\w+)\\)", trimmed)
+            name = m.group(1)
+            left = m.group(2)
+            right = m.group(3)
+            graph[name] = Node(name, left, right)
+
+    curr = "AAA"
+    dir_idx = 0
+    steps = 0
+    while curr != "ZZZ":
+        d = directions[dir_idx]
+        n = graph[curr]
+        curr = n.left if d == "L" else n.right
+        dir_idx = (dir_idx + 1) % len(directions)  # Proceed to next direction, or rap around once we reach the end
+        steps += 1
+    return steps
 
 
 if __name__ == '__main__':
@@ -0,0 +1,14 @@
+"""
+The histories of the OASIS readings, shared by both parts.
+"""
+from typing import List
+
+from aoc import inputs
+
+
+def parse(data: bytes) -> List[List[int]]:
+    histories = []
+    for line in inputs.lines(data):
+        if len(line):
+            histories.append(list(inputs.ints(line)))
+    return histories
@@ -1,28 +1,34 @@
 from typing import List
 
+from oasis import parse
+
+# The runner's entry points.  parse comes from oasis, so both parts share one list of histories.
+__all__ = ["parse", "solve"]
+
 
 def main():
-    histories = []
+    with open("input.txt", "rb") as f:
+        print(solve(parse(f.read())))
+
+
+def solve(histories: List[List[int]]) -> int:
     hist_next_vals = []
-    with open("input.txt") as f:
-        for line in f.readlines():
-            histories.append([int(v) for v in line.split(" ")])
-
-        for h in histories:
-            diffs = [h]
-            while not all_values_zero(diffs[-1]):
-                diff = []
-                curr = diffs[-1]
-                for i in range(0, len(curr) - 1):
-                    diff.append(curr[i + 1] - curr[i])
-                diffs.append(diff)
-
-            diffs[-1].insert(0, 0)
-            for i in range(len(diffs) - 2, -1, -1):
-                val = diffs[i][0] - diffs[i + 1][0]
-                diffs[i].insert(0, val)
-            hist_next_vals.insert(0, diffs[0][0])
-    print(sum(hist_next_vals))
+    for h in histories:
+        # Extrapolating extends every row, so work on a copy of the shared history
+        diffs = [list(h)]
+        while not all_values_zero(diffs[-1]):
+            diff = []
+            curr = diffs[-1]
+            for i in range(0, len(curr) - 1):
+                diff.append(curr[i + 1] - curr[i])
+            diffs.append(diff)
+
+        diffs[-1].insert(0, 0)
+        for i in range(len(diffs) - 2, -1, -1):
+            val = diffs[i][0] - diffs[i + 1][0]
+            diffs[i].insert(0, val)
+        hist_next_vals.insert(0, diffs[0][0])
+    return sum(hist_next_vals)
 
 
 def all_values_zero(vals: List[int]) -> bool:
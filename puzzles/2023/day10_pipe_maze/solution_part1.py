@@ -1,6 +1,13 @@
 import dataclasses
 from typing import List, Tuple
 
+from aoc import log
+from aoc.grid import Grid
+from pipe_maze import parse
+
+# The runner's entry points.  parse comes from pipe_maze, so both parts share one parsed maze.
+__all__ = ["parse", "solve"]
+
 
 @dataclasses.dataclass
 class Path:
@@ -10,34 +17,34 @@ class Path:
 
 
 def main():
-    maze = []
-    with open("input.txt") as f:
-        for line in f.readlines():
-            maze.append(list(line.strip()))
+    with open("input.txt", "rb") as f:
+        print(solve(parse(f.read())))
+
 
+def solve(maze: Grid) -> int:
     paths = []
     start_coords = find_start(maze)
     sr = start_coords[0]
     sc = start_coords[1]
 
-    # Find two sides of start
-    if sr - 1 >= 0 and maze[sr - 1][sc] in {"|", "7", "F"}:
+    # Find two sides of start.  Off-map neighbors read as the grid's PAD border, which never matches a pipe.
+    if maze[sr - 1, sc] in {"|", "7", "F"}:
         # Pipe is coming from above
         paths.append(Path((sr - 1, sc), start_coords, 1))
-    if sr + 1 < len(maze) and maze[sr + 1][sc] in {"|", "L", "J"}:
+    if maze[sr + 1, sc] in {"|", "L", "J"}:
         # Pipe is coming from below
         paths.append(Path((sr + 1, sc), start_coords, 1))
-    if sc - 1 >= 0 and maze[sr][sc - 1] in {"-", "F", "L"}:
+    if maze[sr, sc - 1] in {"-", "F", "L"}:
         # Pipe is coming from left side
         paths.append(Path((sr, sc - 1), start_coords, 1))
-    if sc + 1 < len(maze[sr]) and maze[sr][sc + 1] in {"-", "J", "7"}:
+    if maze[sr, sc + 1] in {"-", "J", "7"}:
         # Pipe is coming from right side
         paths.append(Path((sr, sc + 1), start_coords, 1))
 
     while not paths_at_same_coords(paths):
         for p in paths:
             advance_path(p, maze)
-    print(max([p.steps for p in paths]))
+    return max([p.steps for p in paths])
 
 
 def can_move(source, dest, direction) -> bool:
@@ -52,36 +59,33 @@ def advance_path(path, maze) -> None:
     c = path.curr[1]
     last_r = path.last[0]
     last_c = path.last[1]
-    source = maze[r][c]
-    if r - 1 >= 0 and last_r != r - 1 and can_move(source, maze[r - 1][c], "N"):
+    source = maze[r, c]
+    if last_r != r - 1 and can_move(source, maze[r - 1, c], "N"):
         path.steps += 1
         path.last = path.curr
         path.curr = (r - 1, c)
-    elif r + 1 < len(maze) and last_r != r + 1 and can_move(source, maze[r + 1][c], "S"):
+    elif last_r != r + 1 and can_move(source, maze[r + 1, c], "S"):
         path.steps += 1
         path.last = path.curr
         path.curr = (r + 1, c)
-    elif c - 1 >= 0 and last_c != c - 1 and can_move(source, maze[r][c - 1], "W"):
+    elif last_c != c - 1 and can_move(source, maze[r, c - 1], "W"):
         path.steps += 1
         path.last = path.curr
         path.curr = (r, c - 1)
-    elif c + 1 < len(maze[r]) and last_c != c + 1 and can_move(source, maze[r][c + 1], "E"):
+    elif last_c != c + 1 and can_move(source, maze[r, c + 1], "E"):
         path.steps += 1
         path.last = path.curr
         path.curr = (r, c + 1)
     else:
-        print(f"We are stuck")
+        log.info(f"We are stuck")
 
 
 def paths_at_same_coords(paths: List[Path]) -> bool:
     return len(set([p.curr for p in paths])) == 1 or paths[0].last == paths[1].curr
 
 
-def find_start(maze: List[List[str]]) -> Tuple[int, int]:
-    for r in range(len(maze)):
-        for c in range(len(maze[r])):
-            if maze[r][c] == "S":
-                return r, c
+def find_start(maze: Grid) -> Tuple[int, int]:
+    return maze.find("S")
 
 
 if __name__ == '__main__':
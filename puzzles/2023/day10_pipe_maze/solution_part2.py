@@ -1,5 +1,13 @@
 import dataclasses
-from typing import List, Tuple, Set
+from typing import Iterator, List, Set, Tuple
+
+from aoc import log, metrics
+from aoc.grid import PAD, Grid
+from aoc.search import Search, multi_source_bfs
+from pipe_maze import parse
+
+# The runner's entry points.  parse comes from pipe_maze, so both parts share one parsed maze.
+__all__ = ["parse", "solve"]
 
 PIPE_CHARS = {"|", "-", "J", "L", "F", "7"}
 
@@ -13,6 +21,11 @@ class Path:
 
 
 def main():
+    with open("input.txt", "rb") as f:
+        print(solve(parse(f.read())))
+
+
+def solve(maze: Grid) -> int:
     """
     This one was not fun.
 
@@ -28,27 +41,22 @@ def main():
 
     Phew.
     """
-    maze = []
-    with open("input.txt") as f:
-        for line in f.readlines():
-            maze.append(list(line.strip()))
-
     paths = []
     start_coords = find_start(maze)
     sr = start_coords[0]
     sc = start_coords[1]
 
-    # Find two sides of start
-    if sr - 1 >= 0 and maze[sr - 1][sc] in {"|", "7", "F"}:
+    # Find two sides of start.  Off-map neighbors read as the grid's PAD border, which never matches a pipe.
+    if maze[sr - 1, sc] in {"|", "7", "F"}:
         # Pipe is coming from above
         paths.append(Path((sr - 1, sc), start_coords, {(sr, sc), (sr - 1, sc)}, 1))
-    if sr + 1 < len(maze) and maze[sr + 1][sc] in {"|", "L", "J"}:
+    if maze[sr + 1, sc] in {"|", "L", "J"}:
         # Pipe is coming from below
         paths.append(Path((sr + 1, sc), start_coords, {(sr, sc), (sr + 1, sc)}, 1))
-    if sc - 1 >= 0 and maze[sr][sc - 1] in {"-", "F", "L"}:
+    if maze[sr, sc - 1] in {"-", "F", "L"}:
         # Pipe is coming from left side
         paths.append(Path((sr, sc - 1), start_coords, {(sr, sc), (sr, sc - 1)}, 1))
-    if sc + 1 < len(maze[sr]) and maze[sr][sc + 1] in {"-", "J", "7"}:
+    if maze[sr, sc + 1] in {"-", "J", "7"}:
         # Pipe is coming from right side
         paths.append(Path((sr, sc + 1), start_coords, {(sr, sc), (sr, sc + 1)}, 1))
 
@@ -60,28 +68,31 @@ def main():
     for p in paths:
         for t in p.trail:
             path_coords.add(t)
-    print_path(maze, path_coords)
+    if log.verbose:
+        print_path(maze, path_coords)
 
+    # Reformatting marks up the maze in place, so leave the shared one as it was parsed
+    maze = maze.copy()
     reformat_maze(maze, path_coords)
-    expand_maze(maze)
+    maze = expand_maze(maze)
     visited = find_outer_tiles(maze)
     inner = find_inner_tiles(maze, visited)
-    print(inner)
+    return inner
 
 
-def reformat_maze(maze, path_coords: Set[Tuple[int, int]]):
+def reformat_maze(maze: Grid, path_coords: Set[Tuple[int, int]]):
     """
     After finding the path, for simplicity we are going to mark every other tile not in the path
     with a '%' symbol.  This will let us know what the original tiles were.
     :param maze: The maze being processed.
     :param path_coords: Set of coordinates representing the path.
     """
-    for r in range(len(maze)):
-        for c in range(len(maze[r])):
-            if maze[r][c] == "S":
+    for r in range(maze.height):
+        for c in range(maze.width):
+            if maze[r, c] == "S":
                 substitute_s(r, c, maze)
             elif (r, c) not in path_coords:
-                maze[r][c] = "%"
+                maze[r, c] = "%"
 
 
 def substitute_s(r, c, maze) -> None:
@@ -91,71 +102,54 @@ def substitute_s(r, c, maze) -> None:
     :param c: The column coordinate
     :param maze: The maze
     """
-    if r - 1 >= 0 and r + 1 < len(maze) and \
-            maze[r - 1][c] in {"|", "7", "F"} and \
-            maze[r + 1][c] in {"|", "L", "J"}:
+    if maze[r - 1, c] in {"|", "7", "F"} and maze[r + 1, c] in {"|", "L", "J"}:
         # Vertical connector
-        maze[r][c] = "|"
-    elif c - 1 >= 0 and c + 1 < len(maze[r]) and \
-            maze[r][c - 1] in {"-", "F", "L"} and \
-            maze[r][c + 1] in {"-", "7", "J"}:
+        maze[r, c] = "|"
+    elif maze[r, c - 1] in {"-", "F", "L"} and maze[r, c + 1] in {"-", "7", "J"}:
         # Horizontal connector
-        maze[r][c] = "-"
-    elif r - 1 >= 0 and c + 1 < len(maze[r]) and \
-            maze[r - 1][c] in {"|", "7", "F"} and \
-            maze[r][c + 1] in {"-", "7", "J"}:
+        maze[r, c] = "-"
+    elif maze[r - 1, c] in {"|", "7", "F"} and maze[r, c + 1] in {"-", "7", "J"}:
         # North-east connector
-        maze[r][c] = "L"
-    elif r - 1 >= 0 and c - 1 >= 0 and maze[r - 1][c] in {"|", "7", "F"} and maze[r][c - 1] in {"-", "F", "L"}:
+        maze[r, c] = "L"
+    elif maze[r - 1, c] in {"|", "7", "F"} and maze[r, c - 1] in {"-", "F", "L"}:
         # North-west connector
-        maze[r][c] = "J"
-    elif r + 1 < len(maze) and c - 1 >= 0 and \
-            maze[r + 1][c] in {"|", "L", "J"} and \
-            maze[r][c - 1] in {"-", "F", "L"}:
+        maze[r, c] = "J"
+    elif maze[r + 1, c] in {"|", "L", "J"} and maze[r, c - 1] in {"-", "F", "L"}:
         # South-west connector
-        maze[r][c] = "7"
+        maze[r, c] = "7"
     else:
         # South-east connector
-        maze[r][c] = "F"
-
-
-def expand_maze(maze: List[List[str]]):
-    # Vertical expansion
-    idx = 0
-    while idx < len(maze) - 1:
-        new_row = []
-        for c_idx in range(len(maze[idx])):
-            top = maze[idx][c_idx]
-            bottom = maze[idx + 1][c_idx]
-            if top in {"|", "7", "F"} and bottom in {"|", "L", "J"}:
-                new_row.append("|")
-            else:
-                new_row.append("*")
-        maze.insert(idx + 1, new_row)
-        idx += 2
-
-    # Horizontal expansion
-    for r in range(len(maze)):
-        idx = 0
-        while idx < len(maze[0]) - 1:
-            left = maze[r][idx]
-            right = maze[r][idx + 1]
-            if left in {"-", "F", "L"} and right in {"-", "J", "7"}:
-                maze[r].insert(idx + 1, "-")
-            else:
-                maze[r].insert(idx + 1, "*")
-            idx += 2
+        maze[r, c] = "F"
 
 
-def print_path(maze, path_coords):
-    for r in range(len(maze)):
+def expand_maze(maze: Grid) -> Grid:
+    """
+    Put a new row between every pair of rows and a new column between every pair of columns.
+    New tiles that connect two pipes are filled in with "|" or "-", and everything else new is "*".
+    """
+    expanded = Grid.filled(maze.height * 2 - 1, maze.width * 2 - 1, "*")
+    for r in range(maze.height):
+        for c in range(maze.width):
+            tile = maze[r, c]
+            expanded[r * 2, c * 2] = tile
+            # Vertical expansion
+            if tile in {"|", "7", "F"} and maze[r + 1, c] in {"|", "L", "J"}:
+                expanded[r * 2 + 1, c * 2] = "|"
+            # Horizontal expansion
+            if tile in {"-", "F", "L"} and maze[r, c + 1] in {"-", "J", "7"}:
+                expanded[r * 2, c * 2 + 1] = "-"
+    return expanded
+
+
+def print_path(maze: Grid, path_coords):
+    for r in range(maze.height):
         row_str = ""
-        for c in range(len(maze[r])):
+        for c in range(maze.width):
             if (r, c) in path_coords:
                 row_str += "#"
             else:
-                row_str += maze[r][c]
-        print(row_str)
+                row_str += maze[r, c]
+        log.info(row_str)
 
 
 def is_adjacent(p1, p2) -> bool:
@@ -163,23 +157,23 @@ def is_adjacent(p1, p2) -> bool:
         (abs(p1[0] - p2[0]) == 1 and p1[1] == p2[0])
 
 
-def find_inner_tiles(maze, outer_tiles: Set[Tuple[int, int]]):
+def find_inner_tiles(maze: Grid, outer_tiles: Search):
     """
 
     :param maze:
-    :param outer_tiles:
+    :param outer_tiles: The search from find_outer_tiles().
     :return:
     """
     inner = 0
-    for r in range(len(maze)):
-        for c in range(len(maze[r])):
-            if (r, c) in outer_tiles or maze[r][c] in PIPE_CHARS or maze[r][c] == "*":
+    for r in range(maze.height):
+        for c in range(maze.width):
+            if outer_tiles.reached(maze.index(r, c)) or maze[r, c] in PIPE_CHARS or maze[r, c] == "*":
                 continue
             inner += 1
     return inner
 
 
-def find_outer_tiles(maze) -> Set[Tuple[int, int]]:
+def find_outer_tiles(maze: Grid) -> Search:
     """
     Perform a breadth-first-search of the maze to determine the outer tiles.
 
@@ -189,42 +183,27 @@ def find_outer_tiles(maze) -> Set[Tuple[int, int]]:
     at a single point, we'd be closed off from some outer section (which would then be counted
     as inner tiles).
     :param maze: The maze being processed
-    :return: A set of tuples representing coordinates for outer tiles.
+    :return: The search, in which the outer tiles (by grid index) are the ones reached.
     """
-    visited = set()
-    queue = []
-    for r in range(len(maze)):
-        if maze[r][0] not in PIPE_CHARS:
-            queue.append((r, 0))
-        if maze[r][len(maze[0]) - 1] not in PIPE_CHARS:
-            queue.append((r, len(maze[0]) - 1))
-    for c in range(len(maze[0])):
-        if maze[0][c] not in PIPE_CHARS:
-            queue.append((0, c))
-        if maze[len(maze) - 1][c] not in PIPE_CHARS:
-            queue.append((len(maze) - 1, c))
-
-    while queue:
-        location = queue.pop()
-        r = location[0]
-        c = location[1]
-        north = (r - 1, c)
-        south = (r + 1, c)
-        east = (r, c + 1)
-        west = (r, c - 1)
-        if r - 1 >= 0 and maze[north[0]][north[1]] not in PIPE_CHARS and north not in visited:
-            visited.add(north)
-            queue.append(north)
-        if r + 1 < len(maze) and maze[south[0]][south[1]] not in PIPE_CHARS and south not in visited:
-            visited.add(south)
-            queue.append(south)
-        if c - 1 >= 0 and maze[west[0]][west[1]] not in PIPE_CHARS and west not in visited:
-            visited.add(west)
-            queue.append(west)
-        if c + 1 < len(maze[r]) and maze[east[0]][east[1]] not in PIPE_CHARS and east not in visited:
-            visited.add(east)
-            queue.append(east)
-    return visited
+    data = maze.data
+    offsets = maze.offsets
+    # The grid's bytes for the pipe characters, so neighbors can be checked without decoding them
+    pipes = {ord(pipe) for pipe in PIPE_CHARS}
+
+    sources = []
+    for r in range(maze.height):
+        sources += [(r, 0), (r, maze.width - 1)]
+    for c in range(maze.width):
+        sources += [(0, c), (maze.height - 1, c)]
+
+    def neighbors(i: int) -> Iterator[int]:
+        for offset in offsets:
+            tile = data[i + offset]
+            if tile != PAD and tile not in pipes:
+                yield i + offset
+
+    return multi_source_bfs(len(data), (maze.index(r, c) for r, c in sources if maze[r, c] not in PIPE_CHARS),
+                            neighbors, stats=metrics.counters("flood_fill"))
 
 
 def can_move(source, dest, direction) -> bool:
@@ -241,7 +220,7 @@ def can_move(source, dest, direction) -> bool:
         (source in {"-", "7", "J"} and dest in {"L", "F", "-"} and direction == "W")
 
 
-def advance_path(path: Path, maze: List[List[str]]) -> None:
+def advance_path(path: Path, maze: Grid) -> None:
     """
     Move forward in the path by following the pipe.
     :param path: The current path being evaluated
@@ -251,45 +230,42 @@ def advance_path(path: Path, maze: List[List[str]]) -> None:
     c = path.curr[1]
     last_r = path.last[0]
     last_c = path.last[1]
-    source = maze[r][c]
-    if r - 1 >= 0 and last_r != r - 1 and can_move(source, maze[r - 1][c], "N"):
+    source = maze[r, c]
+    if last_r != r - 1 and can_move(source, maze[r - 1, c], "N"):
         path.steps += 1
         path.last = path.curr
         path.curr = (r - 1, c)
         path.trail.add(path.curr)
-    elif r + 1 < len(maze) and last_r != r + 1 and can_move(source, maze[r + 1][c], "S"):
+    elif last_r != r + 1 and can_move(source, maze[r + 1, c], "S"):
         path.steps += 1
         path.last = path.curr
         path.curr = (r + 1, c)
         path.trail.add(path.curr)
-    elif c - 1 >= 0 and last_c != c - 1 and can_move(source, maze[r][c - 1], "W"):
+    elif last_c != c - 1 and can_move(source, maze[r, c - 1], "W"):
         path.steps += 1
         path.last = path.curr
         path.curr = (r, c - 1)
         path.trail.add(path.curr)
-    elif c + 1 < len(maze[r]) and last_c != c + 1 and can_move(source, maze[r][c + 1], "E"):
+    elif last_c != c + 1 and can_move(source, maze[r, c + 1], "E"):
         path.steps += 1
         path.last = path.curr
         path.curr = (r, c + 1)
         path.trail.add(path.curr)
     else:
-        print(f"We are stuck")
+        log.info(f"We are stuck")
 
 
 def paths_at_same_coords(paths: List[Path]) -> bool:
     return len(set([p.curr for p in paths])) == 1 or paths[0].last == paths[1].curr
 
 
-def find_start(maze: List[List[str]]) -> Tuple[int, int]:
+def find_start(maze: Grid) -> Tuple[int, int]:
     """
     Finds the tile marked "S".
     :param maze: The maze being processed
     :return: A tuple representing the row and column that S is located at.
     """
-    for r in range(len(maze)):
-        for c in range(len(maze[r])):
-            if maze[r][c] == "S":
-                return r, c
+    return maze.find("S")
 
 
 if __name__ == '__main__':
@@ -3,24 +3,31 @@ from typing import List
 
 from day11utils import find_galaxies, galaxy_dist
 
+from aoc import inputs, log
+
 
 def main():
-    with open("input.txt") as f:
-        space = []
-        for line in f.readlines():
-            space.append(list(line.strip()))
-
-        expand_space(space)
-        galaxies = find_galaxies(space)
-        idx = 1
-        total = 0
-        for i in range(len(galaxies) - 1):
-            for j in range(i + 1, len(galaxies)):
-                dist = galaxy_dist(galaxies[i + 1], galaxies[j + 1])
-                total += dist
-                print(f"{idx} - ({i + 1}, {j + 1}) - {dist}")
-                idx += 1
-        print(total)
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    space = []
+    for line in inputs.text(data).splitlines(keepends=True):
+        space.append(list(line.strip()))
+
+    expand_space(space)
+    galaxies = find_galaxies(space)
+    idx = 1
+    total = 0
+    for i in range(len(galaxies) - 1):
+        for j in range(i + 1, len(galaxies)):
+            dist = galaxy_dist(galaxies[i + 1], galaxies[j + 1])
+            total += dist
+            if log.verbose:
+                log.info(f"{idx} - ({i + 1}, {j + 1}) - {dist}")
+            idx += 1
+    return total
 
 
 def expand_space(space: List[List[str]]) -> None:
@@ -49,7 +56,7 @@ def expand_space(space: List[List[str]]) -> None:
 
 def print_space(space):
     for row in space:
-        print(row)
+        log.info(row)
 
 
 if __name__ == '__main__':
@@ -3,23 +3,29 @@ from typing import List
 
 from day11utils import find_galaxies, galaxy_dist
 
+from aoc import inputs, log
+
 
 def main():
-    with open("input.txt") as f:
-        space = []
-        for line in f.readlines():
-            space.append(list(line.strip()))
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    space = []
+    for line in inputs.text(data).splitlines(keepends=True):
+        space.append(list(line.strip()))
 
-        galaxies = find_galaxies(space)
-        expand_space(space, galaxies, 1_000_000)
-        idx = 1
-        total = 0
-        for i in range(len(galaxies) - 1):
-            for j in range(i + 1, len(galaxies)):
-                dist = galaxy_dist(galaxies[i + 1], galaxies[j + 1])
-                total += dist
-                idx += 1
-        print(total)
+    galaxies = find_galaxies(space)
+    expand_space(space, galaxies, 1_000_000)
+    idx = 1
+    total = 0
+    for i in range(len(galaxies) - 1):
+        for j in range(i + 1, len(galaxies)):
+            dist = galaxy_dist(galaxies[i + 1], galaxies[j + 1])
+            total += dist
+            idx += 1
+    return total
 
 
 def expand_space(space: List[List[str]], galaxies, size=1_000_000):
@@ -62,7 +68,7 @@ def expand_space(space: List[List[str]], galaxies, size=1_000_000):
 
 def print_space(space):
     for row in space:
-        print(row)
+        log.info(row)
 
 
 if __name__ == '__main__':
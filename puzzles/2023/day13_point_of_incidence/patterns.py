@@ -0,0 +1,10 @@
+"""
+The patterns of ash and rocks, shared by both parts.
+"""
+from typing import List
+
+from aoc.grid import Grid
+
+
+def parse(data: bytes) -> List[Grid]:
+    return Grid.parse_many(data)
@@ -1,63 +1,57 @@
+from typing import List, Optional
+
+from aoc import log
+from aoc.grid import Grid
+from patterns import parse
+
+# The runner's entry points.  parse comes from patterns, so both parts share one list of patterns.
+__all__ = ["parse", "solve"]
+
+
 def main():
-    grids = []
-    with open("input.txt") as f:
-        grid = []
-        for line in f.readlines():
-            trimmed = line.strip()
-            if trimmed == "":
-                grids.append(grid)
-                grid = []
-            else:
-                grid.append(list(trimmed))
-        grids.append(grid)
+    with open("input.txt", "rb") as f:
+        print(solve(parse(f.read())))
 
+
+def solve(grids: List[Grid]) -> int:
     total_rows_above = 0
     total_columns_to_left = 0
 
     for grid in grids:
         # Check rows
-        is_match = True
-        for r in range(1, len(grid)):
-            # Assemble columns above and below into lists,
-            # then flip the list below so they can be properly compared
-            is_match = True
-            for c in range(len(grid[r])):
-                step = 1
-                while is_match and r - step >= 0 and r + (step - 1) < len(grid):
-                    # Make sure we don't go too far above or below
-                    above = grid[r - step][c]
-                    below = grid[r + step - 1][c]
-                    if above != below:
-                        is_match = False
-                    else:
-                        step += 1
-                if not is_match:
-                    break
+        rows_above = find_reflection(grid)
+        if rows_above:
+            total_rows_above += rows_above
+            if log.verbose:
+                log.info(f"Rows above: {rows_above}")
+            continue
+
+        # Check columns.  The columns of the grid are the rows of its transpose, which is just a
+        # different view of the same cells.
+        columns_to_left = find_reflection(grid.transposed())
+        if columns_to_left:
+            total_columns_to_left += columns_to_left
+            if log.verbose:
+                log.info(f"Columns to left: {columns_to_left}")
+
+    return total_columns_to_left + 100 * total_rows_above
+
 
-            if is_match:
-                total_rows_above += r
-                print(f"Rows above: {r}")
-                break
+def find_reflection(grid: Grid) -> Optional[int]:
+    """
+    Find the row that a horizontal line of reflection sits above.
 
-        if not is_match:
-            # Check columns
-            grid_width = len(grid[0])
-            for c in range(1, grid_width):
-                is_match = True
-                sz = min(c, grid_width - c)
-                for r in range(len(grid)):
-                    left = grid[r][c - sz:c]
-                    right = grid[r][c:c + sz]
-                    right.reverse()
-                    if left != right:
-                        is_match = False
-                        break
-                if is_match:
-                    total_columns_to_left += c
-                    print(f"Columns to left: {c}")
-                    break
+    Each row above the line is compared against the row the same distance below it, stopping once
+    we run out of rows on either side.
 
-    print(total_columns_to_left + 100 * total_rows_above)
+    :param grid: The grid being evaluated
+    :return: The number of rows above the line of reflection, or None if there isn't one.
+    """
+    for r in range(1, grid.height):
+        steps = min(r, grid.height - r)
+        if all(grid.row(r - step) == grid.row(r + step - 1) for step in range(1, steps + 1)):
+            return r
+    return None
 
 
 if __name__ == '__main__':
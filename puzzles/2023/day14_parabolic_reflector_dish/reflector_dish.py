@@ -0,0 +1,8 @@
+"""
+The platform of rocks on the reflector dish, shared by both parts.
+"""
+from aoc.grid import Grid
+
+
+def parse(data: bytes) -> Grid:
+    return Grid.parse(data)
@@ -1,53 +1,57 @@
-from typing import List
+from aoc import log
+from aoc.grid import Grid
+from reflector_dish import parse
+
+# The runner's entry points.  parse comes from reflector_dish, so both parts share one parsed platform.
+__all__ = ["parse", "solve"]
 
 
 def main():
-    platform = []
-    with open("input.txt") as f:
-        for line in f.readlines():
-            platform.append(list(line.strip()))
+    with open("input.txt", "rb") as f:
+        print(solve(parse(f.read())))
+
 
+def solve(platform: Grid) -> int:
+    # Tilting moves the rocks in place, so leave the shared platform as it was parsed
+    platform = platform.copy()
     has_movement = move_north(platform)
     print_platform(platform)
-    print()
+    log.info()
     while has_movement:
         has_movement = move_north(platform)
         print_platform(platform)
-        print()
+        log.info()
 
-    print(calc_load(platform))
+    return calc_load(platform)
 
 
-def calc_load(platform: List[List[str]]) -> int:
+def calc_load(platform: Grid) -> int:
     load = 0
-    load_factor = len(platform)
-    for r in range(len(platform)):
-        for c in range(len(platform[r])):
-            if platform[r][c] == "O":
-                load += load_factor
+    load_factor = platform.height
+    for row in platform.rows():
+        load += row.tobytes().count(b"O") * load_factor
         load_factor -= 1
     return load
 
 
-def move_north(platform: List[List[str]]) -> bool:
+def move_north(platform: Grid) -> bool:
     has_movement = False
-    for r in range(len(platform)):
-        for c in range(len(platform[r])):
-            if platform[r][c] in {".", "#"}:
+    for r in range(platform.height):
+        for c in range(platform.width):
+            if platform[r, c] in {".", "#"}:
                 continue
 
-            # We have a round rock.  Try to move it up
-            if r > 0 and platform[r - 1][c] == ".":
-                platform[r - 1][c] = "O"
-                platform[r][c] = "."
+            # We have a round rock.  Try to move it up.  Off the top of the platform is the
+            # grid's PAD border, so that never looks like an empty space.
+            if platform[r - 1, c] == ".":
+                platform[r - 1, c] = "O"
+                platform[r, c] = "."
                 has_movement = True
     return has_movement
 
 
-def print_platform(platform: List[List[str]]) -> None:
-    for row in platform:
-        line = "".join(row)
-        print(line)
+def print_platform(platform: Grid) -> None:
+    log.info(platform)
 
 
 if __name__ == '__main__':
@@ -1,24 +1,42 @@
-from typing import List, Optional
+from typing import Dict, Optional
+
+from aoc import log
+from aoc.grid import Grid
+from reflector_dish import parse
+
+# The runner's entry points.  parse comes from reflector_dish, so both parts share one parsed platform.
+__all__ = ["parse", "solve"]
+
+ROUND_ROCK = ord("O")
+CUBE_ROCK = ord("#")
+EMPTY = ord(".")
+
+# Number of clockwise rotations that bring each edge of the platform to the top
+ROTATIONS = {"N": 0, "W": 1, "S": 2, "E": 3}
 
 
 def main():
-    platform = []
-    with open("input.txt") as f:
-        for line in f.readlines():
-            platform.append(list(line.strip()))
+    with open("input.txt", "rb") as f:
+        print(solve(parse(f.read())))
+
 
-    snapshots = [deep_copy(platform)]
+def solve(platform: Grid) -> int:
+    # Tilting moves the rocks in place, so leave the shared platform as it was parsed
+    platform = platform.copy()
+    snapshots = [platform.copy()]
+    seen = {snapshots[0]: 0}
     cycle_start_idx = 0
     cycle = 0
     for cycle in range(1_000_000_000):
         run_cycle(platform)
-        iteration = detect_cycle(snapshots, platform)
-        if iteration:
-            print(f"Iteration {cycle} has same snapshot as iteration {iteration}")
+        iteration = detect_cycle(seen, platform)
+        if iteration is not None:
+            log.info(f"Iteration {cycle} has same snapshot as iteration {iteration}")
             cycle_start_idx = iteration
             break
         else:
-            snapshots.append(deep_copy(platform))
+            snapshots.append(platform.copy())
+            seen[snapshots[-1]] = len(snapshots) - 1
             cycle_start_idx = len(snapshots) - 1
 
     # Now that we know there is a cycle, we don't need to run every single
@@ -38,29 +56,20 @@ def main():
     cycle_idx = i_ % cycle_length
     final_snapshot = cycle_snapshots[cycle_idx]
 
-    print(f"{cycle_idx} - {calc_load(final_snapshot)}")
+    return calc_load(final_snapshot)
 
 
-def detect_cycle(snapshots, platform) -> Optional[int]:
+def detect_cycle(seen: Dict[Grid, int], platform: Grid) -> Optional[int]:
     """
     Check if the current state of the platform is the same as one of the existing snapshots
-    from a previous iteration.
+    from a previous iteration.  Snapshots are keyed on their contents, so this is a single hash
+    lookup rather than a comparison against every snapshot.
 
-    :param snapshots: Collection of snapshots of previous platform states.
+    :param seen: Snapshots of previous platform states, mapped to the iteration they were taken in.
     :param platform: The current state of the platform.
     :return: The snapshot index of a matching snapshot, or None if no match.
     """
-    for i in range(len(snapshots)):
-        if platform == snapshots[i]:
-            return i
-    return None
-
-
-def deep_copy(platform):
-    copy_of_platform = []
-    for row in platform:
-        copy_of_platform.append(list(row))
-    return copy_of_platform
+    return seen.get(platform)
 
 
 def run_cycle(platform) -> None:
@@ -78,18 +87,16 @@ def run_cycle(platform) -> None:
         pass
 
 
-def calc_load(platform: List[List[str]]) -> int:
+def calc_load(platform: Grid) -> int:
     load = 0
-    load_factor = len(platform)
-    for r in range(len(platform)):
-        for c in range(len(platform[r])):
-            if platform[r][c] == "O":
-                load += load_factor
+    load_factor = platform.height
+    for row in platform.rows():
+        load += row.tobytes().count(b"O") * load_factor
         load_factor -= 1
     return load
 
 
-def move(platform: List[List[str]], direction: str) -> bool:
+def move(platform: Grid, direction: str) -> bool:
     """
     Tilt the platform in the specified direction and report whether any movement occurred.
 
@@ -97,43 +104,40 @@ def move(platform: List[List[str]], direction: str) -> bool:
     only stops when no movement is detected.  Instead, I moved those while loops up into
     run_cycle().
 
+    Rather than handling each direction separately, the platform is rotated so that the direction
+    being tilted towards is at the top, and the rocks are moved "north" on that view.  Rotating a
+    grid doesn't copy it, so the rocks move on the original platform.  Each rock rolls all the way
+    in one pass, so the second call in run_cycle() just confirms nothing else moves.
+
     :param platform: The platform to manipulate.
     :param direction: The direction to tilt the platform.  One of "N", "W", "S", "E".
     :return: True, if any rocks moved.  False, otherwise.
     """
+    view = platform
+    for _ in range(ROTATIONS[direction]):
+        view = view.rotated()
+
+    # Walk down each column, remembering the highest empty space each rock could roll into.
+    data = view.data
     has_movement = False
-    for r in range(len(platform)):
-        for c in range(len(platform[r])):
-            if platform[r][c] in {".", "#"}:
-                continue
-
-            if direction == "N":
-                if r > 0 and platform[r - 1][c] == ".":
-                    platform[r - 1][c] = "O"
-                    platform[r][c] = "."
-                    has_movement = True
-            elif direction == "W":
-                if c > 0 and platform[r][c - 1] == ".":
-                    platform[r][c - 1] = "O"
-                    platform[r][c] = "."
-                    has_movement = True
-            elif direction == "S":
-                if r < len(platform) - 1 and platform[r + 1][c] == ".":
-                    platform[r + 1][c] = "O"
-                    platform[r][c] = "."
-                    has_movement = True
-            elif direction == "E":
-                if c < len(platform[r]) - 1 and platform[r][c + 1] == ".":
-                    platform[r][c + 1] = "O"
-                    platform[r][c] = "."
+    for c in range(view.width):
+        i = view.index(0, c)
+        free = i
+        for _ in range(view.height):
+            if data[i] == CUBE_ROCK:
+                free = i + view.row_step
+            elif data[i] == ROUND_ROCK:
+                if free != i:
+                    data[free] = ROUND_ROCK
+                    data[i] = EMPTY
                     has_movement = True
+                free += view.row_step
+            i += view.row_step
     return has_movement
 
 
-def print_platform(platform: List[List[str]]) -> None:
-    for row in platform:
-        line = "".join(row)
-        print(line)
+def print_platform(platform: Grid) -> None:
+    log.info(platform)
 
 
 if __name__ == '__main__':
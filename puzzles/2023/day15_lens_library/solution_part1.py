@@ -1,22 +1,26 @@
+from aoc import inputs, log
+
+
 def main():
-    with open("input.txt") as f:
-        inputs = f.read().strip().split(",")
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    steps = inputs.text(data).strip().split(",")
 
-    print(sum([do_hash(i) for i in inputs]))
+    return sum([do_hash(i) for i in steps])
 
 
 def do_hash(input_str: str) -> int:
     val = 0
     for c in input_str:
-        print(f"\n\nProcessing {c}")
         ascii_code = ord(c)
-        print(f"ASCII code for {c} is {ascii_code}")
         val += ascii_code
-        print(f"Current value is now {val} after incrementing by ASCII code")
         val *= 17
-        print(f"Current value is now {val} after multiplying by 17")
         val %= 256
-        print(f"Current value is now {val} after modding by 256")
+        if log.verbose:
+            log.info(f"Processed {c} (ASCII code {ascii_code}), current value is now {val}")
     return val
 
 
@@ -2,6 +2,8 @@ import dataclasses
 import re
 from typing import List
 
+from aoc import inputs, log
+
 
 @dataclasses.dataclass
 class Lens:
@@ -47,11 +49,15 @@ class Box:
 
 
 def main():
-    with open("input.txt") as f:
-        inputs = f.read().strip().split(",")
+    with open("input.txt", "rb") as f:
+        print(solve(f.read()))
+
+
+def solve(data: bytes) -> int:
+    steps = inputs.text(data).strip().split(",")
 
     boxes = {i: Box(i, []) for i in range(256)}
-    for i in inputs:
+    for i in steps:
         parts = re.split("[=-]", i)
         label = parts[0]
         box_num = do_hash(label)
@@ -65,16 +71,18 @@ def main():
             focal_length = int(parts[1])
             lens = Lens(label, focal_length)
             box.add_replace_lens(lens)
-        print(box)
+        if log.verbose:
+            log.info(box)
 
-    print(sum([box.calculate_focusing_power() for box in boxes.values()]))
+    return sum([box.calculate_focusing_power() for box in boxes.values()])
 
 
 def print_boxes(boxes: List[Box]) -> None:
     for b in boxes:
         if not b.lenses:
             continue
-        print(b)
+        if log.verbose:
+            log.info(b)
 
 
 def do_hash(input_str: str) -> int:
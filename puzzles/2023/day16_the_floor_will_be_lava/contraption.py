@@ -0,0 +1,96 @@
+"""
+The contraption's tiles and how beams move through them, shared by both parts.
+"""
+import dataclasses
+from typing import List, Optional, Set, Tuple
+
+from aoc import log, metrics
+from aoc.grid import PAD, Grid
+
+# Where a beam heading in each direction goes after bouncing off a mirror
+REFLECTIONS = {
+    "/": {"U": "R", "D": "L", "L": "D", "R": "U"},
+    "\\": {"U": "L", "D": "R", "L": "U", "R": "D"},
+}
+# The directions a splitter sends a beam that hits its flat side
+SPLITS = {"|": ("U", "D"), "-": ("L", "R")}
+DELTAS = {"U": (-1, 0), "D": (1, 0), "L": (0, -1), "R": (0, 1)}
+
+
+@dataclasses.dataclass
+class Beam:
+    r: int
+    c: int
+    direction: str
+    deleted: bool
+
+    def __str__(self):
+        return f"({self.r},{self.c}) {self.direction}"
+
+
+def parse(data: bytes) -> Grid:
+    return Grid.parse(data)
+
+
+def print_grid(grid: Grid, not_energized: Set[Tuple[int, int]]):
+    for r in range(grid.height):
+        row = ""
+        for c in range(grid.width):
+            if grid[r, c] in {"\\", "/", "-", "|"} or (r, c) in not_energized:
+                row += grid[r, c]
+            else:
+                row += "#"
+        log.info(row)
+    log.info("\n\n")
+
+
+def move_beams(grid: Grid, beams: List[Beam], not_energized: Set[Tuple[int, int]],
+               splitters_used: Set[Tuple[int, int]]):
+    # Every beam takes one step per call, so the beams are the frontier and each step is one expansion
+    stats = metrics.counters("beams")
+    if stats is not None:
+        stats.expanded += len(beams)
+        stats.frontier(len(beams))
+    to_delete = []
+    for beam in beams:
+        move_beam(grid, beams, beam, not_energized, splitters_used, stats)
+        if beam.deleted:
+            to_delete.append(beam)
+
+    while to_delete:
+        beams.remove(to_delete.pop())
+
+
+def move_beam(grid: Grid, beams: List[Beam], beam: Beam, not_energized: Set[Tuple[int, int]],
+              splitters_used: Set[Tuple[int, int]], stats: Optional[metrics.SearchCounters]):
+    tile = grid[beam.r, beam.c]
+    not_energized.discard((beam.r, beam.c))
+
+    if tile in SPLITS and beam.direction not in SPLITS[tile]:
+        # Hitting the flat side of a splitter sends the beam out of both ends.  Any beam that hits
+        # the same splitter later would only retrace those steps, so drop it.
+        if (beam.r, beam.c) in splitters_used:
+            beam.deleted = True
+            if stats is not None:
+                stats.dedup_hits += 1
+        else:
+            first, second = SPLITS[tile]
+            beam.direction = first
+            beams.append(Beam(beam.r, beam.c, second, False))
+            if stats is not None:
+                stats.pushed += 1
+            splitters_used.add((beam.r, beam.c))
+        return
+
+    if tile in REFLECTIONS:
+        beam.direction = REFLECTIONS[tile][beam.direction]
+    dr, dc = DELTAS[beam.direction]
+    beam.r += dr
+    beam.c += dc
+    if grid.data[grid.index(beam.r, beam.c)] == PAD:
+        # The beam has left the grid
+        beam.deleted = True
+
+
+def count_energized(grid: Grid, not_energized: Set[Tuple[int, int]]) -> int:
+    return grid.height * grid.width - len(not_energized)
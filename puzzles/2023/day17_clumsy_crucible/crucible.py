@@ -0,0 +1,328 @@
+"""
+Search engine shared by both parts of the clumsy crucible puzzle.
+
+A crucible has to move at least `min_run` and at most `max_run` blocks in a straight line before
+it turns.  Instead of stepping one block at a time, the search jumps straight to the end of every
+legal run segment after a turn.  The run length then never needs to be part of the state: a state
+is just the cell the crucible stopped in and the axis it arrived along, and the next move is
+always a turn onto the other axis.
+
+States are numbered `(r * width + c) * 2 + axis`, so the searches can keep their distance and
+predecessor tables in flat arrays allocated when the search starts, and the heap only ever holds the
+frontier.  Memory therefore grows by a fixed amount per state (plus one byte per cell for the heat
+loss values) no matter how large the grid gets.
+
+Three search modes are available:
+
+* `DIJKSTRA` - plain Dijkstra from the start.  A run costs at most 9 per block, so the distances stay
+  small and it uses `aoc.search.dial`, which keeps the frontier in a bucket per distance instead of a
+  heap.
+* `ASTAR` - Dijkstra ordered by distance plus the cheapest heat loss from each cell to the end
+  when the run-length rules are ignored.  That heuristic is computed up front with a reverse
+  Dijkstra over the cells, and since it never overestimates, the first time the end is popped
+  is still optimal.
+* `BIDIRECTIONAL` - searches forwards from the start and backwards from the end at the same time
+  and stops once the two frontiers can no longer produce a cheaper meeting point.
+"""
+import dataclasses
+from array import array
+from itertools import chain
+from typing import Iterator, List, Optional, Tuple
+
+from aoc import metrics
+from aoc.grid import Grid
+from aoc.search import astar, dial, dijkstra
+from priority_queue import AocPriorityQueue
+
+HORIZONTAL = 0
+VERTICAL = 1
+AXES = [HORIZONTAL, VERTICAL]
+
+# The two directions that can be taken along each axis
+AXIS_DELTAS = [[(0, 1), (0, -1)], [(1, 0), (-1, 0)]]
+
+# Marks entries of the flat tables that the search hasn't reached yet
+UNVISITED = 2 ** 31 - 1
+NO_PREV = -1
+
+# Maps the ASCII digits of the puzzle input to their values
+DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+DIJKSTRA = "dijkstra"
+ASTAR = "astar"
+BIDIRECTIONAL = "bidirectional"
+MODES = [DIJKSTRA, ASTAR, BIDIRECTIONAL]
+
+
+@dataclasses.dataclass
+class City:
+    heat: bytes
+    height: int
+    width: int
+    min_run: int
+    max_run: int
+
+    @classmethod
+    def from_grid(cls, grid: Grid, min_run: int, max_run: int) -> "City":
+        """
+        Convert the grid's ASCII digits into a single buffer of heat loss values.
+        """
+        if min_run < 1 or max_run < min_run:
+            raise ValueError(f"Invalid run lengths: min_run={min_run}, max_run={max_run}")
+        return City(grid.tobytes().translate(DIGIT_VALUES), grid.height, grid.width, min_run, max_run)
+
+    @classmethod
+    def from_file(cls, filename: str, min_run: int, max_run: int) -> "City":
+        return cls.from_grid(Grid.read(filename), min_run, max_run)
+
+    @property
+    def num_states(self) -> int:
+        return self.height * self.width * len(AXES)
+
+    @property
+    def start_states(self) -> List[int]:
+        # The crucible hasn't moved yet, so it can leave the start along either axis.
+        return [encode_state(self.width, 0, 0, axis) for axis in AXES]
+
+    @property
+    def end_states(self) -> List[int]:
+        return [encode_state(self.width, self.height - 1, self.width - 1, axis) for axis in AXES]
+
+    def moves_from(self, state: int) -> Iterator[Tuple[int, int]]:
+        """
+        Turn onto the other axis and try every legal run length in both directions along it.
+
+        :return: (state, heat loss) for every state reachable with a single run segment
+        """
+        heat = self.heat
+        min_run = self.min_run
+        cell, axis = divmod(state, len(AXES))
+        r, c = divmod(cell, self.width)
+        next_axis = 1 - axis
+        if next_axis == HORIZONTAL:
+            # (step between cells, blocks left before the edge of the map) going right, then left
+            directions = [(1, self.width - 1 - c), (-1, c)]
+        else:
+            directions = [(self.width, self.height - 1 - r), (-self.width, r)]
+        for step, room in directions:
+            if room < min_run:
+                continue
+            dest_cell = cell
+            cost = 0
+            # The blocks the crucible has to cross before it is allowed to stop
+            for _ in range(min_run - 1):
+                dest_cell += step
+                cost += heat[dest_cell]
+            for _ in range(min(room, self.max_run) - min_run + 1):
+                dest_cell += step
+                cost += heat[dest_cell]
+                yield dest_cell * len(AXES) + next_axis, cost
+
+    def moves_into(self, state: int) -> Iterator[Tuple[int, int]]:
+        """
+        The reverse of `moves_from()`: the crucible arrived along `axis`, so walk back along it to
+        every cell a legal run segment could have started from.
+
+        :return: (state, heat loss) for every state that can reach this one with a single run segment
+        """
+        cell, axis = divmod(state, len(AXES))
+        r, c = divmod(cell, self.width)
+        prev_axis = 1 - axis
+        for dr, dc in AXIS_DELTAS[axis]:
+            src_r = r
+            src_c = c
+            src_cell = cell
+            step = dr * self.width + dc
+            cost = 0
+            for run in range(1, self.max_run + 1):
+                cost += self.heat[src_cell]
+                src_r -= dr
+                src_c -= dc
+                if not (0 <= src_r < self.height and 0 <= src_c < self.width):
+                    break
+                src_cell -= step
+                if run >= self.min_run:
+                    yield src_cell * len(AXES) + prev_axis, cost
+
+    def blocks_along(self, states: List[int]) -> List[Tuple[int, int]]:
+        """
+        Expand the states the crucible turns at into every block it passes through.
+        """
+        blocks = []
+        for state in states:
+            r, c = divmod(state // len(AXES), self.width)
+            if blocks:
+                last_r, last_c = blocks[-1]
+                dr = (r > last_r) - (r < last_r)
+                dc = (c > last_c) - (c < last_c)
+                while (last_r, last_c) != (r, c):
+                    last_r += dr
+                    last_c += dc
+                    blocks.append((last_r, last_c))
+            else:
+                blocks.append((r, c))
+        return blocks
+
+    def heat_to_end(self) -> array:
+        """
+        The least heat loss from every cell to the end when the run-length rules are ignored.
+        This is a reverse Dijkstra over the cells, and is used as the A* heuristic.
+        """
+        def edges_out(cell: int) -> Iterator[Tuple[int, int]]:
+            # Searching backwards, so moving from a neighbor into this cell costs this cell's heat loss
+            r, c = divmod(cell, self.width)
+            for dr, dc in chain.from_iterable(AXIS_DELTAS):
+                if 0 <= r + dr < self.height and 0 <= c + dc < self.width:
+                    yield cell + dr * self.width + dc, self.heat[cell]
+
+        end_cell = self.height * self.width - 1
+        return dijkstra(self.height * self.width, [end_cell], edges_out, stats=metrics.counters("heuristic")).dist
+
+
+def encode_state(width: int, r: int, c: int, axis: int) -> int:
+    return (r * width + c) * len(AXES) + axis
+
+
+def solve(grid: Grid,
+          min_run: int,
+          max_run: int,
+          mode: str = DIJKSTRA,
+          stats: Optional[metrics.SearchCounters] = None) -> int:
+    """
+    Find the least heat loss from the top-left block to the bottom-right block.
+
+    :param grid: Heat loss of each city block
+    :param min_run: Fewest blocks the crucible can move in a straight line before turning or stopping
+    :param max_run: Most blocks the crucible can move in a straight line before it has to turn
+    :param mode: One of DIJKSTRA, ASTAR or BIDIRECTIONAL
+    :param stats: Counters to fill in, instead of the ones `aoc.metrics` keeps for the mode
+    :return: The least heat loss that can be incurred
+    """
+    cost, _ = search(City.from_grid(grid, min_run, max_run), mode, stats)
+    return cost
+
+
+def find_path(grid: Grid,
+              min_run: int,
+              max_run: int,
+              mode: str = DIJKSTRA,
+              stats: Optional[metrics.SearchCounters] = None) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Same as `solve()`, but also returns every block the crucible passes through, start to end.
+    """
+    city = City.from_grid(grid, min_run, max_run)
+    cost, states = search(city, mode, stats)
+    return cost, city.blocks_along(states)
+
+
+def search(city: City, mode: str = DIJKSTRA,
+           stats: Optional[metrics.SearchCounters] = None) -> Tuple[int, List[int]]:
+    """
+    :return: The least heat loss, and the states the crucible turns at on the way there
+    """
+    if stats is None:
+        stats = metrics.counters(mode)
+    if mode == DIJKSTRA:
+        return forward_search(city, None, stats)
+    elif mode == ASTAR:
+        return forward_search(city, city.heat_to_end(), stats)
+    elif mode == BIDIRECTIONAL:
+        return bidirectional_dijkstra(city, stats)
+    raise ValueError(f"Unknown search mode {mode}, expected one of {MODES}")
+
+
+def follow_prev(prev: array, state: int) -> List[int]:
+    """
+    Walk a predecessor table from `state` until a state with no predecessor is reached.
+    """
+    states = [state]
+    while prev[state] != NO_PREV:
+        state = prev[state]
+        states.append(state)
+    return states
+
+
+def forward_search(city: City, heuristic: Optional[array],
+                   stats: Optional[metrics.SearchCounters]) -> Tuple[int, List[int]]:
+    """
+    `aoc.search.dial` from the start to the end, or `aoc.search.astar` ordered by distance plus
+    the heuristic when one is given.
+    """
+    end_states = set(city.end_states)
+    if heuristic is None:
+        found = dial(city.num_states, city.start_states, city.moves_from, end_states.__contains__, stats)
+    else:
+        found = astar(city.num_states, city.start_states, city.moves_from,
+                      lambda state: heuristic[state // len(AXES)], end_states.__contains__, stats)
+    if found.found is None:
+        raise ValueError("No path to the bottom-right corner")
+    return found.dist[found.found], found.path(found.found)
+
+
+def bidirectional_dijkstra(city: City, stats: Optional[metrics.SearchCounters]) -> Tuple[int, List[int]]:
+    """
+    Run Dijkstra forwards from the start and backwards from the end, always expanding whichever
+    frontier is closer.  Every time an edge links a state reached by one side to a state reached by
+    the other, that is a candidate path.  Once the two frontiers together are at least as expensive
+    as the best candidate, no cheaper path can exist.
+
+    The backward search's predecessor table points towards the end, so the path is the forward
+    chain up to the best meeting edge followed by the backward chain from there.
+    """
+    if stats is None:
+        # Not the default mode, so it counts into throwaway counters rather than keeping an uncounted copy
+        stats = metrics.SearchCounters()
+    # A state that is both a start and an end means the grid is a single block.
+    for state in city.start_states:
+        if state in city.end_states:
+            return 0, [state]
+
+    best = UNVISITED
+    # (last state of the forward chain, first state of the backward chain) for the best path so far
+    meeting = None
+    searches = []
+    for sources, expand in [(city.start_states, city.moves_from), (city.end_states, city.moves_into)]:
+        q = AocPriorityQueue()
+        dist_to = array('i', [UNVISITED]) * city.num_states
+        prev = array('i', [NO_PREV]) * city.num_states
+        for source in sources:
+            dist_to[source] = 0
+            q.push(source, 0)
+            stats.pushed += 1
+        searches.append((q, dist_to, prev, expand))
+
+    while True:
+        forward_top = searches[0][0].peek_dist()
+        backward_top = searches[1][0].peek_dist()
+        if forward_top is None or backward_top is None or forward_top + backward_top >= best:
+            break
+
+        side = 0 if forward_top <= backward_top else 1
+        q, dist_to, prev, expand = searches[side]
+        other_dist_to = searches[1 - side][1]
+        v, dist = q.pop()
+        stats.expanded += 1
+
+        for dest_state, cost in expand(v):
+            dest_cost = dist + cost
+            if dest_cost < dist_to[dest_state]:
+                dist_to[dest_state] = dest_cost
+                prev[dest_state] = v
+                q.push(dest_state, dest_cost)
+                stats.pushed += 1
+            else:
+                stats.dedup_hits += 1
+            if other_dist_to[dest_state] != UNVISITED and dest_cost + other_dist_to[dest_state] < best:
+                best = dest_cost + other_dist_to[dest_state]
+                meeting = (v, dest_state) if side == 0 else (dest_state, v)
+        stats.frontier(searches[0][0].queue_length() + searches[1][0].queue_length())
+
+    if meeting is None:
+        raise ValueError("No path to the bottom-right corner")
+    forward_prev = searches[0][2]
+    backward_prev = searches[1][2]
+    return best, follow_prev(forward_prev, meeting[0])[::-1] + follow_prev(backward_prev, meeting[1])
+
+
+def parse(data: bytes) -> Grid:
+    return Grid.parse(data)
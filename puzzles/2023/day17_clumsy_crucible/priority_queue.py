@@ -1,37 +1,45 @@
-import dataclasses
-from heapq import heappop, heappush, heapify
-from typing import List, Dict
+from heapq import heappop, heappush
+from typing import List, Dict, Optional, Tuple
 
 
 class AocPriorityQueue:
+    """
+    Min-heap of integer-encoded states, keyed on their distance.
+
+    Lowering the distance of a state that is already queued doesn't search the heap for the old
+    entry (lazy deletion).  The old entry stays where it is and is skipped when it is popped,
+    because its distance no longer matches the one recorded in `entry_finder`.
+    """
+
     def __init__(self):
-        self.q: List[HeapItem] = []
-        self.entry_finder: Dict[str, HeapItem] = {}
-        heapify(self.q)
+        self.q: List[Tuple[int, int]] = []
+        self.entry_finder: Dict[int, int] = {}
 
     def queue_length(self):
         return len(self.q)
 
-    def add_task(self, task: "HeapItem") -> None:
-        cache_entry = self.entry_finder.get(task.q_val)
-        if cache_entry:
-            cache_entry.removed = True
-        heappush(self.q, task)
-        self.entry_finder[task.q_val] = task
+    def push(self, state: int, dist: int) -> None:
+        self.entry_finder[state] = dist
+        heappush(self.q, (dist, state))
 
-    def pop_task(self) -> "HeapItem":
+    def pop(self) -> Tuple[int, int]:
+        entry_finder = self.entry_finder
         while self.q:
-            task = heappop(self.q)
-            if not task.removed:
-                return task
+            dist, state = heappop(self.q)
+            if entry_finder.get(state) == dist:
+                del entry_finder[state]
+                return state, dist
         raise KeyError('pop from an empty priority queue')
 
-
-@dataclasses.dataclass
-class HeapItem:
-    q_val: str
-    dist: int
-    removed: bool
-
-    def __lt__(self, other):
-        return self.dist < other.dist
+    def peek_dist(self) -> Optional[int]:
+        """
+        The lowest distance still in the queue, or None if it is empty.  Stale entries sitting on
+        top of the heap are discarded along the way.
+        """
+        entry_finder = self.entry_finder
+        while self.q:
+            dist, state = self.q[0]
+            if entry_finder.get(state) == dist:
+                return dist
+            heappop(self.q)
+        return None
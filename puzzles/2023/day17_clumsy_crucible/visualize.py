@@ -0,0 +1,57 @@
+"""
+Render the heat loss map with the crucible's cheapest path drawn over it.
+
+    python visualize.py <input file> <min run> <max run> <output png> [mode]
+
+The search's own heat loss buffer is read by NumPy as a zero-copy view.  The only copy made is the one
+the path is painted into, at one byte per block, which matplotlib's `imsave` colors through a palette of
+the heat loss values plus one path color.  The path comes from the predecessor tables the search already
+filled in instead of a second search.
+"""
+import sys
+from typing import List, Tuple
+
+from crucible import DIJKSTRA, City, search
+
+# Palette entries 0-9 are the heat loss values, from cool to hot
+HEAT_COLORS = [
+    "#000004", "#160b39", "#420a68", "#6a176e", "#932667",
+    "#bc3754", "#dd513a", "#f37819", "#fca50a", "#f6d746",
+]
+PATH_COLOR = "#00ffff"
+PATH_INDEX = len(HEAT_COLORS)
+
+
+def export_path_png(city: City, path: List[Tuple[int, int]], filename: str, pixels_per_block: int = 4) -> None:
+    # matplotlib is only needed for the picture, so don't make the solvers depend on it.
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from matplotlib.colors import ListedColormap
+
+    blocks = np.frombuffer(city.heat, dtype=np.uint8).reshape(city.height, city.width).copy()
+    if path:
+        rows, cols = zip(*path)
+        blocks[list(rows), list(cols)] = PATH_INDEX
+    image = blocks.repeat(pixels_per_block, axis=0).repeat(pixels_per_block, axis=1)
+    plt.imsave(filename, image, cmap=ListedColormap(HEAT_COLORS + [PATH_COLOR]), vmin=0, vmax=PATH_INDEX)
+
+
+def main():
+    if len(sys.argv) < 5:
+        print(__doc__)
+        sys.exit(1)
+    filename, min_run, max_run, png = sys.argv[1], int(sys.argv[2]), int(sys.argv[3]), sys.argv[4]
+    mode = sys.argv[5] if len(sys.argv) > 5 else DIJKSTRA
+
+    city = City.from_file(filename, min_run, max_run)
+    cost, states = search(city, mode)
+    path = city.blocks_along(states)
+    print(f"Least heat loss is {cost} over {len(path)} blocks")
+    export_path_png(city, path, png)
+    print(f"Wrote {png}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,19 @@
+"""
+Puts the puzzle directories whose helper modules the tests use on `sys.path`, so the tests import them
+by name (`from almanac import ...`) the same way the solutions do when run as scripts.  The helper
+modules' names are all different, so one path serves every test.
+"""
+import sys
+from pathlib import Path
+
+PUZZLES = Path(__file__).resolve().parent.parent / "puzzles"
+
+HELPER_DIRS = [
+    PUZZLES / "2022" / "16_proboscidea_volcanium",
+    PUZZLES / "2023" / "day05_fertilizer",
+    PUZZLES / "2023" / "day17_clumsy_crucible",
+]
+
+for directory in HELPER_DIRS:
+    if str(directory) not in sys.path:
+        sys.path.insert(0, str(directory))
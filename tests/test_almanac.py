@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from almanac import MapRange, PiecewiseMap, Ranges, compose, merge_intervals
+
+# Small enough that every value can be checked
+DOMAIN = 200
+
+
+def random_ranges(rng: random.Random) -> Ranges:
+    """
+    A one-to-one map like the almanac's: ranges that don't overlap, sent to destinations that don't overlap.
+    """
+    cuts = sorted(rng.sample(range(DOMAIN), rng.randint(0, 12)))
+    pieces = list(zip(cuts[::2], cuts[1::2]))
+    dests = list(range(len(pieces)))
+    rng.shuffle(dests)
+    # Send the pieces to shuffled slots above the domain, so they can't collide with the gaps either
+    slot = DOMAIN // 2
+    return Ranges(MapRange(DOMAIN + dest * slot, start, end - start) for dest, (start, end) in zip(dests, pieces))
+
+
+def lookup_chain(maps, value):
+    for m in maps:
+        value = m.lookup(value)
+    return value
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_piecewise_map_matches_ranges(seed):
+    ranges = random_ranges(random.Random(seed))
+    piecewise = PiecewiseMap.from_ranges(ranges)
+    assert all(piecewise.lookup(value) == ranges.lookup(value) for value in range(DOMAIN * 2))
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_composition_matches_mapping_each_point(seed):
+    rng = random.Random(seed)
+    maps = [random_ranges(rng) for _ in range(rng.randint(1, 7))]
+    composed = compose(PiecewiseMap.from_ranges(m) for m in maps)
+    # The composed map is as short as it can be: neighboring pieces never shift by the same amount
+    assert all(a != b for a, b in zip(composed.offsets, composed.offsets[1:]))
+    # Destinations can land far above the domain, so check the values they start from
+    assert all(composed.lookup(value) == lookup_chain(maps, value) for value in range(DOMAIN * 2))
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_lookup_intervals_matches_mapping_each_point(seed):
+    rng = random.Random(seed)
+    ranges = random_ranges(rng)
+    intervals = []
+    for _ in range(rng.randint(1, 4)):
+        start = rng.randrange(DOMAIN)
+        intervals.append((start, rng.randint(start + 1, DOMAIN)))
+    expected = {ranges.lookup(value) for start, end in intervals for value in range(start, end)}
+    mapped = ranges.lookup_intervals(intervals)
+    assert {value for start, end in mapped for value in range(start, end)} == expected
+    # Merged: sorted, with a gap between every pair of intervals
+    assert all(a_end < b_start for (_, a_end), (b_start, _) in zip(mapped, mapped[1:]))
+
+
+def test_lookup_many_matches_lookup():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(0)
+    maps = [random_ranges(rng) for _ in range(7)]
+    composed = compose(PiecewiseMap.from_ranges(m) for m in maps)
+    values = np.arange(DOMAIN * 2)
+    assert composed.lookup_many(values).tolist() == [composed.lookup(int(value)) for value in values]
+
+
+def test_empty_ranges_map_everything_to_itself():
+    ranges = Ranges([])
+    assert len(ranges) == 0
+    assert ranges.gaps == []
+    assert ranges.end == 0
+    assert list(ranges.pieces()) == [(0, 0)]
+    assert ranges.lookup_many([0, 5, 2 ** 40]) == [0, 5, 2 ** 40]
+    assert PiecewiseMap.from_ranges(ranges).lookup(7) == 7
+
+
+def test_ranges_find_their_gaps():
+    ranges = Ranges([MapRange(100, 10, 5), MapRange(50, 0, 3), MapRange(0, 3, 2)])
+    # Sorted by source, with the touching ranges at 0 and 3 leaving no gap between them
+    assert [r.source for r in ranges] == [0, 3, 10]
+    assert ranges.gaps == [(5, 10)]
+    assert ranges.end == 15
+    assert list(ranges.pieces()) == [(0, 50), (3, -3), (5, 0), (10, 90), (15, 0)]
+    assert ranges.lookup_many([2, 3, 5, 9, 14, 15]) == [52, 0, 5, 9, 104, 15]
+    assert ranges.inverse().lookup_many([52, 0, 104]) == [2, 3, 14]
+
+
+def test_overlapping_ranges_are_rejected():
+    with pytest.raises(ValueError, match="overlaps"):
+        Ranges([MapRange(100, 0, 5), MapRange(200, 4, 5)])
+
+
+def test_interval_edge_cases():
+    ranges = Ranges([MapRange(100, 10, 5)])
+    assert ranges.lookup_intervals([]) == []
+    assert Ranges([]).lookup_intervals([(3, 8), (0, 2)]) == [(0, 2), (3, 8)]
+    # Entirely in the gap, exactly the range, and straddling both of its ends
+    assert ranges.lookup_intervals([(0, 10)]) == [(0, 10)]
+    assert ranges.lookup_intervals([(10, 15)]) == [(100, 105)]
+    assert ranges.lookup_intervals([(8, 20)]) == [(8, 10), (15, 20), (100, 105)]
+    assert merge_intervals([]) == []
+    # Touching intervals merge, but not ones with a gap between them
+    assert merge_intervals([(5, 7), (0, 5), (8, 9), (1, 2)]) == [(0, 7), (8, 9)]
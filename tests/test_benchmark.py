@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from aoc import benchmark, runner
+from aoc.__main__ import main
+
+
+@pytest.fixture
+def solution(tmp_path):
+    day_dir = tmp_path / "1999" / "01_example"
+    day_dir.mkdir(parents=True)
+    (day_dir / "solution.py").write_text("def solve(data):\n    return len(data)\n")
+    (day_dir / "input.txt").write_bytes(b"12345\n")
+    return runner.Solution(1999, 1, 1, day_dir / "solution.py")
+
+
+def timed(solution, timings, answer="6"):
+    return benchmark.Benchmark(solution, "input.txt", answer, timings=timings)
+
+
+def test_statistics(solution):
+    result = timed(solution, [0.5, 0.1, 0.4, 0.2, 0.3])
+    assert result.min == 0.1
+    assert result.median == 0.3
+    # Nearest rank: the 5th of 5
+    assert result.p95 == 0.5
+    assert timed(solution, [0.2]).p95 == 0.2
+    assert timed(solution, [0.1 * i for i in range(1, 41)]).p95 == pytest.approx(3.8)
+
+
+def test_measure(solution):
+    result = benchmark.measure(solution, "input.txt", warmup=0, repeat=3)
+    assert result.error is None
+    assert result.answer == "6"
+    assert len(result.timings) == 3
+    assert result.key == "1999/01/part1/input.txt"
+
+
+def test_measure_records_failures(solution):
+    result = benchmark.measure(solution, "missing.txt", warmup=0, repeat=3)
+    assert result.error.startswith("FileNotFoundError")
+    assert result.timings == []
+    assert result.to_json() == {"error": result.error}
+
+
+def test_missing_baseline_is_empty(tmp_path):
+    assert benchmark.load_baseline(tmp_path / "baseline.json") == {}
+
+
+def test_baseline_round_trip_keeps_other_entries(tmp_path, solution):
+    path = tmp_path / "benchmarks" / "baseline.json"
+    benchmark.save_baseline(path, [timed(solution, [0.1, 0.2, 0.3])], {"2000/01/part1/input.txt": {"error": "x"}})
+    saved = json.loads(path.read_text())
+    assert saved["version"] == benchmark.BASELINE_VERSION
+    assert benchmark.load_baseline(path) == {
+        "1999/01/part1/input.txt": {"answer": "6", "runs": 3, "min": 0.1, "median": 0.2, "p95": 0.3},
+        "2000/01/part1/input.txt": {"error": "x"},
+    }
+
+
+def test_other_baseline_versions_are_rejected(tmp_path):
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"version": benchmark.BASELINE_VERSION + 1, "results": {}}))
+    with pytest.raises(ValueError, match="baseline version"):
+        benchmark.load_baseline(path)
+
+
+def test_compare(solution):
+    key = "1999/01/part1/input.txt"
+    baseline = {key: {"answer": "6", "median": 1.0}}
+    assert benchmark.compare(timed(solution, [1.05]), baseline, 10.0).regressed is False
+    slower = benchmark.compare(timed(solution, [1.2]), baseline, 10.0)
+    assert slower.regressed and slower.message.startswith("+20.0%")
+    assert "answer changed from 6" in benchmark.compare(timed(solution, [1.0], "7"), baseline, 10.0).message
+    assert benchmark.compare(timed(solution, [1.0]), {}, 10.0).message == "new"
+
+    failed = benchmark.Benchmark(solution, "input.txt", error="ValueError: no")
+    assert benchmark.compare(failed, baseline, 10.0).regressed
+    assert not benchmark.compare(failed, {}, 10.0).regressed
+
+
+def test_bench_without_a_baseline(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    assert main(["bench", "2022", "1", "--inputs", "input.txt", "--repeat", "1",
+                 "--baseline", str(baseline)]) == 0
+    captured = capsys.readouterr()
+    assert "No baseline at" in captured.err
+    assert "no baseline to compare with" in captured.out
+    assert not baseline.exists()
+
+    # --update creates it, and the next run compares against it
+    main(["bench", "2022", "1", "--inputs", "input.txt", "--repeat", "1", "--baseline", str(baseline),
+          "--update"])
+    assert "2022/01/part1/input.txt" in benchmark.load_baseline(baseline)
+    capsys.readouterr()
+    main(["bench", "2022", "1", "--inputs", "input.txt", "--repeat", "1", "--baseline", str(baseline)])
+    assert "vs baseline median" in capsys.readouterr().out
@@ -0,0 +1,116 @@
+import os
+import sys
+
+import pytest
+
+from aoc import cache, runner
+from aoc.cache import ResultCache
+
+
+@pytest.fixture
+def puzzle(tmp_path):
+    day_dir = tmp_path / "1997" / "01_example"
+    day_dir.mkdir(parents=True)
+    (day_dir / "solution.py").write_text("def solve(data):\n    return 1\n")
+    (day_dir / "input.txt").write_text("input\n")
+    return day_dir
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """
+    A stand-in for the aoc package's sources, so edits to them can be tried out.
+    """
+    package_dir = tmp_path / "aoc"
+    package_dir.mkdir()
+    (package_dir / "grid.py").write_text("PAD = 0\n")
+    monkeypatch.setattr(cache, "PACKAGE_DIR", package_dir)
+    cache._package_digest.cache_clear()
+    yield package_dir
+    cache._package_digest.cache_clear()
+
+
+def test_key_covers_part_input_and_sources(puzzle, package):
+    key = ResultCache.key("1997/01/part1", puzzle, b"input")
+    assert ResultCache.key("1997/01/part1", puzzle, b"input") == key
+    assert ResultCache.key("1997/01/part2", puzzle, b"input") != key
+    assert ResultCache.key("1997/01/part1", puzzle, b"other input") != key
+
+    # Other files in the puzzle directory, like inputs, don't count
+    (puzzle / "sample_input.txt").write_text("sample\n")
+    assert ResultCache.key("1997/01/part1", puzzle, b"input") == key
+
+    # Editing the solution, or adding a helper module next to it, does
+    (puzzle / "solution.py").write_text("def solve(data):\n    return 2\n")
+    edited = ResultCache.key("1997/01/part1", puzzle, b"input")
+    assert edited != key
+    (puzzle / "helper.py").write_text("")
+    assert ResultCache.key("1997/01/part1", puzzle, b"input") != edited
+
+
+def test_key_covers_the_shared_modules(puzzle, package):
+    key = ResultCache.key("1997/01/part1", puzzle, b"input")
+    (package / "grid.py").write_text("PAD = 1\n")
+    # The shared modules are only read once per process
+    assert ResultCache.key("1997/01/part1", puzzle, b"input") == key
+    cache._package_digest.cache_clear()
+    assert ResultCache.key("1997/01/part1", puzzle, b"input") != key
+
+
+def test_answers_keep_their_types(tmp_path):
+    results = ResultCache(tmp_path / "cache")
+    assert results.get("missing") is None
+    for key, answer in [("int", 12), ("str", "12"), ("list", [1, "a"]), ("big", 2 ** 80)]:
+        results.put(key, answer)
+        assert results.get(key) == answer
+        assert type(results.get(key)) is type(answer)
+
+
+def test_unsupported_and_damaged_entries_are_skipped(tmp_path):
+    results = ResultCache(tmp_path / "cache")
+    results.put("object", object())
+    assert results.get("object") is None
+    assert not (tmp_path / "cache" / "object.json").exists()
+
+    results.put("damaged", 1)
+    (tmp_path / "cache" / "damaged.json").write_text("{")
+    assert results.get("damaged") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    results = ResultCache(tmp_path / "cache")
+    for age, key in enumerate(["newest", "middle", "oldest"]):
+        results.put(key, "x" * 100)
+        old = 1_000_000 - age * 1000
+        os.utime(tmp_path / "cache" / f"{key}.json", (old, old))
+    # Reading an entry makes it the most recently used
+    assert results.get("oldest") == "x" * 100
+
+    entry_size = (tmp_path / "cache" / "newest.json").stat().st_size
+    results.max_bytes = 2 * entry_size
+    results.evict()
+    assert sorted(path.stem for path in (tmp_path / "cache").glob("*.json")) == ["newest", "oldest"]
+
+    # Putting an entry evicts as well
+    results.put("another", "x" * 100)
+    assert sorted(path.stem for path in (tmp_path / "cache").glob("*.json")) == ["another", "oldest"]
+
+    results.clear()
+    assert list((tmp_path / "cache").glob("*.json")) == []
+
+
+def test_runs_reuse_cached_answers_until_the_solution_changes(tmp_path, puzzle):
+    results = ResultCache(tmp_path / "cache")
+    solution = runner.Solution(1997, 1, 1, puzzle / "solution.py")
+    first = runner.run(solution, cache=results)
+    assert (first.answer, first.cached) == (1, False)
+    second = runner.run(solution, cache=results)
+    assert (second.answer, second.cached) == (1, True)
+    assert "cached" in runner.format_result(second)
+
+    (puzzle / "solution.py").write_text("def solve(data):\n    return 2\n")
+    # Forget the old module, as a new process would
+    del sys.modules[solution.module_name]
+    third = runner.run(solution, cache=results)
+    del sys.modules[solution.module_name]
+    assert (third.answer, third.cached) == (2, False)
@@ -0,0 +1,141 @@
+import heapq
+import random
+from pathlib import Path
+
+import pytest
+
+import crucible
+from aoc.grid import Grid
+
+DAY_DIR = Path(__file__).resolve().parent.parent / "puzzles" / "2023" / "day17_clumsy_crucible"
+
+
+def least_heat_loss(grid: Grid, min_run: int, max_run: int):
+    """
+    The least heat loss found one block at a time, with the direction and run length in the state, or
+    None when the end can't be reached.
+    """
+    heat = [[int(grid[r, c]) for c in range(grid.width)] for r in range(grid.height)]
+    end = (grid.height - 1, grid.width - 1)
+    if end == (0, 0):
+        return 0
+    # (heat loss, row, column, direction, run length), where the direction is None before the first move
+    queue = [(0, 0, 0, None, 0)]
+    seen = set()
+    while queue:
+        loss, r, c, direction, run = heapq.heappop(queue)
+        if (r, c) == end and run >= min_run:
+            return loss
+        if (r, c, direction, run) in seen:
+            continue
+        seen.add((r, c, direction, run))
+        for turn in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            if direction is not None and turn == (-direction[0], -direction[1]):
+                continue
+            if turn == direction:
+                if run == max_run:
+                    continue
+                next_run = run + 1
+            elif direction is None or run >= min_run:
+                next_run = 1
+            else:
+                continue
+            nr, nc = r + turn[0], c + turn[1]
+            if 0 <= nr < grid.height and 0 <= nc < grid.width:
+                heapq.heappush(queue, (loss + heat[nr][nc], nr, nc, turn, next_run))
+    return None
+
+
+def random_grid(rng: random.Random) -> Grid:
+    height, width = rng.randint(1, 7), rng.randint(1, 7)
+    return Grid.parse("\n".join("".join(str(rng.randint(1, 9)) for _ in range(width)) for _ in range(height)))
+
+
+def assert_valid_path(grid: Grid, min_run: int, max_run: int, cost: int, path):
+    assert path[0] == (0, 0)
+    assert path[-1] == (grid.height - 1, grid.width - 1)
+    assert sum(int(grid[r, c]) for r, c in path[1:]) == cost
+    steps = [(r2 - r1, c2 - c1) for (r1, c1), (r2, c2) in zip(path, path[1:])]
+    assert all(abs(dr) + abs(dc) == 1 for dr, dc in steps)
+    # Split the steps into straight runs, which have to turn rather than reverse between them
+    runs = []
+    for step in steps:
+        if runs and runs[-1][0] == step:
+            runs[-1][1] += 1
+        else:
+            assert not runs or runs[-1][0] != (-step[0], -step[1])
+            runs.append([step, 1])
+    assert all(min_run <= length <= max_run for _, length in runs)
+
+
+@pytest.mark.parametrize("filename, min_run, max_run, answer", [
+    ("sample_input.txt", 1, 3, 102),
+    ("sample_input.txt", 4, 10, 94),
+    ("sample_input_2.txt", 1, 3, 32),
+    ("sample_input_3.txt", 4, 10, 71),
+])
+@pytest.mark.parametrize("mode", crucible.MODES)
+def test_samples(filename, min_run, max_run, answer, mode):
+    grid = Grid.read(str(DAY_DIR / filename))
+    assert crucible.solve(grid, min_run, max_run, mode) == answer
+    cost, path = crucible.find_path(grid, min_run, max_run, mode)
+    assert cost == answer
+    assert_valid_path(grid, min_run, max_run, cost, path)
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_modes_match_brute_force(seed):
+    rng = random.Random(seed)
+    grid = random_grid(rng)
+    min_run = rng.randint(1, 4)
+    max_run = rng.randint(min_run, min_run + 4)
+    expected = least_heat_loss(grid, min_run, max_run)
+    for mode in crucible.MODES:
+        if expected is None:
+            with pytest.raises(ValueError):
+                crucible.find_path(grid, min_run, max_run, mode)
+        else:
+            cost, path = crucible.find_path(grid, min_run, max_run, mode)
+            assert cost == expected, mode
+            assert_valid_path(grid, min_run, max_run, cost, path)
+
+
+def test_unreachable_end():
+    # Two rows, so a crucible that has to move four blocks can never come down to the bottom row
+    grid = Grid.read(str(DAY_DIR / "sample_input_2.txt"))
+    for mode in crucible.MODES:
+        with pytest.raises(ValueError, match="No path"):
+            crucible.solve(grid, 4, 10, mode)
+
+
+def test_invalid_arguments():
+    grid = Grid.parse("12\n34")
+    with pytest.raises(ValueError, match="Invalid run lengths"):
+        crucible.solve(grid, 0, 3)
+    with pytest.raises(ValueError, match="Invalid run lengths"):
+        crucible.solve(grid, 4, 3)
+    with pytest.raises(ValueError, match="Unknown search mode"):
+        crucible.solve(grid, 1, 3, "bfs")
+
+
+def test_export_path_png(tmp_path):
+    pytest.importorskip("matplotlib")
+    import matplotlib.image
+    import visualize
+
+    city = crucible.City.from_file(str(DAY_DIR / "sample_input.txt"), 1, 3)
+    cost, states = crucible.search(city)
+    path = city.blocks_along(states)
+    png = tmp_path / "path.png"
+    visualize.export_path_png(city, path, str(png), pixels_per_block=2)
+
+    image = matplotlib.image.imread(str(png))
+    assert image.shape[:2] == (city.height * 2, city.width * 2)
+    cyan = [0.0, 1.0, 1.0]
+    on_path = set(path)
+    for r in range(city.height):
+        for c in range(city.width):
+            pixel = image[r * 2 + 1, c * 2 + 1, :3].tolist()
+            assert (pixel == cyan) == ((r, c) in on_path)
+    # The path's own heat loss adds up to the search's answer
+    assert sum(city.heat[r * city.width + c] for r, c in path[1:]) == cost
@@ -0,0 +1,149 @@
+import bisect
+import random
+
+import pytest
+
+from aoc import generators, inputs, log, runner
+from aoc.generators import y2022
+
+# Every solution of a puzzle with a generator
+SOLUTIONS = [solution for solution in runner.discover() if (solution.year, solution.day) in generators.GENERATORS]
+
+
+def distance(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def first_uncovered(ranges, max_coord):
+    """
+    A cell with both coordinates in 0..max_coord that's further than `reach` from every `(sensor, reach)`,
+    or None if there isn't one.
+
+    Turned 45 degrees (u = x + y, v = x - y), each sensor's range is an axis-aligned square.  Cells have u
+    and v of the same parity, so for each parity they are the points (a, b) with u = 2a + p and v = 2b + p,
+    where a range is a rectangle.  Cutting the plane at every rectangle's edges leaves blocks that each
+    rectangle either covers completely or misses, so only one check per block is needed rather than one
+    per cell.
+    """
+    for parity in (0, 1):
+        # The a and b of the cells in the square: x = a + b + p and y = a - b
+        a_min, a_max = 0, (2 * max_coord - parity) // 2
+        b_min, b_max = -((max_coord + parity) // 2), (max_coord - parity) // 2
+        rectangles = []
+        for (x, y), reach in ranges:
+            u = x + y
+            v = x - y
+            # Half-open, and cut down to the square's a and b
+            a_lo = max(-((parity - u + reach) // 2), a_min)
+            a_end = min((u + reach - parity) // 2, a_max) + 1
+            b_lo = max(-((parity - v + reach) // 2), b_min)
+            b_end = min((v + reach - parity) // 2, b_max) + 1
+            if a_lo < a_end and b_lo < b_end:
+                rectangles.append((a_lo, a_end, b_lo, b_end))
+        a_cuts = sorted({a_min, a_max + 1} | {a for a_lo, a_end, _, _ in rectangles for a in (a_lo, a_end)})
+        b_cuts = sorted({b_min, b_max + 1} | {b for _, _, b_lo, b_end in rectangles for b in (b_lo, b_end)})
+
+        # How many rectangles cover each block, by 2D prefix sums over the blocks
+        counts = [[0] * len(b_cuts) for _ in a_cuts]
+        for a_lo, a_end, b_lo, b_end in rectangles:
+            ia_lo = bisect.bisect_left(a_cuts, a_lo)
+            ia_hi = bisect.bisect_left(a_cuts, a_end)
+            ib_lo = bisect.bisect_left(b_cuts, b_lo)
+            ib_hi = bisect.bisect_left(b_cuts, b_end)
+            counts[ia_lo][ib_lo] += 1
+            counts[ia_lo][ib_hi] -= 1
+            counts[ia_hi][ib_lo] -= 1
+            counts[ia_hi][ib_hi] += 1
+        for ia in range(len(a_cuts)):
+            for ib in range(len(b_cuts)):
+                if ia:
+                    counts[ia][ib] += counts[ia - 1][ib]
+                if ib:
+                    counts[ia][ib] += counts[ia][ib - 1]
+                if ia and ib:
+                    counts[ia][ib] -= counts[ia - 1][ib - 1]
+
+        for ia in range(len(a_cuts) - 1):
+            for ib in range(len(b_cuts) - 1):
+                if counts[ia][ib]:
+                    continue
+                b_lo, b_hi = b_cuts[ib], b_cuts[ib + 1] - 1
+                # The block's a values that have a b in the block with the cell inside the square
+                a = max(a_cuts[ia], b_lo, -parity - b_hi)
+                if a <= min(a_cuts[ia + 1] - 1, max_coord - parity - b_lo, b_hi + max_coord, a_max):
+                    b = max(b_lo, -parity - a, a - max_coord)
+                    return a + b + parity, a - b
+    return None
+
+
+def uncovered(readings, max_coord):
+    return [(x, y) for x in range(max_coord + 1) for y in range(max_coord + 1)
+            if all(distance(sensor, (x, y)) > reach for sensor, reach in readings)]
+
+
+def sensor_readings(text):
+    numbers = inputs.ints(text.encode())
+    return [((numbers[i], numbers[i + 1]), (numbers[i + 2], numbers[i + 3])) for i in range(0, len(numbers), 4)]
+
+
+def assert_closest_beacons(readings):
+    beacons = {beacon for _, beacon in readings}
+    for sensor, beacon in readings:
+        reach = distance(sensor, beacon)
+        assert all(distance(sensor, other) > reach for other in beacons - {beacon})
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_first_uncovered_matches_brute_force(seed):
+    rng = random.Random(seed)
+    max_coord = rng.randint(0, 12)
+    readings = [((rng.randint(-4, max_coord + 4), rng.randint(-4, max_coord + 4)), rng.randint(0, 6))
+                for _ in range(rng.randint(0, 6))]
+    expected = uncovered(readings, max_coord)
+    found = first_uncovered(readings, max_coord)
+    if expected:
+        assert found in expected
+    else:
+        assert found is None
+
+
+@pytest.mark.parametrize("size", [1, 9, 16, 30])
+@pytest.mark.parametrize("max_coord", [20, 37])
+@pytest.mark.parametrize("seed", range(10))
+def test_beacon_exclusion_zone_is_valid(monkeypatch, size, max_coord, seed):
+    # Small enough to check every cell
+    monkeypatch.setattr(y2022, "BEACON_SEARCH_MAX", max_coord)
+    readings = sensor_readings(y2022.beacon_exclusion_zone(size, random.Random(seed)))
+    assert_closest_beacons(readings)
+    assert len(uncovered([(sensor, distance(sensor, beacon)) for sensor, beacon in readings], max_coord)) == 1
+
+
+@pytest.mark.parametrize("size", [4, 30, 200])
+@pytest.mark.parametrize("seed", range(3))
+def test_beacon_exclusion_zone_is_valid_at_full_size(size, seed):
+    readings = sensor_readings(y2022.beacon_exclusion_zone(size, random.Random(seed)))
+    assert_closest_beacons(readings)
+    ranges = [(sensor, distance(sensor, beacon)) for sensor, beacon in readings]
+    hidden = first_uncovered(ranges, y2022.BEACON_SEARCH_MAX)
+    assert hidden is not None
+    # Nothing else is left once the hidden cell is covered too
+    assert first_uncovered(ranges + [(hidden, 0)], y2022.BEACON_SEARCH_MAX) is None
+
+
+@pytest.mark.parametrize("year, day", generators.available())
+def test_generators_are_deterministic(year, day):
+    assert generators.generate(year, day, 20, seed=3) == generators.generate(year, day, 20, seed=3)
+
+
+@pytest.mark.parametrize("solution", SOLUTIONS, ids=lambda solution: solution.label)
+def test_solutions_run_on_generated_inputs(monkeypatch, solution):
+    if (solution.year, solution.day, solution.part) == (2022, 15, 2):
+        pytest.skip("Part 2 always searches the full 4,000,000 square")
+    monkeypatch.setattr(log, "verbose", False)
+    # Part 1 of 2022 day 15 scans a whole row of the square, so make it small enough to miss that row
+    monkeypatch.setattr(y2022, "BEACON_SEARCH_MAX", 20)
+    size = 8 if (solution.year, solution.day) == (2022, 16) else 12
+    module = runner.load_module(solution)
+    for seed in range(3):
+        answer, _, _ = runner.execute(module, generators.generate(solution.year, solution.day, size, seed))
+        assert answer is not None
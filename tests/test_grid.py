@@ -0,0 +1,103 @@
+import random
+
+import pytest
+
+from aoc.grid import Grid
+
+
+def random_rows(rng: random.Random):
+    height = rng.randint(1, 8)
+    width = rng.randint(1, 8)
+    return [[rng.choice(".#O") for _ in range(width)] for _ in range(height)]
+
+
+def transpose(rows):
+    return [list(col) for col in zip(*rows)]
+
+
+def rotate(rows):
+    # Clockwise: the bottom-left cell becomes the top-left one
+    return [list(col) for col in zip(*rows[::-1])]
+
+
+def rotate_counterclockwise(rows):
+    return [list(col) for col in zip(*rows)][::-1]
+
+
+def assert_matches(grid: Grid, rows):
+    assert grid.height == len(rows)
+    assert grid.width == len(rows[0])
+    for r in range(grid.height):
+        for c in range(grid.width):
+            assert grid[r, c] == rows[r][c]
+            assert grid.coords(grid.index(r, c)) == (r, c)
+        assert grid.row(r).tobytes().decode() == "".join(rows[r])
+    for c in range(grid.width):
+        assert grid.col(c).tobytes().decode() == "".join(row[c] for row in rows)
+    assert str(grid) == "\n".join("".join(row) for row in rows)
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_views_match_nested_lists(seed):
+    rng = random.Random(seed)
+    rows = random_rows(rng)
+    grid = Grid.parse("\n".join("".join(row) for row in rows))
+    assert_matches(grid, rows)
+
+    # Chains of views, so views of views are covered too
+    view, expected = grid, rows
+    for _ in range(6):
+        op = rng.choice(["transposed", "rotated", "rotated_counterclockwise"])
+        view = getattr(view, op)()
+        expected = {"transposed": transpose, "rotated": rotate,
+                    "rotated_counterclockwise": rotate_counterclockwise}[op](expected)
+        assert_matches(view, expected)
+        assert view.copy() == view
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_writes_through_a_view_reach_the_grid(seed):
+    rng = random.Random(seed)
+    rows = random_rows(rng)
+    grid = Grid.parse("\n".join("".join(row) for row in rows))
+    view = grid.rotated().transposed()
+    expected = transpose(rotate(rows))
+    r = rng.randrange(view.height)
+    c = rng.randrange(view.width)
+    view[r, c] = "X"
+    expected[r][c] = "X"
+    assert_matches(view, expected)
+    # Undo the view: transposing then rotating counterclockwise gets back to the original orientation
+    assert_matches(grid, rotate_counterclockwise(transpose(expected)))
+
+
+def test_neighbors_stop_at_the_border():
+    grid = Grid.parse("ab\ncd\n")
+    assert sorted(grid.neighbors(0, 0)) == [(0, 1), (1, 0)]
+    assert sorted(grid.neighbors(1, 1)) == [(0, 1), (1, 0)]
+    assert sorted(grid.rotated().neighbors(0, 1)) == [(0, 0), (1, 1)]
+
+
+def test_single_cell_grid():
+    grid = Grid.parse("S\n")
+    assert_matches(grid, [["S"]])
+    assert list(grid.neighbors(0, 0)) == []
+    assert grid.find("S") == (0, 0)
+    assert grid.find("x") is None
+    for view in (grid.transposed(), grid.rotated(), grid.rotated_counterclockwise()):
+        assert_matches(view, [["S"]])
+        assert list(view.neighbors(0, 0)) == []
+
+
+def test_single_row_and_column():
+    row = Grid.parse("abc\n")
+    assert_matches(row, [["a", "b", "c"]])
+    assert sorted(row.neighbors(0, 1)) == [(0, 0), (0, 2)]
+    column = row.rotated()
+    assert_matches(column, [["a"], ["b"], ["c"]])
+    assert sorted(column.neighbors(1, 0)) == [(0, 0), (2, 0)]
+
+
+def test_parse_many_separates_blocks():
+    grids = Grid.parse_many("ab\ncd\n\n\ne\n\nfg\n")
+    assert [str(grid) for grid in grids] == ["ab\ncd", "e", "fg"]
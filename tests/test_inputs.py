@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from aoc import inputs
+
+
+def expected_lines(data: bytes):
+    # The lines of `data` the slow way: split on newlines, with no empty line after a final newline
+    pieces = data.split(b"\n")
+    if pieces[-1] == b"":
+        pieces.pop()
+    return [piece[:-1] if piece.endswith(b"\r") else piece for piece in pieces]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_lines_match_splitting(seed, tmp_path):
+    rng = random.Random(seed)
+    data = bytes(rng.choice(b"ab \r\n") for _ in range(rng.randint(0, 30)))
+    assert [line.tobytes() for line in inputs.lines(data)] == expected_lines(data)
+
+    path = tmp_path / "input.txt"
+    path.write_bytes(data)
+    with inputs.mapped(path) as mapped:
+        lines = [line.tobytes() for line in inputs.lines(mapped)]
+    assert lines == expected_lines(data)
+
+
+def test_mapped_reads_the_file_read_only(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"12\n-3\n")
+    with inputs.mapped(path) as data:
+        assert data[:] == b"12\n-3\n"
+        assert data.find(b"\n") == 2
+        assert inputs.text(data) == "12\n-3\n"
+        with pytest.raises(TypeError):
+            data[0] = ord("x")
+    # Closed once the block ends
+    with pytest.raises(ValueError):
+        data[:]
+
+
+def test_mapped_empty_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"")
+    with inputs.mapped(path) as data:
+        assert data == b""
+        assert list(inputs.lines(data)) == []
+
+
+def test_mapped_outlived_by_a_view(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"first\nsecond\n")
+    with inputs.mapped(path) as data:
+        first = next(inputs.lines(data))
+    # The mapping can't be closed under the view, so it stays open until the view goes
+    assert first.tobytes() == b"first"
+
+
+def test_strip():
+    assert inputs.strip(memoryview(b" \t a b \r\n")).tobytes() == b"a b"
+    assert inputs.strip(memoryview(b" \n ")).tobytes() == b""
+    assert inputs.strip(memoryview(b"")).tobytes() == b""
+
+
+def test_ints():
+    assert list(inputs.ints(b"Sensor at x=-2, y=15: 3,4\n")) == [-2, 15, 3, 4]
+    assert list(inputs.ints(memoryview(b"move 12 from 3"))) == [12, 3]
+    assert list(inputs.ints(b"no numbers")) == []
+    assert inputs.ints(b"1").typecode == "q"
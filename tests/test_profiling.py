@@ -0,0 +1,45 @@
+import pstats
+import time
+
+import pytest
+
+from aoc import profiling
+
+
+def busy(seconds):
+    # Spin on the CPU, since the sampler's timer only counts CPU time
+    end = time.process_time() + seconds
+    total = 0
+    while time.process_time() < end:
+        total += 1
+    return total
+
+
+def test_profiled_writes_both_profiles(tmp_path):
+    result, stats_path = profiling.profiled(tmp_path / "profiles" / "busy", busy, 0.05)
+    assert result > 0
+    assert stats_path == tmp_path / "profiles" / "busy.pstats"
+    functions = {name for _, _, name in pstats.Stats(str(stats_path)).stats}
+    assert "busy" in functions
+    assert "busy" in profiling.summary(stats_path, 5)
+
+    if not profiling.Sampler.available():
+        pytest.skip("no interval timers on this platform")
+    lines = (tmp_path / "profiles" / "busy.collapsed").read_text().splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        # Stacks start at the profiled call, not in the profiler
+        assert stack.startswith("busy (test_profiling.py:")
+
+
+def test_profiled_keeps_errors(tmp_path):
+    def fail():
+        raise ValueError("bad input")
+
+    with pytest.raises(ValueError):
+        profiling.profiled(tmp_path / "fail", fail)
+    # The timer is stopped even so
+    if profiling.Sampler.available():
+        assert profiling.signal.getitimer(profiling.signal.ITIMER_PROF) == (0.0, 0.0)
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from aoc import runner
+
+solution = runner.load_module(runner.discover(2022, 17)[0])
+
+SAMPLE = b">>><<><>><<<>><>>><<<>>><<<><<<>><>><<>>\n"
+
+# The rocks as (x, y) cells from their bottom left corner
+SHAPE_CELLS = [
+    [(0, 0), (1, 0), (2, 0), (3, 0)],
+    [(1, 0), (0, 1), (1, 1), (2, 1), (1, 2)],
+    [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)],
+    [(0, 0), (0, 1), (0, 2), (0, 3)],
+    [(0, 0), (1, 0), (0, 1), (1, 1)],
+]
+
+
+def simulate(jets, rock_count):
+    """
+    The puzzle as written, one cell and one step at a time.
+    """
+    filled = set()
+    height = 0
+    jet = 0
+    for rock_number in range(rock_count):
+        x, y = 2, height + 3
+        cells = SHAPE_CELLS[rock_number % len(SHAPE_CELLS)]
+        while True:
+            pushed = x + jets[jet % len(jets)]
+            jet += 1
+            if all(0 <= pushed + dx < 7 and (pushed + dx, y + dy) not in filled for dx, dy in cells):
+                x = pushed
+            if all(y + dy > 0 and (x + dx, y + dy - 1) not in filled for dx, dy in cells):
+                y -= 1
+            else:
+                break
+        filled.update((x + dx, y + dy) for dx, dy in cells)
+        height = max(height, max(y + dy + 1 for _, dy in cells))
+    return height
+
+
+def test_sample():
+    jets = solution.parse(SAMPLE)
+    assert simulate(jets, 2022) == 3068
+    assert solution.solve(jets) == 3068
+    assert solution.tower_height(jets, 1_000_000_000_000) == 1514285714288
+
+
+def test_no_rocks():
+    assert solution.tower_height(solution.parse(SAMPLE), 0) == 0
+
+
+@pytest.mark.parametrize("pattern", [b"<", b">", b"<>", b"><<"])
+def test_short_patterns(pattern):
+    # The pattern wraps around within a single rock's fall
+    jets = solution.parse(pattern)
+    for rock_count in range(1, 60):
+        assert solution.tower_height(jets, rock_count) == simulate(jets, rock_count)
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_matches_simulation(seed):
+    rng = random.Random(seed)
+    jets = solution.parse(bytes(rng.choice(b"<>") for _ in range(rng.randint(1, 40))))
+    # Far enough to skip repeats for the short patterns, with counts that land at different points in them
+    for rock_count in rng.sample(range(1, 400), 5):
+        assert solution.tower_height(jets, rock_count) == simulate(jets, rock_count)
+
+
+def test_reachable_rows_stop_at_a_sealed_row():
+    chamber = bytearray([solution.FULL_ROW, 0b0000001, solution.FULL_ROW, 0b1110111, 0])
+    # Only the gap in row 3 can be reached, the empty cells in row 1 are sealed off by row 2
+    assert solution.reachable_rows(chamber, 4) == bytes([0b0001000])
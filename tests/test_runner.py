@@ -0,0 +1,186 @@
+import sys
+
+import pytest
+
+from aoc import runner
+from aoc.cache import ResultCache
+
+YEAR = 1998
+
+SHARED_PARSE = """
+import counter
+
+def parse(data):
+    counter.parses += 1
+    return [int(line) for line in bytes(data).split()]
+"""
+
+
+@pytest.fixture
+def puzzles(tmp_path, monkeypatch):
+    """
+    An empty puzzles directory for the runner to discover, with the modules it loads forgotten afterwards.
+    """
+    monkeypatch.setattr(runner, "PUZZLES_DIR", tmp_path)
+    yield tmp_path
+    for name in list(sys.modules):
+        if name.startswith(f"aoc_puzzle_{YEAR}_") or name in ("counter", "readings"):
+            del sys.modules[name]
+
+
+def add_day(puzzles, day, files, year=YEAR, name="example"):
+    day_dir = puzzles / str(year) / f"{day:02d}_{name}"
+    day_dir.mkdir(parents=True)
+    for filename, text in files.items():
+        (day_dir / filename).write_text(text)
+    return day_dir
+
+
+def test_discover_names_parts_and_variants(puzzles):
+    add_day(puzzles, 1, {"solution.py": "", "input.txt": ""})
+    add_day(puzzles, 2, {"solution_part1.py": "", "solution_part2.py": "", "solution_part2_take2.py": "",
+                         "notes.py": "", "solution_helper.txt": ""})
+    add_day(puzzles, 3, {"solution_part1.py": ""}, name="later")
+    (puzzles / str(YEAR) / "README.md").write_text("")
+    (puzzles / str(YEAR) / "scratch").mkdir()
+    (puzzles / "misc").mkdir()
+
+    found = [(s.year, s.day, s.part, s.variant, s.path.name) for s in runner.discover()]
+    assert found == [
+        (YEAR, 1, 1, "", "solution.py"),
+        (YEAR, 2, 1, "", "solution_part1.py"),
+        (YEAR, 2, 2, "", "solution_part2.py"),
+        (YEAR, 2, 2, "take2", "solution_part2_take2.py"),
+        (YEAR, 3, 1, "", "solution_part1.py"),
+    ]
+    assert [s.key for s in runner.discover(day=2, part=2)] == [f"{YEAR}/02/part2", f"{YEAR}/02/part2-take2"]
+    assert runner.discover(year=YEAR + 1) == []
+
+
+def test_discover_accepts_both_day_directory_styles(puzzles):
+    add_day(puzzles, 4, {"solution.py": ""}, name="plain")
+    (puzzles / str(YEAR) / "day05_prefixed").mkdir()
+    (puzzles / str(YEAR) / "day05_prefixed" / "solution.py").write_text("")
+    assert [s.day for s in runner.discover(YEAR)] == [4, 5]
+    assert [s.day for s in runner.discover(YEAR, 5)] == [5]
+
+
+def test_run_times_parse_and_solve(puzzles):
+    add_day(puzzles, 1, {
+        "solution.py": "def parse(data):\n    return bytes(data).split()\n\ndef solve(words):\n    return len(words)\n",
+        "input.txt": "a b c\n",
+    })
+    result = runner.run(runner.discover(YEAR, 1)[0])
+    assert result.error is None
+    assert result.answer == 3
+    assert result.parse_seconds is not None
+    assert result.total_seconds >= result.solve_seconds
+    assert runner.format_result(result).endswith("-> 3")
+
+
+def test_run_records_failures(puzzles):
+    add_day(puzzles, 1, {"solution_part1.py": "def solve(data):\n    raise ValueError('bad input')\n",
+                         "solution_part2.py": "ANSWER = 1\n",
+                         "input.txt": ""})
+    failing, missing = runner.discover(YEAR, 1)
+    assert runner.run(failing).error == "ValueError: bad input"
+    assert runner.run(missing).error == "AttributeError: solution_part2.py has no solve() entry point"
+    assert runner.run(failing, "missing.txt").error.startswith("FileNotFoundError")
+    assert runner.format_result(runner.run(failing)) == f"{YEAR} day 01 part 1: ValueError: bad input"
+
+
+def test_run_day_parses_once_for_parts_sharing_a_parse(puzzles):
+    add_day(puzzles, 1, {
+        "counter.py": "parses = 0\n",
+        "readings.py": SHARED_PARSE,
+        "solution_part1.py": "from readings import parse\n\ndef solve(values):\n    return sum(values)\n",
+        "solution_part2.py": "from readings import parse\n\ndef solve(values):\n    return max(values)\n",
+        "input.txt": "3\n1\n2\n",
+    })
+    first, second = runner.run_day(runner.discover(YEAR, 1))
+    assert (first.answer, second.answer) == (6, 3)
+    assert (first.parse_shared, second.parse_shared) == (False, True)
+    assert sys.modules["counter"].parses == 1
+    assert "parse shared" in runner.format_result(second)
+
+
+def test_solutions_import_their_own_helpers(puzzles):
+    day_dir = add_day(puzzles, 1, {"counter.py": "parses = 5\n",
+                                   "solution.py": "import counter\n\ndef solve(data):\n    return counter.parses\n",
+                                   "input.txt": ""})
+    assert runner.run(runner.discover(YEAR, 1)[0]).answer == 5
+    # The puzzle directory is only on the path while the solution is imported
+    assert str(day_dir) not in sys.path
+
+
+def test_group_by_day(puzzles):
+    add_day(puzzles, 1, {"solution_part1.py": "", "solution_part2.py": ""})
+    add_day(puzzles, 2, {"solution.py": ""})
+    assert [[s.key for s in day] for day in runner.group_by_day(runner.discover(YEAR))] == [
+        [f"{YEAR}/01/part1", f"{YEAR}/01/part2"], [f"{YEAR}/02/part1"]]
+
+
+def test_timings_keep_earlier_entries(puzzles, tmp_path):
+    add_day(puzzles, 1, {"solution_part1.py": "def solve(data):\n    return 1\n",
+                         "solution_part2.py": "def solve(data):\n    raise ValueError\n",
+                         "input.txt": ""})
+    path = tmp_path / "state" / "timings.json"
+    assert runner.load_timings(path) == {}
+    runner.save_timings([], "input.txt", path)
+    runner.save_timings(runner.run_day(runner.discover(YEAR, 1)), "input.txt", path)
+    timings = runner.load_timings(path)
+    # The failed part isn't timed
+    assert list(timings) == [f"{YEAR}/01/part1/input.txt"]
+
+    runner.save_timings([runner.Result(runner.discover(YEAR, 1, 2)[0], total_seconds=2.0)], "input.txt", path)
+    assert runner.load_timings(path) == {**timings, f"{YEAR}/01/part2/input.txt": 2.0}
+
+
+def test_parallel_runs_match_sequential_ones(puzzles):
+    for day in range(1, 5):
+        add_day(puzzles, day, {"solution_part1.py": f"def solve(data):\n    return {day}\n",
+                               "solution_part2.py": f"def solve(data):\n    return {day * 10}\n",
+                               "input.txt": ""})
+    solutions = runner.discover(YEAR)
+    results = {result.solution.key: result.answer for result in runner.run_parallel(solutions, jobs=2)}
+    assert results == {result.solution.key: result.answer
+                       for day in runner.group_by_day(solutions) for result in runner.run_day(day)}
+
+
+def test_parallel_runs_start_the_slowest_days_first(puzzles):
+    for day in range(1, 4):
+        add_day(puzzles, day, {"solution.py": f"def solve(data):\n    return {day}\n", "input.txt": ""})
+    solutions = runner.discover(YEAR)
+    timings = {f"{YEAR}/01/part1/input.txt": 0.1, f"{YEAR}/02/part1/input.txt": 3.0}
+    # With one worker the days finish in the order they were started.  Day 3 has never been timed, so it
+    # counts as the slowest.
+    results = runner.run_parallel(solutions, jobs=1, timings=timings)
+    assert [result.answer for result in results] == [3, 2, 1]
+
+
+def test_parallel_runs_survive_a_worker_dying(puzzles):
+    add_day(puzzles, 1, {"solution.py": "import os\n\ndef solve(data):\n    os._exit(1)\n", "input.txt": ""})
+    for day in range(2, 5):
+        add_day(puzzles, day, {"solution.py": f"def solve(data):\n    return {day}\n", "input.txt": ""})
+    results = {result.solution.day: result for result in runner.run_parallel(runner.discover(YEAR), jobs=2)}
+    assert sorted(results) == [1, 2, 3, 4]
+    assert results[1].error == "BrokenProcessPool: the worker process running it died"
+    assert [results[day].answer for day in range(2, 5)] == [2, 3, 4]
+
+
+def test_parallel_runs_report_answers_that_cant_be_sent_back(puzzles):
+    add_day(puzzles, 1, {"solution.py": "def solve(data):\n    return lambda: 1\n", "input.txt": ""})
+    add_day(puzzles, 2, {"solution.py": "def solve(data):\n    return 2\n", "input.txt": ""})
+    results = {result.solution.day: result for result in runner.run_parallel(runner.discover(YEAR), jobs=2)}
+    assert results[1].error is not None and results[1].answer is None
+    assert results[2].answer == 2
+
+
+def test_profiled_runs_write_profiles_and_skip_the_cache(puzzles, tmp_path):
+    add_day(puzzles, 1, {"solution.py": "def solve(data):\n    return 1\n", "input.txt": ""})
+    results = ResultCache(tmp_path / "cache")
+    result = runner.run(runner.discover(YEAR, 1)[0], cache=results, profile_dir=tmp_path / "profiles")
+    assert result.answer == 1
+    assert result.profile == tmp_path / "profiles" / f"{YEAR}-01-part1-input.pstats"
+    assert result.profile.exists()
+    assert list((tmp_path / "cache").glob("*.json")) == []
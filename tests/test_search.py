@@ -0,0 +1,188 @@
+import random
+
+import pytest
+
+from aoc import metrics
+from aoc.search import UNREACHED, astar, bfs, dial, dijkstra, multi_source_bfs, zero_one_bfs
+
+
+def random_graph(rng: random.Random, costs):
+    num_nodes = rng.randint(1, 12)
+    edges = {node: [] for node in range(num_nodes)}
+    for _ in range(rng.randint(0, 3 * num_nodes)):
+        # Self loops and parallel edges included
+        edges[rng.randrange(num_nodes)].append((rng.randrange(num_nodes), rng.choice(costs)))
+    return num_nodes, edges
+
+
+def bellman_ford(num_nodes, sources, edges):
+    dist = [UNREACHED] * num_nodes
+    for source in sources:
+        dist[source] = 0
+    for _ in range(num_nodes):
+        for node, out in edges.items():
+            if dist[node] == UNREACHED:
+                continue
+            for dest, cost in out:
+                dist[dest] = min(dist[dest], dist[node] + cost)
+    return dist
+
+
+def assert_shortest(found, num_nodes, sources, edges, expected):
+    assert list(found.dist) == expected
+    for node in range(num_nodes):
+        if not found.reached(node):
+            continue
+        # The path has to be made of real edges and add up to the distance
+        path = found.path(node)
+        assert path[0] in sources
+        for a, b in zip(path, path[1:]):
+            assert any(dest == b and found.dist[a] + cost == found.dist[b] for dest, cost in edges[a])
+
+
+def assert_goal(found, goals, expected):
+    nearest = min((expected[goal] for goal in goals), default=UNREACHED)
+    if nearest == UNREACHED:
+        assert found.found is None
+    else:
+        assert found.found in goals
+        assert found.dist[found.found] == nearest
+
+
+def random_sources(rng: random.Random, num_nodes: int):
+    return rng.sample(range(num_nodes), rng.randint(1, min(3, num_nodes)))
+
+
+@pytest.fixture(params=[True, False], ids=["counted", "uncounted"])
+def stats(request, monkeypatch):
+    """
+    Makes the counters for each search: counters of their own, or none with counting switched off so the
+    searches take their uncounted loops.
+    """
+    if request.param:
+        return metrics.SearchCounters
+    monkeypatch.setattr(metrics, "enabled", False)
+    return lambda: None
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_bfs_matches_bellman_ford(seed, stats):
+    rng = random.Random(seed)
+    num_nodes, edges = random_graph(rng, [1])
+    neighbors = {node: [dest for dest, _ in out] for node, out in edges.items()}
+
+    source = rng.randrange(num_nodes)
+    assert_shortest(bfs(num_nodes, source, neighbors.__getitem__, stats=stats()), num_nodes, [source], edges,
+                    bellman_ford(num_nodes, [source], edges))
+
+    sources = random_sources(rng, num_nodes)
+    expected = bellman_ford(num_nodes, sources, edges)
+    assert_shortest(multi_source_bfs(num_nodes, sources, neighbors.__getitem__, stats=stats()),
+                    num_nodes, sources, edges, expected)
+
+    goals = set(rng.sample(range(num_nodes), rng.randint(1, num_nodes)))
+    assert_goal(multi_source_bfs(num_nodes, sources, neighbors.__getitem__, goals.__contains__, stats()),
+                goals, expected)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_zero_one_bfs_matches_bellman_ford(seed, stats):
+    rng = random.Random(seed)
+    num_nodes, edges = random_graph(rng, [0, 1])
+    sources = random_sources(rng, num_nodes)
+    expected = bellman_ford(num_nodes, sources, edges)
+    assert_shortest(zero_one_bfs(num_nodes, sources, edges.__getitem__, stats=stats()),
+                    num_nodes, sources, edges, expected)
+
+    goals = set(rng.sample(range(num_nodes), rng.randint(1, num_nodes)))
+    assert_goal(zero_one_bfs(num_nodes, sources, edges.__getitem__, goals.__contains__, stats()), goals, expected)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_dijkstra_matches_bellman_ford(seed, stats):
+    rng = random.Random(seed)
+    num_nodes, edges = random_graph(rng, range(10))
+    sources = random_sources(rng, num_nodes)
+    expected = bellman_ford(num_nodes, sources, edges)
+    assert_shortest(dijkstra(num_nodes, sources, edges.__getitem__, stats=stats()),
+                    num_nodes, sources, edges, expected)
+
+    goals = set(rng.sample(range(num_nodes), rng.randint(1, num_nodes)))
+    assert_goal(dijkstra(num_nodes, sources, edges.__getitem__, goals.__contains__, stats()), goals, expected)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_dial_matches_bellman_ford(seed, stats):
+    rng = random.Random(seed)
+    # Free edges included, which land in the bucket that is being emptied
+    num_nodes, edges = random_graph(rng, range(10))
+    sources = random_sources(rng, num_nodes)
+    expected = bellman_ford(num_nodes, sources, edges)
+    assert_shortest(dial(num_nodes, sources, edges.__getitem__, stats=stats()), num_nodes, sources, edges, expected)
+
+    goals = set(rng.sample(range(num_nodes), rng.randint(1, num_nodes)))
+    assert_goal(dial(num_nodes, sources, edges.__getitem__, goals.__contains__, stats()), goals, expected)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_astar_matches_bellman_ford(seed, stats):
+    rng = random.Random(seed)
+    num_nodes, edges = random_graph(rng, range(10))
+    sources = random_sources(rng, num_nodes)
+    goals = set(rng.sample(range(num_nodes), rng.randint(1, num_nodes)))
+    expected = bellman_ford(num_nodes, sources, edges)
+
+    # The exact distance to the nearest goal, from a search backwards over the edges, scaled down at
+    # random so the heuristic is admissible without always being perfect
+    reverse = {node: [] for node in range(num_nodes)}
+    for node, out in edges.items():
+        for dest, cost in out:
+            reverse[dest].append((node, cost))
+    to_goal = bellman_ford(num_nodes, goals, reverse)
+    heuristic = [0 if d == UNREACHED else int(d * rng.random()) for d in to_goal]
+
+    assert_goal(astar(num_nodes, sources, edges.__getitem__, heuristic.__getitem__, goals.__contains__, stats()),
+                goals, expected)
+    # Without a goal to stop at, it has to reach everything Dijkstra does
+    assert list(astar(num_nodes, sources, edges.__getitem__, heuristic.__getitem__, stats=stats()).dist) == expected
+
+
+def test_nothing_is_counted_when_counting_is_off(monkeypatch):
+    metrics.reset()
+    monkeypatch.setattr(metrics, "enabled", False)
+    dijkstra(3, [0], lambda node: [(node + 1, 1)] if node < 2 else [])
+    assert metrics.collect() == {}
+
+    monkeypatch.setattr(metrics, "enabled", True)
+    found = dijkstra(3, [0], lambda node: [(node + 1, 1)] if node < 2 else [])
+    assert list(found.dist) == [0, 1, 2]
+    assert metrics.collect()["dijkstra"]["expanded"] == 3
+    metrics.reset()
+
+
+def test_unreachable_goals(stats):
+    # Two separate chains, 0 -> 1 -> 2 and 3 -> 4, with the goal on the second
+    nexts = {0: [1], 1: [2], 2: [], 3: [4], 4: []}
+
+    def edges(node):
+        return [(dest, 1) for dest in nexts[node]]
+
+    def goal(node):
+        return node == 4
+
+    heuristic = [0] * 5
+    chain = [0, 1, 2, UNREACHED, UNREACHED]
+    searches = [
+        (bfs(5, 0, nexts.__getitem__, goal, stats()), chain),
+        (multi_source_bfs(5, [0, 1], nexts.__getitem__, goal, stats()), [0, 0, 1, UNREACHED, UNREACHED]),
+        (zero_one_bfs(5, [0], edges, goal, stats()), chain),
+        (dijkstra(5, [0], edges, goal, stats()), chain),
+        (dial(5, [0], edges, goal, stats()), chain),
+        (astar(5, [0], edges, heuristic.__getitem__, goal, stats()), chain),
+    ]
+    for found, expected in searches:
+        assert found.found is None
+        # Having found nothing to stop at, the search has reached everything it can
+        assert list(found.dist) == expected
+        assert not found.reached(4)
+        assert found.path(4) == [4]
@@ -0,0 +1,100 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from aoc import metrics
+from valves import (START, ValveGraph, best_within, max_pressure, max_pressure_branch_and_bound,
+                    max_pressure_with_elephant)
+
+
+def random_scan(rng: random.Random) -> bytes:
+    """
+    A scan of up to eight valves with two-way tunnels, where the starting valve has no flow like in the
+    puzzle and some of the others may be cut off from it.
+    """
+    names = [START] + rng.sample(["BB", "CC", "DD", "EE", "FF", "GG", "HH", "II"], rng.randint(1, 7))
+    tunnels = {name: set() for name in names}
+    for _ in range(rng.randint(1, 2 * len(names))):
+        a, b = rng.sample(names, 2)
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+    lines = []
+    for name in names:
+        flow = 0 if name == START or rng.random() < 0.3 else rng.randint(1, 25)
+        # Every valve needs at least one tunnel for the line to parse, so isolated ones lead to themselves
+        leads = ", ".join(sorted(tunnels[name])) or name
+        lines.append(f"Valve {name} has flow rate={flow}; tunnels lead to valves {leads}")
+    return "\n".join(lines).encode()
+
+
+def pressure_by_opened(graph: ValveGraph, minutes: int):
+    """
+    The most pressure one agent can release by opening exactly each set of useful valves, found by playing
+    out every minute (walk down a tunnel or open the valve here) on the full tunnel map.
+    """
+    bits = {valve: 1 << i for i, valve in enumerate(graph.useful)}
+    best = [0] * (1 << len(graph.useful))
+    states = {(graph.names.index(START), 0): 0}
+    for minutes_left in range(minutes, 0, -1):
+        next_states = {}
+        for (valve, opened), pressure in states.items():
+            best[opened] = max(best[opened], pressure)
+            moves = [(other, opened, pressure) for other in graph.neighbors(valve)]
+            if valve in bits and not opened & bits[valve]:
+                moves.append((valve, opened | bits[valve], pressure + graph.flows[valve] * (minutes_left - 1)))
+            for state in moves:
+                key = state[:2]
+                next_states[key] = max(next_states.get(key, 0), state[2])
+        states = next_states
+    for (_, opened), pressure in states.items():
+        best[opened] = max(best[opened], pressure)
+    return best
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_single_agent_modes_match_brute_force(seed):
+    rng = random.Random(seed)
+    graph = ValveGraph.parse(random_scan(rng))
+    minutes = rng.randint(1, 14)
+    expected = max(pressure_by_opened(graph, minutes))
+    assert max_pressure(graph, minutes) == expected
+    assert max_pressure_branch_and_bound(graph, minutes) == expected
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_elephant_matches_brute_force(seed):
+    rng = random.Random(seed)
+    graph = ValveGraph.parse(random_scan(rng))
+    minutes = rng.randint(1, 12)
+    pressures = pressure_by_opened(graph, minutes)
+    # Every pair of disjoint sets, one for each agent
+    expected = max(pressures[mine] + pressures[theirs]
+                   for mine in range(len(pressures)) for theirs in range(len(pressures)) if not mine & theirs)
+    assert max_pressure_with_elephant(graph, minutes) == expected
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_best_within_matches_every_subset(seed):
+    rng = random.Random(seed)
+    values = [rng.randint(0, 100) for _ in range(1 << rng.randint(0, 7))]
+    expected = [max(value for subset, value in enumerate(values) if subset & mask == subset)
+                for mask in range(len(values))]
+    assert best_within(values) == expected
+
+
+@pytest.mark.parametrize("filename, answer, most_dp_states", [
+    ("input.txt", 1940, 10_000),
+    ("reddit_tc3.txt", 1288, 140_000),
+])
+def test_single_agent_work(monkeypatch, filename, answer, most_dp_states):
+    # The module docstring's numbers.  States are counted rather than timed, so the test isn't flaky.
+    path = Path(__file__).resolve().parent.parent / "puzzles" / "2022" / "16_proboscidea_volcanium" / filename
+    graph = ValveGraph.parse(path.read_bytes())
+    monkeypatch.setattr(metrics, "enabled", True)
+    metrics.reset()
+    assert max_pressure(graph, 30) == answer
+    assert max_pressure_branch_and_bound(graph, 30) == answer
+    assert metrics.counters("valve_dp").expanded <= most_dp_states
+    assert metrics.counters("valve_branch_and_bound").expanded <= 1_000
+    metrics.reset()